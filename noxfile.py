@@ -6,3 +6,18 @@ nox.options.sessions = ["tests"]
 def tests(session):
     session.install(".[dev]")
     session.run("pytest", *session.posargs)
+
+
+# Opt-in (`nox -s tests_pypy`): the compiler tests are pure-Python
+# parse/codegen/compile work that PyPy's JIT can speed up. The Rust parser
+# builds for PyPy via PyO3.
+@nox.session(python="pypy3.11", venv_backend="uv")
+def tests_pypy(session):
+    session.install(".[dev]")
+    session.run(
+        "pytest",
+        "tests/test_comprehensive_python_syntax.py",
+        "tests/test_control_flow.py",
+        "tests/test_control_flow_v017.py",
+        *session.posargs,
+    )
@@ -1,6 +1,12 @@
 use pyo3::prelude::*;
+use std::cell::RefCell;
 use std::collections::HashMap;
-use tree_sitter::{Node, Parser};
+use tree_sitter::{Node, Parser, Tree};
+
+thread_local! {
+    // One parser per thread, configured once and reused across parse() calls
+    static PARSER: RefCell<Option<Parser>> = const { RefCell::new(None) };
+}
 
 #[pyclass]
 #[derive(Clone)]
@@ -56,18 +62,26 @@ fn version() -> &'static str {
 
 #[pyfunction]
 fn parse(py: Python<'_>, source: String) -> PyResult<ParsedDocument> {
-    let mut parser = Parser::new();
-    parser
-        .set_language(&tree_sitter_pywire::language() as _)
-        .map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-                "Failed to set language: {}",
-                e
-            ))
-        })?;
-
-    let tree = parser.parse(&source, None).ok_or_else(|| {
-        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Failed to parse source")
+    let tree = PARSER.with(|cell| -> PyResult<Tree> {
+        let mut slot = cell.borrow_mut();
+        if slot.is_none() {
+            let mut parser = Parser::new();
+            parser
+                .set_language(&tree_sitter_pywire::language() as _)
+                .map_err(|e| {
+                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+                        "Failed to set language: {}",
+                        e
+                    ))
+                })?;
+            *slot = Some(parser);
+        }
+        let parser = slot.as_mut().unwrap();
+        parser.parse(&source, None).ok_or_else(|| {
+            // Drop any partial state so the next parse starts fresh
+            parser.reset();
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Failed to parse source")
+        })
     })?;
 
     let root = tree.root_node();
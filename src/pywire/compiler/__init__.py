@@ -1,6 +1,23 @@
 """Compiler module."""
 
-from pywire.compiler.codegen.generator import CodeGenerator
-from pywire.compiler.parser import PyWireParser
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pywire.compiler.codegen.generator import CodeGenerator
+    from pywire.compiler.parser import PyWireParser
 
 __all__ = ["PyWireParser", "CodeGenerator"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first use so runtime-only imports (exceptions, paths, hashing)
+    # don't load the parser and code generator
+    if name == "PyWireParser":
+        from pywire.compiler.parser import PyWireParser
+
+        return PyWireParser
+    if name == "CodeGenerator":
+        from pywire.compiler.codegen.generator import CodeGenerator
+
+        return CodeGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,15 +11,22 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+import msgpack
+
 from pywire.compiler.ast_nodes import (
     ComponentDirective,
     LayoutDirective,
     ParsedPyWire,
     PathDirective,
 )
+from pywire.compiler.bytecode import write_code
 from pywire.compiler.codegen.generator import CodeGenerator
+from pywire.compiler.hashing import HASH_ALGO, hash_bytes, hash_file
 from pywire.compiler.parser import PyWireParser
 
+# [param] file or directory names
+_PARAM_SEGMENT_RE = re.compile(r"^\[(.*?)\]$")
+
 
 @dataclass
 class BuildSummary:
@@ -40,8 +47,12 @@ class ArtifactBuilder:
         self._page_count = 0
         self._layout_count = 0
         self._component_count = 0
+        self._optimize = False
+        # resolved path -> content digest, filled as sources are read
+        self._hashes: Dict[str, str] = {}
 
     def build(self, optimize: bool = False) -> BuildSummary:
+        self._optimize = optimize
         if self.out_dir.exists():
             shutil.rmtree(self.out_dir)
 
@@ -53,11 +64,14 @@ class ArtifactBuilder:
 
         manifest = {
             "version": 1,
+            "hash_algo": HASH_ALGO,
             "pages_dir": str(self.pages_dir),
             "entries": self.entries,
         }
         manifest_path = self.out_dir / "manifest.json"
         manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        # Binary copy read by the runtime loader (much cheaper to decode)
+        (self.out_dir / "manifest.msgpack").write_bytes(msgpack.packb(manifest))
 
         if optimize:
             import compileall
@@ -108,7 +122,7 @@ class ArtifactBuilder:
             if entry.is_dir():
                 name = entry.name
                 new_segment = name
-                param_match = re.match(r"^\[(.*?)\]$", name)
+                param_match = _PARAM_SEGMENT_RE.match(name)
                 if param_match:
                     param_name = param_match.group(1)
                     new_segment = f"{{{param_name}}}"
@@ -146,7 +160,10 @@ class ArtifactBuilder:
                     entry["routes"] = self._get_routes(parsed, resolved_path, is_error)
             return
 
-        parsed = self.parser.parse_file(resolved_path)
+        # Read once: the same bytes are parsed and hashed for the manifest
+        source_bytes = resolved_path.read_bytes()
+        self._hashes[key] = hash_bytes(source_bytes, HASH_ALGO)
+        parsed = self.parser.parse_bytes(source_bytes, key)
         if implicit_layout:
             if not parsed.get_directive_by_type(LayoutDirective):
                 parsed.directives.append(
@@ -158,8 +175,8 @@ class ArtifactBuilder:
                     )
                 )
 
+        # generate() already fills in missing locations
         module_ast = self.codegen.generate(parsed)
-        ast.fix_missing_locations(module_ast)
         source = ast.unparse(module_ast)
 
         artifact_rel = self._artifact_path_for(resolved_path)
@@ -167,6 +184,14 @@ class ArtifactBuilder:
         artifact_path.parent.mkdir(parents=True, exist_ok=True)
         artifact_path.write_text(source, encoding="utf-8")
 
+        # Marshaled code for the runtime loader, compiled against the .wire file
+        # so tracebacks point at the original source
+        bytecode_rel = artifact_rel.with_suffix(".pyc")
+        code = compile(
+            module_ast, key, "exec", optimize=2 if self._optimize else -1
+        )
+        write_code(self.out_dir / bytecode_rel, code)
+
         deps = self._collect_deps(parsed, implicit_layout, resolved_path)
         entry_deps = []
         for dep_path, dep_kind in deps:
@@ -178,6 +203,7 @@ class ArtifactBuilder:
 
         entry = {
             "artifact": str(artifact_rel),
+            "bytecode": str(bytecode_rel),
             "hash": self._hash_file(resolved_path),
             "deps": entry_deps,
             "kind": kind,
@@ -343,7 +369,7 @@ class ArtifactBuilder:
             if name == "index":
                 segment = ""
 
-            param_match = re.match(r"^\[(.*?)\]$", name)
+            param_match = _PARAM_SEGMENT_RE.match(name)
             if param_match:
                 param_name = param_match.group(1)
                 segment = f"{{{param_name}}}"
@@ -385,7 +411,13 @@ class ArtifactBuilder:
         return None
 
     def _hash_file(self, path: Path) -> str:
-        return hashlib.sha256(path.read_bytes()).hexdigest()
+        # Shared layouts and components are deps of many pages; hash them once
+        key = str(path)
+        digest = self._hashes.get(key)
+        if digest is None:
+            digest = hash_file(path, HASH_ALGO)
+            self._hashes[key] = digest
+        return digest
 
     def _is_in_pages(self, path: Path) -> bool:
         try:
@@ -0,0 +1,52 @@
+"""Read and write marshaled code objects in .pyc-style files."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from types import CodeType
+from typing import Optional, Union
+
+# Same 16-byte layout as a .pyc header; only the magic number is checked, so
+# files written by another Python version are ignored rather than misread
+BYTECODE_HEADER = importlib.util.MAGIC_NUMBER + b"\x00" * 12
+
+
+def read_code(path: Union[str, Path], tag: bytes = b"") -> Optional[CodeType]:
+    """Load a code object, or None if missing, corrupt or from another Python.
+
+    A non-empty tag must match the one the file was written with.
+    """
+    expected = BYTECODE_HEADER + tag
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(expected)) != expected:
+                return None
+            code = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def write_code(path: Union[str, Path], code: CodeType, tag: bytes = b"") -> bool:
+    """Atomically write a code object; returns False if it could not be written."""
+    directory = os.path.dirname(os.fspath(path)) or "."
+    # Write to a temp file and rename so concurrent readers never see partial data
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(BYTECODE_HEADER + tag)
+            marshal.dump(code, f)
+        os.replace(tmp_path, path)
+    except (OSError, ValueError):
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        return False
+    return True
@@ -25,6 +25,12 @@ from pywire.compiler.codegen.directives.base import DirectiveCodegen
 from pywire.compiler.codegen.directives.path import PathDirectiveCodegen
 from pywire.compiler.codegen.template import TemplateCodegen
 
+# Route param names in !path patterns ({name:type} / :name:type) and in
+# [param] file or directory names
+_BRACE_PARAM_RE = re.compile(r"\{([a-zA-Z_]\w*)(?::[^}]+)?\}")
+_COLON_PARAM_RE = re.compile(r":([a-zA-Z_]\w*)(?::[^/]+)?")
+_PARAM_SEGMENT_RE = re.compile(r"^\[(.*?)\]$")
+
 
 class CodeGenerator:
     """Generates Python module from ParsedPyWire AST."""
@@ -80,7 +86,7 @@ class CodeGenerator:
         return stmts
 
     def generate(self, parsed: ParsedPyWire) -> ast.Module:
-        """Generate complete module AST."""
+        """Generate complete module AST, ready to compile (locations filled in)."""
         self.file_path = parsed.file_path
         self._has_top_level_init = False
         self._collected_mount_hooks: List[str] = []
@@ -380,12 +386,12 @@ class CodeGenerator:
         if not pattern:
             return params
 
-        for name in re.findall(r"\{([a-zA-Z_]\w*)(?::[^}]+)?\}", pattern):
+        for name in _BRACE_PARAM_RE.findall(pattern):
             if not name.isidentifier():
                 continue
             params.add(name)
 
-        for name in re.findall(r":([a-zA-Z_]\w*)(?::[^/]+)?", pattern):
+        for name in _COLON_PARAM_RE.findall(pattern):
             if not name.isidentifier():
                 continue
             params.add(name)
@@ -646,13 +652,12 @@ class CodeGenerator:
 
         # Add implicit params from filename if available
         if hasattr(self, "file_path") and self.file_path:
-            import re
             from pathlib import Path
 
             path_obj = Path(self.file_path)
             # Check current file name and parent directories for [param] syntax
             for part in path_obj.parts:
-                match = re.match(r"^\[(.*?)\]$", part.replace(".pywire", ""))
+                match = _PARAM_SEGMENT_RE.match(part.replace(".pywire", ""))
                 if match:
                     variables.add(match.group(1))
 
@@ -1788,6 +1793,14 @@ class CodeGenerator:
                         )
                     return node
 
+                def visit_AnnAssign(self, node: ast.AnnAssign) -> ast.AST:
+                    self.generic_visit(node)
+                    # 'x: int = 1' -> 'self.x: int = 1' is no longer a simple
+                    # name target; compile() rejects simple=1 on attributes
+                    if not isinstance(node.target, ast.Name):
+                        node.simple = 0
+                    return node
+
             # Apply transformation
             transformer = GlobalToSelf()
             for i, stmt in enumerate(node.body):
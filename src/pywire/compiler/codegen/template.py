@@ -669,6 +669,9 @@ class TemplateCodegen:
         return base_expr
 
     def _wrap_unwrap_wire(self, expr: ast.expr) -> ast.expr:
+        # Literals and f-strings can never evaluate to a wire: skip the call
+        if isinstance(expr, (ast.Constant, ast.JoinedStr)):
+            return expr
         return ast.Call(
             func=ast.Name(id="unwrap_wire", ctx=ast.Load()),
             args=[expr],
@@ -1887,14 +1890,10 @@ class TemplateCodegen:
             body.append(append_stmt)
             return
 
-        if node.tag and (
-            (component_map and node.tag in component_map) or node.tag[0].isupper()
-        ):
-            cls_name = (
-                component_map[node.tag]
-                if component_map and node.tag in component_map
-                else node.tag
-            )
+        # Tags keep their source case, so the map is looked up as-is, once
+        mapped = component_map.get(node.tag) if component_map and node.tag else None
+        if node.tag and (mapped is not None or node.tag[0].isupper()):
+            cls_name = mapped if mapped is not None else node.tag
 
             # Prepare arguments (kwargs)
             # Prepare arguments (kwargs dict keys/values)
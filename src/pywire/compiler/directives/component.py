@@ -8,6 +8,8 @@ from pywire.compiler.directives.base import DirectiveParser
 class ComponentDirectiveParser(DirectiveParser):
     """Parses !component 'path' as Name"""
 
+    PATTERN = re.compile(r"^!component\s+['\"](.+?)['\"]\s+as\s+(\w+)")
+
     def can_parse(self, line: str) -> bool:
         return line.startswith("!component")
 
@@ -16,7 +18,7 @@ class ComponentDirectiveParser(DirectiveParser):
         # or !component "path/to/file" as ComponentName
 
         # Regex to match: !component\s+['"](.+?)['"]\s+as\s+(\w+)
-        match = re.search(r"^!component\s+['\"](.+?)['\"]\s+as\s+(\w+)", line)
+        match = self.PATTERN.search(line)
         if not match:
             # Maybe invalid format
             return None
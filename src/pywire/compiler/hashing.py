@@ -0,0 +1,31 @@
+"""Content hashing for build manifest freshness checks."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Union
+
+# Algorithm new builds record in manifest.json as "hash_algo". Manifests that
+# predate the field were written with sha256.
+HASH_ALGO = "blake2b"
+LEGACY_HASH_ALGO = "sha256"
+
+
+def _blake2b_256() -> Any:
+    return hashlib.blake2b(digest_size=32)
+
+
+def hash_file(path: Union[str, Path], algo: str = HASH_ALGO) -> str:
+    """Return the hex digest of a file, streamed through hashlib.file_digest."""
+    with open(path, "rb") as f:
+        if algo == "blake2b":
+            return hashlib.file_digest(f, _blake2b_256).hexdigest()
+        return hashlib.file_digest(f, algo).hexdigest()
+
+
+def hash_bytes(data: bytes, algo: str = HASH_ALGO) -> str:
+    """Return the hex digest of in-memory content, matching hash_file."""
+    if algo == "blake2b":
+        return hashlib.blake2b(data, digest_size=32).hexdigest()
+    return hashlib.new(algo, data).hexdigest()
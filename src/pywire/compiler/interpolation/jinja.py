@@ -1,6 +1,7 @@
 """Jinja2-based interpolation parser."""
 
 import ast
+import re
 from typing import List, Union
 
 from jinja2 import Environment
@@ -8,6 +9,13 @@ from jinja2 import Environment
 from pywire.compiler.ast_nodes import InterpolationNode
 from pywire.compiler.interpolation.base import InterpolationParser
 
+# Used by compile(), built once rather than per interpolated brace
+_SIMPLE_NAME_RE = re.compile(r"^\w+$")
+_BARE_NAME_RE = re.compile(r"\b([a-zA-Z_]\w*)\b(?!\s*[(\[])")
+_EXPR_KEYWORDS = frozenset(
+    ("if", "else", "and", "or", "not", "in", "is", "True", "False", "None")
+)
+
 
 class JinjaInterpolationParser(InterpolationParser):
     """Jinja2-based interpolation parser."""
@@ -188,8 +196,6 @@ class JinjaInterpolationParser(InterpolationParser):
 
         # For now, use simple replacement for self. references
         # This is a simplification - ideally we'd parse the expression AST
-        import re
-
         result = []
         i = 0
         last_end = 0
@@ -227,29 +233,16 @@ class JinjaInterpolationParser(InterpolationParser):
                         # Prepend self. to simple identifiers
                         # For simple identifiers, add self.
                         # For complex expressions, leave as is (they reference self.* already)
-                        if re.match(r"^\w+$", expr):
+                        if _SIMPLE_NAME_RE.match(expr):
                             result.append(f"{{self.{expr}}}")
                         else:
                             # Complex expression - assume it references self correctly
                             # Replace standalone identifiers with self. references
                             # This is simplistic but works for common cases
-                            modified_expr = re.sub(
-                                r"\b([a-zA-Z_]\w*)\b(?!\s*[(\[])",
+                            modified_expr = _BARE_NAME_RE.sub(
                                 lambda m: (
                                     f"self.{str(m.group(1))}"
-                                    if m.group(1)
-                                    not in (
-                                        "if",
-                                        "else",
-                                        "and",
-                                        "or",
-                                        "not",
-                                        "in",
-                                        "is",
-                                        "True",
-                                        "False",
-                                        "None",
-                                    )
+                                    if m.group(1) not in _EXPR_KEYWORDS
                                     else m.group(1)
                                 ),
                                 expr,
@@ -74,10 +74,16 @@ class PyWireParser:
 
     def parse_file(self, file_path: Path) -> ParsedPyWire:
         """Parse a .pywire file."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        with open(file_path, "rb") as f:
+            source = f.read()
 
-        return self.parse(content, str(file_path))
+        return self.parse_bytes(source, str(file_path))
+
+    def parse_bytes(self, source: bytes, file_path: str = "") -> ParsedPyWire:
+        """Parse raw .pywire file contents (e.g. bytes already read for hashing)."""
+        # Match text-mode reads: UTF-8 with universal newlines
+        content = source.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        return self.parse(content, file_path)
 
     def parse(self, content: str, file_path: str = "") -> ParsedPyWire:
         """Parse PyWire content using tree-sitter-pywire."""
@@ -2,12 +2,51 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Dict, Optional
 
+PROJECT_MARKERS = frozenset({"pyproject.toml", "uv.lock", ".venv", ".git"})
 
-def ensure_pywire_folder() -> Path:
-    """Ensure .pywire exists and has a local .gitignore."""
-    dot_pywire = Path(".pywire")
+
+# start_dir -> project root, for walks that found a marker. Misses aren't kept,
+# so a marker added later is picked up; clear_project_root_cache() drops hits
+_project_roots: Dict[Path, Path] = {}
+
+
+def find_project_root(start_dir: Path) -> Path:
+    """Return the nearest directory at or above start_dir with a project marker.
+
+    Falls back to start_dir when no marker is found (e.g. a single script).
+    """
+    # Every page and app in a project walks the same parents
+    root = _project_roots.get(start_dir)
+    if root is not None:
+        return root
+    current = start_dir
+    while True:
+        # One readdir per level instead of a stat() per marker
+        try:
+            with os.scandir(current) as entries:
+                if any(entry.name in PROJECT_MARKERS for entry in entries):
+                    _project_roots[start_dir] = current
+                    return current
+        except OSError:
+            pass
+        if current.parent == current:
+            break
+        current = current.parent
+    return start_dir
+
+
+def clear_project_root_cache() -> None:
+    """Forget discovered project roots (call when markers may have changed)."""
+    _project_roots.clear()
+
+
+def ensure_pywire_folder(base: Optional[Path] = None) -> Path:
+    """Ensure .pywire exists (in base, or the cwd) and has a local .gitignore."""
+    dot_pywire = base / ".pywire" if base is not None else Path(".pywire")
     if not dot_pywire.exists():
         dot_pywire.mkdir()
 
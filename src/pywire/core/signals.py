@@ -16,7 +16,13 @@ class ReactivityError(Exception):
 
 _TRACKING_STACK: list = []  # Module-level, sync-only
 _BATCH_DEPTH: int = 0
-_PENDING_EFFECTS: list["Effect"] = []
+# Insertion-ordered set: O(1) dedupe, effects flush in the order they were queued
+_PENDING_EFFECTS: dict["Effect", None] = {}
+
+
+def _fn_name(node: Any) -> str:
+    fn = getattr(node, "fn", node)
+    return getattr(fn, "__name__", str(fn))
 
 
 @runtime_checkable
@@ -29,6 +35,18 @@ class Subscriber(Protocol):
 class Derived:
     """Lazy, memoized computed value. Auto-tracks wire dependencies."""
 
+    # One per derived field on every page instance; __weakref__ keeps the
+    # WeakSet subscriber registries working
+    __slots__ = (
+        "fn",
+        "dependencies",
+        "_subscribers",
+        "_cache",
+        "_dirty",
+        "_computing",
+        "__weakref__",
+    )
+
     def __init__(self, fn: Callable[[], Any]):
         self.fn = fn
         self.dependencies: Set[Any] = set()
@@ -40,8 +58,12 @@ class Derived:
     @property
     def value(self) -> Any:
         if self._computing:
+            # _computing marks the derived as on the DFS path (gray); the tracking
+            # stack above it is the cycle, so report it instead of just this node
+            cycle = _TRACKING_STACK[_TRACKING_STACK.index(self) :] + [self]
+            path = " -> ".join(_fn_name(node) for node in cycle)
             raise CircularDependencyError(
-                f"Circular dependency detected in derived (fn={getattr(self.fn, '__name__', str(self.fn))})"
+                f"Circular dependency detected in derived: {path}"
             )
 
         if self._dirty:
@@ -115,6 +137,8 @@ class Derived:
 class Effect:
     """Side-effect that auto-runs when dependencies change."""
 
+    __slots__ = ("fn", "dependencies", "_disposed", "__weakref__")
+
     def __init__(self, fn: Callable[[], None]):
         self.fn = fn
         self.dependencies: Set[Any] = set()
@@ -126,8 +150,7 @@ class Effect:
             return
 
         if _BATCH_DEPTH > 0:
-            if self not in _PENDING_EFFECTS:
-                _PENDING_EFFECTS.append(self)
+            _PENDING_EFFECTS[self] = None
             return
 
         # Cleanup old deps
@@ -167,8 +190,9 @@ def end_batch() -> None:
     global _BATCH_DEPTH
     _BATCH_DEPTH -= 1
     if _BATCH_DEPTH == 0:
-        # Flush pending effects
-        # We need to be careful with new effects being added DURING flush
+        # Drain one entry at a time: an effect's write flushes the shared queue
+        # in a nested batch, consuming effects this loop has not reached yet
         while _PENDING_EFFECTS:
-            eff = _PENDING_EFFECTS.pop(0)
+            eff = next(iter(_PENDING_EFFECTS))
+            del _PENDING_EFFECTS[eff]
             eff.execute()
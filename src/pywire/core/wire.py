@@ -267,8 +267,11 @@ class WireList(WireBase, list):
 
     def extend(self, items):
         self._check_frozen()
+        size = super().__len__()
         super().extend(items)
-        self._notify_write()
+        # Extending by nothing changes nothing, so subscribers are left alone
+        if super().__len__() != size:
+            self._notify_write()
 
     def insert(self, index, item):
         self._check_frozen()
@@ -288,6 +291,8 @@ class WireList(WireBase, list):
 
     def clear(self):
         self._check_frozen()
+        if not super().__len__():
+            return
         super().clear()
         self._notify_write()
 
@@ -389,12 +394,16 @@ class WireDict(WireBase, dict):
 
     def clear(self):
         self._check_frozen()
+        if not super().__len__():
+            return
         super().clear()
         self._notify_write()
 
     def pop(self, key, default=None):
         self._check_frozen()
-        res = super().pop(key, default)
+        if not super().__contains__(key):
+            return default
+        res = super().pop(key)
         self._notify_write()
         return res
 
@@ -475,23 +484,32 @@ class WireSet(WireBase, set):
 
     def clear(self):
         self._check_frozen()
+        if not super().__len__():
+            return
         super().clear()
         self._notify_write()
 
     def update(self, *args):
         self._check_frozen()
+        size = super().__len__()
         super().update(*args)
-        self._notify_write()
+        # These only add or only remove, so an unchanged size means no change
+        if super().__len__() != size:
+            self._notify_write()
 
     def intersection_update(self, *args):
         self._check_frozen()
+        size = super().__len__()
         super().intersection_update(*args)
-        self._notify_write()
+        if super().__len__() != size:
+            self._notify_write()
 
     def difference_update(self, *args):
         self._check_frozen()
+        size = super().__len__()
         super().difference_update(*args)
-        self._notify_write()
+        if super().__len__() != size:
+            self._notify_write()
 
     def symmetric_difference_update(self, *args):
         self._check_frozen()
@@ -3,8 +3,8 @@
 import logging
 import os
 import re
+import sys
 import traceback
-import inspect
 from pathlib import Path
 from typing import Any, Dict, Optional, Set, cast
 
@@ -15,6 +15,7 @@ from starlette.routing import Mount, Route, WebSocketRoute
 from starlette.staticfiles import StaticFiles
 
 from pywire import __version__
+from pywire.compiler.paths import find_project_root
 from pywire.runtime.error_page import ErrorPage
 from pywire.runtime.http_transport import HTTPTransportHandler
 from pywire.runtime.router import Router
@@ -23,6 +24,10 @@ from pywire.runtime.websocket import WebSocketHandler
 
 logger = logging.getLogger(__name__)
 
+# [param] or [param:type] file/directory names
+_PARAM_SEGMENT_RE = re.compile(r"^\[(.*?)(?::(.*?))?\]$")
+_PATH_DIRECTIVE_RE = re.compile(r'!path\s+[\'"]([^\'"]+)[\'"]')
+
 
 class PyWire:
     """Main ASGI application and configuration."""
@@ -30,10 +35,14 @@ class PyWire:
     def _get_caller_dir(self) -> Path:
         """Find the directory of the code that instantiated PyWire."""
         try:
-            # Find first frame outside of pywire internals
-            stack = inspect.stack()
-            for frame_info in stack:
-                filename = frame_info.filename
+            # Find first frame outside of pywire internals. Walk raw frames:
+            # inspect.stack() would load source context for every frame.
+            frame = sys._getframe(1)
+            while frame is not None:
+                filename = frame.f_code.co_filename
+                module_name = frame.f_globals.get("__name__", "")
+                frame = frame.f_back
+
                 if not filename or filename == "<string>":
                     continue
 
@@ -50,15 +59,12 @@ class PyWire:
                 if "pywire/tests" in filename and is_test_file:
                     continue
 
-                module = inspect.getmodule(frame_info.frame)
-                if module:
-                    name = getattr(module, "__name__", "")
-                    if name and (
-                        name.startswith("pywire.runtime")
-                        or name.startswith("pywire.compiler")
-                        or name == "pywire"
-                    ):
-                        continue
+                if module_name and (
+                    module_name.startswith("pywire.runtime")
+                    or module_name.startswith("pywire.compiler")
+                    or module_name == "pywire"
+                ):
+                    continue
 
                 # Skip common test runners
                 if (
@@ -76,20 +82,7 @@ class PyWire:
 
     def _get_project_root(self, start_dir: Path) -> Path:
         """Find the project root by looking for markers like pyproject.toml or .venv."""
-        current = start_dir
-        while True:
-            if (
-                (current / "pyproject.toml").exists()
-                or (current / "uv.lock").exists()
-                or (current / ".venv").exists()
-                or (current / ".git").exists()
-            ):
-                return current
-            if current.parent == current:
-                break
-            current = current.parent
-        # Fallback to caller_dir if no markers found (e.g. single script)
-        return start_dir
+        return find_project_root(start_dir)
 
     def __init__(
         self,
@@ -536,7 +529,7 @@ class PyWire:
                 new_segment = name
 
                 # Check for [param] or [param:type] syntax
-                param_match = re.match(r"^\[(.*?)(?::(.*?))?\]$", name)
+                param_match = _PARAM_SEGMENT_RE.match(name)
                 if param_match:
                     param_name = param_match.group(1)
                     type_name = param_match.group(2)
@@ -570,7 +563,7 @@ class PyWire:
                     route_segment = ""
                 else:
                     # Check for [param] or [param:type] in filename
-                    param_match = re.match(r"^\[(.*?)(?::(.*?))?\]$", name)
+                    param_match = _PARAM_SEGMENT_RE.match(name)
                     if param_match:
                         param_name = param_match.group(1)
                         type_name = param_match.group(2)
@@ -632,7 +625,7 @@ class PyWire:
                 content = file_path.read_text()
                 # Look for !path "..." or !path '...'
                 # This is a simple regex, might need refinement
-                path_directives = re.findall(r'!path\s+[\'"]([^\'"]+)[\'"]', content)
+                path_directives = _PATH_DIRECTIVE_RE.findall(content)
 
                 routes_to_register = []
                 if path_directives:
@@ -713,7 +706,7 @@ class PyWire:
             if name == "index":
                 segment = ""
 
-            param_match = re.match(r"^\[(.*?)(?::(.*?))?\]$", name)
+            param_match = _PARAM_SEGMENT_RE.match(name)
             if param_match:
                 param_name = param_match.group(1)
                 type_name = param_match.group(2)
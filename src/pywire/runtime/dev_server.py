@@ -3,7 +3,7 @@
 import os
 import sys
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Set, Tuple
 from rich.console import Console
 
 # Force terminal to ensure ANSI codes are generated even when piped to TUI
@@ -23,6 +23,15 @@ def _import_app(app_str: str) -> Any:
     return getattr(module, app_name)
 
 
+def _list_file_names(directory: Path) -> Set[str]:
+    """Return the names of regular files in a directory (empty if unreadable)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
 def _generate_cert() -> Tuple[str, str, bytes]:
     """Generate self-signed certificate for localhost."""
     import datetime
@@ -180,6 +189,8 @@ async def run_dev_server(
 
             install_logging_interceptor()
 
+            from pywire.runtime.importer import clear_wire_cache
+
             if not pages_dir.exists():
                 console.print(
                     f"[bold yellow]Warning[/]: Pages directory '{pages_dir}' does not exist."
@@ -207,6 +218,14 @@ async def run_dev_server(
             if components_dir.exists():
                 files_to_watch.append(components_dir)
 
+            # Resolve broadcast hooks once; the handlers don't change after app init
+            ws_handler = getattr(pywire_app, "ws_handler", None)
+            ws_broadcast = ws_handler.broadcast_reload if ws_handler else None
+            http_handler = getattr(pywire_app, "http_handler", None)
+            http_broadcast = http_handler.broadcast_reload if http_handler else None
+            wt_handler = getattr(pywire_app, "web_transport_handler", None)
+            wt_broadcast = wt_handler.broadcast_reload if wt_handler else None
+
             async for changes in awatch(*files_to_watch, stop_event=shutdown_event):
                 # Check what changed
                 library_changed = False
@@ -226,6 +245,11 @@ async def run_dev_server(
                     # We can't easily auto-restart from within the process unless we wrap it
                     # But the TUI can handle restarts.
 
+                # .wire files may have been added or removed; drop the import
+                # hook's directory listings so the next import rescans
+                if any(file_path.endswith(".wire") for _, file_path in changes):
+                    clear_wire_cache()
+
                 # First, recompile changed pages
                 should_reload = False
                 for change_type, file_path in changes:
@@ -243,17 +267,24 @@ async def run_dev_server(
                         f"[bold green]PyWire[/]: Changes detected in {pages_dir}, reloading clients..."
                     )
 
-                    # Broadcast reload to WebSocket clients
-                    if hasattr(pywire_app, "ws_handler"):
-                        await pywire_app.ws_handler.broadcast_reload()
-
-                    # Broadcast reload to HTTP polling clients
-                    if hasattr(pywire_app, "http_handler"):
-                        pywire_app.http_handler.broadcast_reload()
-
-                    # Broadcast to WebTransport clients
-                    if hasattr(pywire_app, "web_transport_handler"):
-                        await pywire_app.web_transport_handler.broadcast_reload()
+                    # HTTP polling clients just get a queued message (sync)
+                    if http_broadcast is not None:
+                        http_broadcast()
+
+                    # Fan out to WebSocket and WebTransport clients concurrently so
+                    # one slow or dead transport doesn't hold up the other
+                    broadcasts = []
+                    if ws_broadcast is not None:
+                        broadcasts.append(ws_broadcast())
+                    if wt_broadcast is not None:
+                        broadcasts.append(wt_broadcast())
+
+                    results = await asyncio.gather(*broadcasts, return_exceptions=True)
+                    for result in results:
+                        if isinstance(result, Exception):
+                            console.print(
+                                f"[bold red]Error[/] broadcasting reload: {result}"
+                            )
 
         except Exception as e:
             if not shutdown_event.is_set():
@@ -274,15 +305,23 @@ async def run_dev_server(
     if not cert_path or not key_path:
         # Check for existing trusted certificates (e.g. from mkcert) in .pywire or root
         potential_certs = [
-            (dot_pywire / "localhost.pem", dot_pywire / "localhost-key.pem"),
-            (Path("localhost+2.pem"), Path("localhost+2-key.pem")),
-            (Path("localhost.pem"), Path("localhost-key.pem")),
-            (Path("cert.pem"), Path("key.pem")),
+            (dot_pywire, "localhost.pem", "localhost-key.pem"),
+            (Path("."), "localhost+2.pem", "localhost+2-key.pem"),
+            (Path("."), "localhost.pem", "localhost-key.pem"),
+            (Path("."), "cert.pem", "key.pem"),
         ]
+        # One directory listing per location instead of a stat per candidate
+        dir_listings = {
+            directory: _list_file_names(directory)
+            for directory, _, _ in potential_certs
+        }
 
         found = False
-        for c_file, k_file in potential_certs:
-            if c_file.exists() and k_file.exists():
+        for directory, c_name, k_name in potential_certs:
+            names = dir_listings[directory]
+            if c_name in names and k_name in names:
+                c_file = directory / c_name
+                k_file = directory / k_name
                 console.print(
                     f"[bold cyan]PyWire[/]: Found local certificates ([bold]{c_file.name}[/]), using them."
                 )
@@ -308,7 +347,9 @@ async def run_dev_server(
                     pem_file = dot_pywire / "localhost.pem"
                     key_file = dot_pywire / "localhost-key.pem"
 
-                    subprocess.run(
+                    # Run in a worker thread so key generation doesn't block the loop
+                    await asyncio.to_thread(
+                        subprocess.run,
                         [
                             "mkcert",
                             "-key-file",
@@ -1,10 +1,33 @@
-from typing import Any
+from typing import Any, Optional, Tuple
 
+from markupsafe import escape
 from starlette.requests import Request
 from starlette.responses import HTMLResponse
 
 from pywire.runtime.page import BasePage
 
+# Static slices of the rendered error/404.html, alternating with placeholder
+# names: (static, name, static, name, ..., static). Built once on first use.
+_SEGMENTS: Optional[Tuple[str, ...]] = None
+_MARKER = "\x00"
+
+
+def _get_segments() -> Tuple[str, ...]:
+    """Render the error template once with markers and split it into slices."""
+    global _SEGMENTS
+    if _SEGMENTS is None:
+        from pywire.runtime.error_renderer import render_template
+
+        html = render_template(
+            "error/404.html",
+            {
+                name: f"{_MARKER}{name}{_MARKER}"
+                for name in ("title", "message", "script_url")
+            },
+        )
+        _SEGMENTS = tuple(html.split(_MARKER))
+    return _SEGMENTS
+
 
 class ErrorPage(BasePage):
     """Page used to display compilation errors."""
@@ -18,8 +41,6 @@ class ErrorPage(BasePage):
 
     async def render(self, init: bool = True) -> HTMLResponse:
         """Render the error page."""
-        from pywire.runtime.error_renderer import render_template
-
         # Determine script URL (handled in app or passed here?)
         # For now, default to dev script as ErrorPage is mostly used in dev/mixed?
         # Actually app._get_client_script_url handles this logic, but we don't always have app ref here.
@@ -46,16 +67,17 @@ class ErrorPage(BasePage):
             # Fallback
             script_url = "/_pywire/static/pywire.dev.min.js"
 
-        html_content = render_template(
-            "error/404.html",
-            {
-                "title": self.error_title,
-                "message": self.error_detail or "",
-                "script_url": script_url,
-            },
-        )
+        # The template is static apart from its placeholders, so splice the
+        # escaped values between the pre-rendered slices instead of running Jinja
+        values = {
+            "title": str(escape(self.error_title)),
+            "message": str(escape(self.error_detail or "")),
+            "script_url": str(escape(script_url)),
+        }
+        parts = list(_get_segments())
+        parts[1::2] = [values[name] for name in parts[1::2]]
 
-        return HTMLResponse(html_content)
+        return HTMLResponse("".join(parts))
 
     async def handle_event(
         self, event_name: str, event_data: dict[str, Any]
@@ -1,13 +1,42 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from jinja2 import Environment, PackageLoader, select_autoescape
-
-# Initialize templating environment for internal error pages
-_env = Environment(
-    loader=PackageLoader("pywire", "templates"),
-    autoescape=select_autoescape(["html", "xml"]),
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
 )
 
+# Templating environment for internal error pages, created on first render
+_env: Optional[Environment] = None
+
+
+def _get_bytecode_cache() -> Optional[BytecodeCache]:
+    """Return an on-disk bytecode cache in .pywire/jinja_cache/, if writable."""
+    from pywire.compiler.paths import get_pywire_path
+
+    try:
+        cache_dir = get_pywire_path("jinja_cache")
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        # Read-only deployments just compile templates in memory
+        return None
+    return FileSystemBytecodeCache(directory=str(cache_dir))
+
+
+def _get_env() -> Environment:
+    global _env
+    if _env is None:
+        _env = Environment(
+            loader=PackageLoader("pywire", "templates"),
+            autoescape=select_autoescape(["html", "xml"]),
+            # Templates ship with the package and never change at runtime
+            auto_reload=False,
+            bytecode_cache=_get_bytecode_cache(),
+        )
+    return _env
+
 
 def render_template(template_name: str, context: Dict[str, Any]) -> str:
     """Render a Jinja2 template with the given context.
@@ -19,5 +48,5 @@ def render_template(template_name: str, context: Dict[str, Any]) -> str:
     Returns:
         Rendered HTML string
     """
-    template = _env.get_template(template_name)
+    template = _get_env().get_template(template_name)
     return template.render(**context)
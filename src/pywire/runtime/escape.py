@@ -2,6 +2,9 @@
 
 from typing import Any
 
+# Types whose str() can never contain an HTML special character
+_SAFE_TYPES = (int, float, bool)
+
 
 def escape_html(value: Any) -> str:
     """Escape HTML special characters to prevent XSS.
@@ -14,6 +17,8 @@ def escape_html(value: Any) -> str:
     Returns:
         HTML-escaped string safe for embedding in HTML content
     """
+    if type(value) in _SAFE_TYPES:
+        return str(value)
     s = str(value)
     return (
         s.replace("&", "&amp;")
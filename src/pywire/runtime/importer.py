@@ -1,14 +1,57 @@
 import importlib.abc
 import importlib.machinery
+import os
 import sys
 import types
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple
+
+
+# Directory -> (mtime, names of the .wire files it contains). Listing once per
+# directory change means imports of ordinary modules don't stat a candidate
+# file in every sys.path entry; the mtime check picks up added/removed files
+_wire_dir_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+
+def _wire_files_in(directory: str) -> FrozenSet[str]:
+    try:
+        mtime = os.stat(directory or ".").st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached = _wire_dir_cache.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        names = frozenset(
+            name for name in os.listdir(directory or ".") if name.endswith(".wire")
+        )
+    except OSError:
+        names = frozenset()
+    _wire_dir_cache[directory] = (mtime, names)
+    return names
+
+
+def clear_wire_cache() -> None:
+    """Forget cached directory listings."""
+    _wire_dir_cache.clear()
+
+
+def _page_class_name(basename: str) -> str:
+    """Derive the exported class name from a .wire file's basename."""
+    # Convention: The class name is PascalCase of the filename
+    # If it's a valid identifier, use it, otherwise use 'Component'
+    if basename.isidentifier():
+        return basename
+    # Basic transformation for common cases like 'my-button' -> 'MyButton'
+    parts = basename.replace("-", "_").split("_")
+    return "".join(p.capitalize() for p in parts)
 
 
 class PyWireLoader(importlib.abc.Loader):
-    def __init__(self, path: str):
+    def __init__(self, path: str, class_name: Optional[str] = None):
         self.path = path
+        # Resolved once at discovery so (re)executing the module doesn't redo it
+        self.class_name = class_name or _page_class_name(Path(path).stem)
 
     def create_module(self, spec: importlib.machinery.ModuleSpec):
         return None  # Use default module creation
@@ -21,15 +64,7 @@ class PyWireLoader(importlib.abc.Loader):
         page_class = loader.load(Path(self.path))
 
         # Inject the page class into the module
-        # Convention: The class name is PascalCase of the filename
-        class_name = Path(self.path).stem
-        # If it's a valid identifier, use it, otherwise use 'Component'
-        if not class_name.isidentifier():
-            # Basic transformation for common cases like 'my-button' -> 'MyButton'
-            parts = class_name.replace("-", "_").split("_")
-            class_name = "".join(p.capitalize() for p in parts)
-
-        setattr(module, class_name, page_class)
+        setattr(module, self.class_name, page_class)
         # Also store it as __page_class__ for loader consistency
         module.__page_class__ = page_class
         module.__file__ = self.path
@@ -52,13 +87,20 @@ class PyWireFinder(importlib.abc.MetaPathFinder):
         basename = parts[-1]
 
         search_paths = path or sys.path
+        filename = basename + ".wire"
 
         for p in search_paths:
+            directory = os.fspath(p)
+            if filename not in _wire_files_in(directory):
+                continue
+
             # Try as a .wire file
-            wire_path = Path(p) / f"{basename}.wire"
-            if wire_path.is_file():
+            wire_path = os.path.join(directory, filename)
+            if os.path.isfile(wire_path):
                 return importlib.machinery.ModuleSpec(
-                    fullname, PyWireLoader(str(wire_path)), origin=str(wire_path)
+                    fullname,
+                    PyWireLoader(wire_path, class_name=_page_class_name(basename)),
+                    origin=wire_path,
                 )
 
             # If path represents a directory and we are looking for a sub-item,
@@ -67,10 +109,18 @@ class PyWireFinder(importlib.abc.MetaPathFinder):
 
         return None
 
+    def invalidate_caches(self) -> None:
+        """Called by importlib.invalidate_caches()."""
+        clear_wire_cache()
+
+
+_installed: bool = False
+
 
 def install_import_hook():
-    """Register the PyWire import hook."""
-    for finder in sys.meta_path:
-        if isinstance(finder, PyWireFinder):
-            return
+    """Register the PyWire import hook (idempotent)."""
+    global _installed
+    if _installed:
+        return
     sys.meta_path.insert(0, PyWireFinder())
+    _installed = True
@@ -1,29 +1,117 @@
 """Page loader - compiles and executes .pywire files."""
 
-import ast
 import os
 import hashlib
+import importlib.abc
 import importlib.util
 import json
-import sys
+import threading
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Dict, Optional, Set, Type, cast
+from types import CodeType, ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Type, Union, cast
 
-from pywire.compiler.codegen.generator import CodeGenerator
-from pywire.compiler.parser import PyWireParser
+import msgpack
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from pywire.compiler.bytecode import read_code, write_code
+from pywire.compiler.hashing import LEGACY_HASH_ALGO, hash_file
 from pywire.runtime.page import BasePage
 
+if TYPE_CHECKING:
+    from pywire.compiler.codegen.generator import CodeGenerator
+    from pywire.compiler.parser import PyWireParser
+
+# Compiled code objects kept in memory per loader (LRU, keyed by source hash)
+_CODE_MEMO_SIZE = 512
+
+# Set to a non-empty value to skip the on-disk code cache (e.g. in test suites)
+_NO_CODE_CACHE_ENV = "PYWIRE_NO_CODE_CACHE"
+
+_compiler_fingerprint: Optional[bytes] = None
+
+
+def _get_compiler_fingerprint() -> bytes:
+    """Identify the compiler build so cached code is dropped when it changes."""
+    global _compiler_fingerprint
+    if _compiler_fingerprint is None:
+        import pywire
+        import pywire.compiler as compiler_pkg
+        from pywire import _pywire_parser
+
+        h = hashlib.sha256(importlib.util.MAGIC_NUMBER)
+        h.update(str(getattr(pywire, "__version__", "")).encode("utf-8"))
+        sources = sorted(Path(compiler_pkg.__file__).parent.rglob("*.py"))
+        if getattr(_pywire_parser, "__file__", None):
+            sources.append(Path(cast(str, _pywire_parser.__file__)))
+        for source in sources:
+            st = source.stat()
+            h.update(f"{source}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8"))
+        _compiler_fingerprint = h.digest()
+    return _compiler_fingerprint
+
 
 class PageLoader:
     """Loads and compiles .pywire files into page classes."""
 
+    _hash_pool: Optional[ThreadPoolExecutor] = None
+
     def __init__(self) -> None:
-        self.parser = PyWireParser()
-        self.codegen = CodeGenerator()
+        # Created on first compile; precompiled artifacts never need them
+        self._parser: Optional["PyWireParser"] = None
+        self._codegen: Optional["CodeGenerator"] = None
         self._cache: Dict[str, Type[BasePage]] = {}  # path -> compiled class
-        self._reverse_deps: Dict[str, set[str]] = {}  # dependency -> set of dependents
-        self._manifest_cache: Dict[str, tuple[float, dict]] = {}
+        # Globals injected into every page module
+        self._template_globals: Dict[str, Any] = {
+            "load_layout": self.load_layout,
+            "load_component": self.load_component,
+            "__builtins__": __builtins__,
+        }
+        # Guards _inflight: path -> (loading thread id, set when its load finishes)
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[str, Tuple[int, threading.Event]] = {}
+        # dependency -> dependents, and dependent -> dependencies (for cleanup)
+        self._reverse_deps: Dict[str, Set[str]] = defaultdict(set)
+        self._forward_deps: Dict[str, Set[str]] = defaultdict(set)
+        # manifest path -> (mtime, size, content digest, parsed manifest)
+        self._manifest_cache: Dict[str, Tuple[float, int, bytes, dict]] = {}
+        # source directory -> manifest found by walking up from it. Misses are
+        # not cached, so a build made after startup is picked up.
+        self._manifest_dir_cache: Dict[str, Path] = {}
+        # project root -> its .pywire/cache directory (None if not writable)
+        self._code_cache_dirs: Dict[Path, Optional[Path]] = {}
+        self._code_memo: OrderedDict[str, CodeType] = OrderedDict()
+        # path -> code the cached class was built from, and classes invalidated
+        # since (reused by load() when recompiling yields identical code)
+        self._page_code: Dict[str, CodeType] = {}
+        self._stale: Dict[str, Type[BasePage]] = {}
+        # absolute path -> realpath
+        self._resolve_cache: Dict[str, str] = {}
+        # (path, algorithm) -> (mtime_ns, size, digest)
+        self._hash_cache: Dict[Tuple[str, str], Tuple[int, int, str]] = {}
+        # page path -> class name found by scanning artifacts without __page_class__
+        self._page_class_names: Dict[str, str] = {}
+
+    @property
+    def parser(self) -> "PyWireParser":
+        if self._parser is None:
+            from pywire.compiler.parser import PyWireParser
+
+            self._parser = PyWireParser()
+        return self._parser
+
+    @property
+    def codegen(self) -> "CodeGenerator":
+        if self._codegen is None:
+            from pywire.compiler.codegen.generator import CodeGenerator
+
+            self._codegen = CodeGenerator()
+        return self._codegen
 
     def load(
         self,
@@ -33,25 +121,157 @@ class PageLoader:
     ) -> Type[BasePage]:
         """Load and compile a .pywire file into a page class."""
         # Normalize path
-        pywire_file = pywire_file.resolve()
-        path_key = str(pywire_file)
+        path_key = self._resolve(os.path.abspath(pywire_file))
 
         # Check cache first (incorporate layout into key if needed? No,
         # file content + layout dep determines it)
         # Actually if implicit layout changes, we might need to recompile,
         # but for now assume strict mapping
-        if use_cache and path_key in self._cache:
-            return self._cache[path_key]
+        if not use_cache:
+            return self._load_uncached(path_key, implicit_layout)
+
+        cached = self._cache.get(path_key)
+        if cached is not None:
+            return cached
+
+        # Concurrent first loads of one page wait for a single compile
+        thread_id = threading.get_ident()
+        with self._cache_lock:
+            cached = self._cache.get(path_key)
+            if cached is not None:
+                return cached
+            inflight = self._inflight.get(path_key)
+            if inflight is None:
+                event = threading.Event()
+                self._inflight[path_key] = (thread_id, event)
+
+        if inflight is not None:
+            owner, other_event = inflight
+            if owner != thread_id:
+                other_event.wait()
+                cached = self._cache.get(path_key)
+                if cached is not None:
+                    return cached
+            # Re-entrant load on the owning thread, or the owner failed
+            return self._load_uncached(path_key, implicit_layout)
+
+        try:
+            return self._load_uncached(path_key, implicit_layout)
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(path_key, None)
+            event.set()
+
+    def load_source(
+        self,
+        source: str,
+        pywire_file: Path,
+        implicit_layout: Optional[str] = None,
+    ) -> Type[BasePage]:
+        """Compile in-memory .pywire source as if it lived at pywire_file.
+
+        Nothing is read from or written to disk, and the result is not cached.
+        Dependency edges recorded for a real file at pywire_file are left intact.
+        """
+        path_key = os.path.abspath(pywire_file)
+        code = self._compile(source.encode("utf-8"), path_key, implicit_layout)
+        module = self._exec_page_module(
+            code, "pywire_page", path_key, track_deps=False
+        )
+        page_class = self._find_page_class(module, Path(path_key))
+        page_class.__file_path__ = path_key
+        return page_class
+
+    def _load_uncached(
+        self, path_key: str, implicit_layout: Optional[str]
+    ) -> Type[BasePage]:
+        pywire_file = Path(path_key)
 
         # Try precompiled artifact
         precompiled = self._load_precompiled(pywire_file)
         if precompiled:
+            self._stale.pop(path_key, None)
+            self._page_code.pop(path_key, None)
             self._cache[path_key] = precompiled
             precompiled.__file_path__ = str(pywire_file)
             return precompiled
 
+        source = pywire_file.read_bytes()
+        cache_key = self._code_cache_key(path_key, source, implicit_layout)
+
+        # Reuse code compiled from identical source, e.g. after invalidate_cache on
+        # an unchanged dependent, then fall back to an earlier process's output
+        code = self._code_memo.get(cache_key)
+        if code is not None:
+            self._code_memo.move_to_end(cache_key)
+        else:
+            cache_path = self._code_cache_path(path_key, implicit_layout)
+            code = self._read_code_cache(cache_path, cache_key)
+            if code is None:
+                code = self._compile(source, path_key, implicit_layout)
+                self._write_code_cache(cache_path, cache_key, code)
+            self._code_memo[cache_key] = code
+            if len(self._code_memo) > _CODE_MEMO_SIZE:
+                self._code_memo.popitem(last=False)
+
+        stale_class = self._stale.pop(path_key, None)
+        if stale_class is not None and self._page_code.get(path_key) == code:
+            # The edit didn't change the generated code (e.g. trailing whitespace):
+            # keep the existing class instead of re-executing the module
+            self._cache[path_key] = stale_class
+            return stale_class
+        self._page_code[path_key] = code
+
+        module = self._exec_page_module(code, "pywire_page", path_key)
+
+        page_class = self._find_page_class(module, pywire_file)
+        self._cache[path_key] = page_class
+        page_class.__file_path__ = str(pywire_file)
+        return page_class
+
+    def _exec_page_module(
+        self,
+        code: CodeType,
+        module_name: str,
+        path_key: str,
+        track_deps: bool = True,
+    ) -> ModuleType:
+        """Execute compiled page code in a fresh module.
+
+        With track_deps=False the edges recorded for path_key are restored
+        afterwards, so the layouts/components it loads don't replace them.
+        """
+        module = ModuleType(module_name)
+        namespace = module.__dict__
+        namespace.update(self._template_globals)
+
+        # Inject __file__ for relative path resolution
+        namespace["__file__"] = path_key
+
+        if track_deps:
+            # Executing the module re-records its layout/component dependencies
+            self._forget_deps(path_key)
+            exec(code, namespace)
+            return module
+
+        # load_layout() records edges under the resolved path
+        dep_key = self._resolve(path_key)
+        previous = set(self._forward_deps.get(dep_key, ()))
+        try:
+            exec(code, namespace)
+        finally:
+            self._forget_deps(dep_key)
+            for dep in previous:
+                self._reverse_deps[dep].add(dep_key)
+                self._forward_deps[dep_key].add(dep)
+        return module
+
+    def _compile(
+        self, source: bytes, path_key: str, implicit_layout: Optional[str]
+    ) -> CodeType:
+        """Parse, generate and compile a .pywire source into a module code object."""
         # Parse
-        parsed = self.parser.parse_file(pywire_file)
+        parsed = self.parser.parse_bytes(source, path_key)
 
         # Inject implicit layout if no explicit layout present
         if implicit_layout:
@@ -68,37 +288,85 @@ class PageLoader:
                 )
 
         # Generate code
+        # generate() already fills in missing locations
         module_ast = self.codegen.generate(parsed)
-        ast.fix_missing_locations(module_ast)
-
-        # Compile and load
-        code = compile(module_ast, str(pywire_file), "exec")
-        module = type(sys)("pywire_page")
 
-        # Inject global load_layout
-        module_any = cast(Any, module)
-        module_any.load_layout = self.load_layout
-        module_any.load_component = self.load_component
-
-        # Inject __file__ for relative path resolution
-        module.__file__ = str(pywire_file)
+        return compile(module_ast, path_key, "exec")
+
+    def _code_cache_key(
+        self, path_key: str, source: bytes, implicit_layout: Optional[str]
+    ) -> str:
+        # Generated code embeds the file path and layout, so both are part of the key
+        h = hashlib.sha256(_get_compiler_fingerprint())
+        h.update(path_key.encode("utf-8"))
+        h.update(b"\x00")
+        h.update((implicit_layout or "").encode("utf-8"))
+        h.update(b"\x00")
+        h.update(source)
+        return h.hexdigest()
+
+    def _code_cache_path(
+        self, path_key: str, implicit_layout: Optional[str]
+    ) -> Optional[Path]:
+        """Return the on-disk cache file for a page, or None if caching is off.
+
+        One file per page (and implicit layout), in the .pywire/cache of the
+        page's project: a recompile overwrites the previous entry instead of
+        adding one. The content key is stored in the file and checked on read.
+        """
+        if os.environ.get(_NO_CODE_CACHE_ENV):
+            return None
+        from pywire.compiler.paths import ensure_pywire_folder, find_project_root
 
-        exec(code, module.__dict__)
+        root = find_project_root(Path(path_key).parent)
+        if root in self._code_cache_dirs:
+            cache_dir = self._code_cache_dirs[root]
+        else:
+            try:
+                cache_dir = ensure_pywire_folder(root) / "cache"
+                cache_dir.mkdir(exist_ok=True)
+            except OSError:
+                cache_dir = None
+            self._code_cache_dirs[root] = cache_dir
+        if cache_dir is None:
+            return None
+        h = hashlib.blake2b(path_key.encode("utf-8"), digest_size=16)
+        h.update(b"\x00")
+        h.update((implicit_layout or "").encode("utf-8"))
+        return cache_dir / f"{h.hexdigest()}.pyc"
+
+    def _read_code_cache(
+        self, cache_path: Optional[Path], cache_key: str
+    ) -> Optional[CodeType]:
+        if cache_path is None:
+            return None
+        return read_code(cache_path, tag=bytes.fromhex(cache_key))
 
-        page_class = self._find_page_class(module, pywire_file)
-        self._cache[path_key] = page_class
-        page_class.__file_path__ = str(pywire_file)
-        return page_class
-        raise ValueError(f"No page class found in {pywire_file}")
+    def _write_code_cache(
+        self, cache_path: Optional[Path], cache_key: str, code: CodeType
+    ) -> None:
+        if cache_path is not None:
+            # Best effort: a missing entry only costs a recompile next time
+            write_code(cache_path, code, tag=bytes.fromhex(cache_key))
 
     def _find_page_class(self, module: ModuleType, pywire_file: Path) -> Type[BasePage]:
-        if hasattr(module, "__page_class__"):
-            return cast(Type[BasePage], module.__page_class__)
+        namespace = module.__dict__
+        # Generated code exports its page class; only older artifacts need a scan
+        page_class = namespace.get("__page_class__")
+        if page_class is not None:
+            return cast(Type[BasePage], page_class)
 
         import pywire.runtime.page as page_mod
 
         current_base_page = page_mod.BasePage
-        for name, obj in module.__dict__.items():
+        file_key = str(pywire_file)
+        cached_name = self._page_class_names.get(file_key)
+        if cached_name is not None:
+            obj = namespace.get(cached_name)
+            if isinstance(obj, type) and issubclass(obj, current_base_page):
+                return cast(Type[BasePage], obj)
+
+        for name, obj in namespace.items():
             if name.startswith("__"):
                 continue
             if isinstance(obj, type):
@@ -107,6 +375,7 @@ class PageLoader:
                     and obj is not current_base_page
                     and name != "_LayoutBase"
                 ):
+                    self._page_class_names[file_key] = name
                     return cast(Type[BasePage], obj)
 
         raise ValueError(f"No page class found in {pywire_file}")
@@ -118,6 +387,8 @@ class PageLoader:
 
         manifest = self._load_manifest(manifest_path)
         if not manifest:
+            # Manifest vanished or is unreadable: walk again next time
+            self._manifest_dir_cache.clear()
             return None
 
         entries = manifest.get("entries", {})
@@ -125,23 +396,44 @@ class PageLoader:
         if not entry:
             return None
 
-        if not self._is_entry_fresh(pywire_file, entry):
-            return None
-
-        artifact_path = (manifest_path.parent / entry.get("artifact", "")).resolve()
-        if not artifact_path.exists():
+        hash_algo = manifest.get("hash_algo", LEGACY_HASH_ALGO)
+        if not self._is_entry_fresh(pywire_file, entry, hash_algo):
             return None
 
+        # manifest_path is absolute and artifacts live beneath it, so no resolve()
+        artifact_path = manifest_path.parent / entry.get("artifact", "")
+        # Only needs to be unique per artifact; a short blake2b beats md5 here
         module_name = (
             "pywire_build_"
-            + hashlib.md5(str(artifact_path).encode("utf-8")).hexdigest()
+            + hashlib.blake2b(
+                str(artifact_path).encode("utf-8"), digest_size=8
+            ).hexdigest()
         )
+
+        # Marshaled code skips parsing and compiling the generated source
+        bytecode = entry.get("bytecode")
+        if bytecode:
+            code = read_code(manifest_path.parent / bytecode)
+            if code is not None:
+                module = self._exec_page_module(code, module_name, str(pywire_file))
+                return self._find_page_class(module, pywire_file)
+
         spec = importlib.util.spec_from_file_location(module_name, artifact_path)
         if not spec or not spec.loader:
             return None
 
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        try:
+            # A missing artifact surfaces here instead of costing a stat up front.
+            # Only reading it is guarded: errors raised by the page module's own
+            # top-level code propagate from exec() below.
+            code = cast(importlib.abc.InspectLoader, spec.loader).get_code(module_name)
+        except FileNotFoundError:
+            return None
+        if code is None:
+            return None
+        self._forget_deps(str(pywire_file))
+        exec(code, module.__dict__)
         return self._find_page_class(module, pywire_file)
 
     def _find_manifest(self, pywire_file: Path) -> Optional[Path]:
@@ -151,103 +443,218 @@ class PageLoader:
             if not build_dir.is_absolute():
                 build_dir = Path.cwd() / build_dir
             manifest_path = build_dir / "manifest.json"
+            # Checked on every call: the override may be built at any time
             if manifest_path.exists():
                 return manifest_path
 
-        current_dir = pywire_file.parent.resolve()
+        # pywire_file is already resolved by load()
+        cached = self._manifest_dir_cache.get(str(pywire_file.parent))
+        if cached is not None:
+            return cached
+
+        # Every directory on the way up shares the result of this walk
+        walked = []
+        found: Optional[Path] = None
+        current_dir = pywire_file.parent
         while True:
+            key = str(current_dir)
+            found = self._manifest_dir_cache.get(key)
+            if found is not None:
+                break
+            walked.append(key)
+
             manifest_path = current_dir / ".pywire" / "build" / "manifest.json"
             if manifest_path.exists():
-                return manifest_path
+                found = manifest_path
+                break
 
             if current_dir == current_dir.parent:
                 break
             current_dir = current_dir.parent
 
-        return None
+        if found is not None:
+            for key in walked:
+                self._manifest_dir_cache[key] = found
+        return found
 
     def _load_manifest(self, manifest_path: Path) -> Optional[dict]:
         try:
+            # Prefer the msgpack copy written next to manifest.json by newer builds,
+            # unless manifest.json was rewritten after it (e.g. by a JSON-only tool)
+            source_path = manifest_path
             mtime = manifest_path.stat().st_mtime
-            cache_key = str(manifest_path)
+            is_binary = False
+            binary_path = manifest_path.with_suffix(".msgpack")
+            try:
+                binary_mtime = binary_path.stat().st_mtime
+            except FileNotFoundError:
+                pass
+            else:
+                if binary_mtime >= mtime:
+                    source_path, mtime, is_binary = binary_path, binary_mtime, True
+
+            cache_key = str(source_path)
             cached = self._manifest_cache.get(cache_key)
             if cached and cached[0] == mtime:
-                return cached[1]
-
-            data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            self._manifest_cache[cache_key] = (mtime, data)
+                return cached[3]
+
+            raw = source_path.read_bytes()
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if cached and cached[1] == len(raw) and cached[2] == digest:
+                # Rewritten with identical content (e.g. a no-op rebuild in watch
+                # mode): keep the parsed manifest and just note the new mtime
+                self._manifest_cache[cache_key] = (mtime, len(raw), digest, cached[3])
+                return cached[3]
+
+            if is_binary:
+                data = msgpack.unpackb(raw)
+            else:
+                # Parse straight from bytes; orjson is used when installed
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._manifest_cache[cache_key] = (mtime, len(raw), digest, data)
             return data
         except Exception:
             return None
 
-    def _is_entry_fresh(self, pywire_file: Path, entry: dict) -> bool:
-        if entry.get("hash") != self._hash_file(pywire_file):
+    def _is_entry_fresh(
+        self, pywire_file: Path, entry: dict, hash_algo: str = LEGACY_HASH_ALGO
+    ) -> bool:
+        if entry.get("hash") != self._hash_file(pywire_file, hash_algo):
             return False
 
-        for dep in entry.get("deps", []):
-            dep_path = Path(dep.get("path", ""))
-            if not dep_path.exists():
-                return False
-            if dep.get("hash") != self._hash_file(dep_path):
+        deps = entry.get("deps", [])
+        if len(deps) <= 1:
+            return all(self._is_dep_fresh(dep, hash_algo) for dep in deps)
+
+        # Dependency checks are I/O bound; overlap the stat + hash of each file
+        pool = self._get_hash_pool()
+        futures = [pool.submit(self._is_dep_fresh, dep, hash_algo) for dep in deps]
+        for future in as_completed(futures):
+            if not future.result():
+                for pending in futures:
+                    pending.cancel()
                 return False
 
         return True
 
-    def _hash_file(self, path: Path) -> str:
-        return hashlib.sha256(path.read_bytes()).hexdigest()
+    def _is_dep_fresh(self, dep: dict, hash_algo: str) -> bool:
+        # Manifest paths are already absolute and resolved at build time
+        try:
+            return dep.get("hash") == self._hash_file(dep.get("path", ""), hash_algo)
+        except FileNotFoundError:
+            return False
+
+    @classmethod
+    def _get_hash_pool(cls) -> ThreadPoolExecutor:
+        # Shared by all loaders so freshness checks don't spin up threads per call
+        if cls._hash_pool is None:
+            cls._hash_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="pywire-hash",
+            )
+        return cls._hash_pool
+
+    def _hash_file(
+        self, path: Union[str, Path], hash_algo: str = LEGACY_HASH_ALGO
+    ) -> str:
+        # Unchanged files (same mtime and size) reuse their digest for one stat call
+        st = os.stat(path)
+        key = (os.fspath(path), hash_algo)
+        cached = self._hash_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        digest = hash_file(path, hash_algo)
+        self._hash_cache[key] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
 
     def invalidate_cache(self, path: Optional[Path] = None) -> Set[str]:
         """Clear cached classes. If path given, only clear that entry and its dependents.
         Returns set of invalidated paths (strings).
         """
-        invalidated = set()
+        invalidated: Set[str] = set()
+        from pywire.compiler.paths import clear_project_root_cache
+
+        # Project markers may have been added or removed since the last reload
+        clear_project_root_cache()
         if path:
-            key = str(path.resolve())
-            if key in self._cache:
-                self._cache.pop(key, None)
-                invalidated.add(key)
-
-            # Recursively invalidate dependents
-            dependents = self._reverse_deps.get(key, set())
-            for dependent in list(dependents):
-                # We construct a Path object to recurse properly (though internal key is string)
-                print(
-                    f"PyWire: Invalidating dependent {dependent} because {key} changed."
-                )
-                invalidated.update(self.invalidate_cache(Path(dependent)))
+            root = str(path.resolve())
+
+            # Breadth-first sweep over the reverse dependency graph
+            visited = {root}
+            queue = deque([root])
+            while queue:
+                key = queue.popleft()
+                page_class = self._cache.pop(key, None)
+                if page_class is not None:
+                    invalidated.add(key)
+                    if key == root:
+                        # Kept so load() can reuse it if the edit compiles to the same code
+                        self._stale[key] = page_class
+                if key != root:
+                    # Dependents must re-execute to pick up the changed dependency
+                    self._stale.pop(key, None)
+
+                for dependent in self._reverse_deps.get(key, ()):
+                    if dependent not in visited:
+                        visited.add(dependent)
+                        queue.append(dependent)
+
+            if len(visited) > 1:
+                dependents = ", ".join(sorted(visited - {root}))
+                print(f"PyWire: Invalidating dependents of {root}: {dependents}")
 
             return invalidated
         else:
             self._cache.clear()
+            self._stale.clear()
+            self._page_code.clear()
             self._reverse_deps.clear()
+            self._forward_deps.clear()
+            self._resolve_cache.clear()
+            self._manifest_dir_cache.clear()
             return set()  # All cleared
 
+    def _forget_deps(self, key: str) -> None:
+        """Drop the dependency edges recorded by key's previous execution."""
+        for dep in self._forward_deps.pop(key, ()):
+            dependents = self._reverse_deps.get(dep)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._reverse_deps[dep]
+
+    def _resolve(self, path: str) -> str:
+        """Memoized realpath of an absolute path (avoids repeated symlink lookups)."""
+        resolved = self._resolve_cache.get(path)
+        if resolved is None:
+            resolved = os.path.realpath(path)
+            self._resolve_cache[path] = resolved
+        return resolved
+
     def load_layout(
         self, layout_path: str, base_path: Optional[str] = None
     ) -> Type[BasePage]:
         """Load a layout file and return its class."""
-        path = Path(layout_path)
-        if not path.is_absolute():
+        if os.path.isabs(layout_path):
+            path = layout_path
+        elif base_path:
             # Resolve relative to base file's directory
-            if base_path:
-                base_dir = Path(base_path).parent
-                path = base_dir / layout_path
-            else:
-                # Fallback to CWD
-                path = Path.cwd() / layout_path
+            path = os.path.join(os.path.dirname(base_path), layout_path)
+        else:
+            # Fallback to CWD
+            path = os.path.join(os.getcwd(), layout_path)
 
         # Resolve symlinks for consistent path comparison
-        path = path.resolve()
+        dep_key = self._resolve(os.path.abspath(path))
 
         # Record dependency
         if base_path:
-            dep_key = str(path)
-            dependent_key = str(Path(base_path).resolve())
-            if dep_key not in self._reverse_deps:
-                self._reverse_deps[dep_key] = set()
+            dependent_key = self._resolve(os.path.abspath(base_path))
             self._reverse_deps[dep_key].add(dependent_key)
+            self._forward_deps[dependent_key].add(dep_key)
 
-        return self.load(path)
+        return self.load(Path(dep_key))
 
     def load_component(
         self, component_path: str, base_path: Optional[str] = None
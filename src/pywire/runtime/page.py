@@ -1,7 +1,13 @@
 """Base page class with lifecycle system."""
 
+import asyncio
+import functools
 import inspect
+import json
+import re
+import sys
 from collections import defaultdict
+from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,11 +15,16 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Generic,
     List,
     Optional,
     Set,
     Tuple,
+    TypeGuard,
+    TypeVar,
     Union,
+    cast,
+    overload,
 )
 import logging
 
@@ -23,41 +34,189 @@ from starlette.responses import Response
 if TYPE_CHECKING:
     from pywire.runtime.router import URLHelper
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from pywire.core.wire import reset_render_context, set_render_context
 from pywire.runtime.style_collector import StyleCollector
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-class DotDict(dict):
-    """Dict that allows dot-access to keys. Returns None for missing keys."""
 
-    def __getattr__(self, name: str) -> Any:
+def _is_coro(fn: Any) -> TypeGuard[Callable[..., Awaitable[Any]]]:
+    """inspect.iscoroutinefunction with a fast path for functions and methods.
+
+    Slot and region renderers are often fresh closures or bound methods, so
+    the code flags are checked directly instead of memoizing per callable.
+    """
+    func = getattr(fn, "__func__", fn)
+    if type(func) is not FunctionType:
+        return inspect.iscoroutinefunction(fn)
+    if func.__code__.co_flags & inspect.CO_COROUTINE:
+        return True
+    # inspect.markcoroutinefunction (3.12+) marks sync functions explicitly
+    return hasattr(func, "_is_coroutine_marker")
+
+# snake_case -> camelCase for EventData lookups (Alpine sends camelCase keys)
+_CAMEL_RE = re.compile(r"(?!^)_([a-z])")
+_camel_names: Dict[str, str] = {}
+
+# Inner content of <body>, used to turn full-page renders into update fragments
+_BODY_RE = re.compile(r"<body[^>]*>(.*?)</body>", re.IGNORECASE | re.DOTALL)
+
+
+def _to_camel(name: str) -> str:
+    camel = _camel_names.get(name)
+    if camel is None:
+        camel = _CAMEL_RE.sub(lambda m: m.group(1).upper(), name)
+        # Names come from handler code, so the set is small; cap it anyway
+        if len(_camel_names) < 1024:
+            _camel_names[name] = camel
+    return camel
+
+
+class _LazyAttr(Generic[T]):
+    """Per-instance container created on first access.
+
+    Stores the value in the instance __dict__, so pages that never touch it
+    never allocate it.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "_LazyAttr[T]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T:
+        ...
+
+    def __get__(
+        self, instance: Optional[object], owner: Optional[type] = None
+    ) -> Union[T, "_LazyAttr[T]"]:
+        if instance is None:
+            return self
+        namespace = instance.__dict__
         try:
-            return self[name]
+            return namespace[self.name]
         except KeyError:
-            return None
+            value = namespace[self.name] = self.factory()
+            return value
+
+    def __set__(self, instance: object, value: T) -> None:
+        instance.__dict__[self.name] = value
+
+
+def _splice_document(html: str, head_extra: str, body_extra: str) -> str:
+    """Insert content before </head> and </body> in a single rebuild.
+
+    Without a </head>, head_extra is prepended; without a </body>, body_extra
+    is appended.
+    """
+    head_idx = html.find("</head>") if head_extra else -1
+    body_idx = html.find("</body>") if body_extra else -1
+
+    inserts = []
+    if head_extra:
+        inserts.append((head_idx if head_idx != -1 else 0, head_extra))
+    if body_extra:
+        inserts.append((body_idx if body_idx != -1 else len(html), body_extra))
+    inserts.sort(key=lambda item: item[0])
+
+    parts = []
+    pos = 0
+    for idx, extra in inserts:
+        parts.append(html[pos:idx])
+        parts.append(extra)
+        pos = idx
+    parts.append(html[pos:])
+    return "".join(parts)
+
+
+_MISSING = object()
+
+# static_id -> ["<static_id>:0", "<static_id>:1", ...]. Reusing the same str
+# objects skips formatting and rehashing them for _static_cache lookups on
+# every render. Only the first few instances per expression are kept.
+_instance_ids: Dict[str, List[str]] = {}
+_MAX_CACHED_INSTANCES = 64
+
+
+def _instance_id(static_id: str, count: int) -> str:
+    ids = _instance_ids.get(static_id)
+    if ids is None:
+        ids = _instance_ids[static_id] = []
+    if count < len(ids):
+        return ids[count]
+    instance_id = f"{static_id}:{count}"
+    if count == len(ids) and count < _MAX_CACHED_INSTANCES:
+        ids.append(sys.intern(instance_id))
+    return instance_id
+
+
+@functools.lru_cache(maxsize=256)
+def _build_spa_injection(
+    sibling_paths: Tuple[str, ...], enable_pjax: bool, debug: bool, script_url: str
+) -> str:
+    """Build the SPA metadata and client script tags appended to full pages.
+
+    The inputs are per-route constants plus app flags, so nearly every request
+    for a route reuses the same string.
+    """
+    meta = {
+        "sibling_paths": list(sibling_paths),
+        "enable_pjax": enable_pjax,
+        "debug": debug,
+    }
+    # orjson is used when installed (compact output; both are valid JSON)
+    meta_json = orjson.dumps(meta).decode() if orjson is not None else json.dumps(meta)
+    meta_script = f'<script id="_pywire_spa_meta" type="application/json">{meta_json}</script>'
+    client_script = f'<script src="{script_url}"></script>'
+    return f"{meta_script}{client_script}"
+
+
+def _own_class_cache(cls: type, attr: str) -> Dict[str, Any]:
+    """Return the cache dict stored directly on cls, creating it on first use.
+
+    Looked up in cls.__dict__ so subclasses never share a parent's entries.
+    """
+    cache = cls.__dict__.get(attr)
+    if cache is None:
+        cache = {}
+        setattr(cls, attr, cache)
+    return cache
+
+
+class DotDict(dict):
+    """Dict that allows dot-access to keys. Returns None for missing keys."""
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        self[name] = value
+    # Bound straight to the C implementations: template reads like params.id
+    # don't enter a Python frame
+    __getattr__ = dict.get
+    __setattr__ = dict.__setitem__
 
 
 class EventData(dict):
     """Dict that allows dot-access to keys for Alpine.js compatibility."""
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self[name]
-        except KeyError:
-            # Check for camelCase version of name
-            import re
-
-            camel = re.sub(r"(?!^)_([a-z])", lambda x: x.group(1).upper(), name)
-            if camel in self:
-                return self[camel]
-            return None
+        value = self.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        # Check for camelCase version of name
+        return self.get(_to_camel(name))
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        self[name] = value
+    __setattr__ = dict.__setitem__
 
 
 class BasePage:
@@ -80,6 +239,34 @@ class BasePage:
     # Legacy support / full list
     LIFECYCLE_HOOKS = INIT_HOOKS + RENDER_HOOKS
 
+    # Framework-managed state that most requests never touch, allocated on demand
+    errors: _LazyAttr[Dict[str, str]] = _LazyAttr(dict)
+    loading: _LazyAttr[Dict[str, bool]] = _LazyAttr(dict)
+    # Head slot registry: layout_id -> list of renderers (append semantics, top-down order)
+    head_slots: _LazyAttr[Dict[str, List[Callable]]] = _LazyAttr(
+        lambda: defaultdict(list)
+    )
+    # layout_id -> renderers already in head_slots (O(1) duplicate check)
+    _head_slot_seen: _LazyAttr[Dict[str, Set[Callable]]] = _LazyAttr(dict)
+    # Await block state: await_id -> {"status": "pending"|"success"|"error", "result": Any, "error": Any}
+    _await_states: _LazyAttr[Dict[str, Dict[str, Any]]] = _LazyAttr(dict)
+    _background_tasks: _LazyAttr[Set["asyncio.Task[Any]"]] = _LazyAttr(set)
+    # Fallthrough attributes (remaining component kwargs)
+    attrs: _LazyAttr[Dict[str, Any]] = _LazyAttr(dict)
+
+    # Reflection caches, filled on first use and stored in each page class's own
+    # __dict__ (see _own_class_cache) so a class dropped by hot reload takes
+    # its cache with it.
+    # hook list name -> ((hook name, is coroutine), ...) for defined hooks
+    __hook_plans__: ClassVar[Dict[str, Tuple[Tuple[str, bool], ...]]]
+    # region id -> (renderer function, is coroutine)
+    __region_dispatch__: ClassVar[Dict[str, Tuple[Callable[..., Any], bool]]]
+    # handler name -> (value parameters, event parameters, accepts **kwargs,
+    # is coroutine)
+    __handler_signatures__: ClassVar[
+        Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], bool, bool]]
+    ]
+
     def __init__(
         self,
         request: Request,
@@ -115,22 +302,20 @@ class BasePage:
         self.user: Any = None  # Set by middleware
 
         # Expose params as attributes for easy access in templates
-        for k, v in self.params.items():
-            setattr(self, k, v)
+        if params:
+            self.__dict__.update(self.params)
 
         # Ensure path is exhaustive if __routes__ is present
         routes = getattr(self.__class__, "__routes__", {})
         if routes:
-            for name in routes:
-                if name not in self.path:
-                    self.path[name] = False
+            # Usually the router already filled every name; the view check is in C
+            if not self.path.keys() >= routes.keys():
+                for name in routes:
+                    if name not in self.path:
+                        self.path[name] = False
         elif hasattr(self.__class__, "__route__") and "main" not in self.path:
             self.path["main"] = self.path.get("main", False)
 
-        # Framework-managed state
-        self.errors: Dict[str, str] = {}
-        self.loading: Dict[str, bool] = {}
-
         # Slot registry: layout_id -> slot_name -> renderer (replacement semantics)
         self.slots: Dict[str, Dict[str, Union[Callable, str]]] = defaultdict(dict)
 
@@ -142,16 +327,17 @@ class BasePage:
         self.__is_component__ = kwargs.pop("__is_component__", False)
 
         # Store remaining kwargs as fallthrough attributes
-        self.attrs = {k: v for k, v in kwargs.items() if k != "slots"}
-
-        # Head slot registry: layout_id -> list of renderers (append semantics, top-down order)
-        self.head_slots: Dict[str, List[Callable]] = defaultdict(list)
+        if kwargs:
+            self.attrs = {k: v for k, v in kwargs.items() if k != "slots"}
 
         # Async update hook for intermediate state (injected by runtime)
         self._on_update: Optional[Callable[[], Awaitable[None]]] = None
-        self._wire_subscribers: Dict[Tuple[Any, str], Set[str]] = defaultdict(set)
-        self._region_dependencies: Dict[str, Set[Tuple[Any, str]]] = defaultdict(set)
+        # (wire, field) -> regions reading it, and region -> (wire, field) keys read
+        self._wire_subscribers: Dict[Tuple[Any, str], Set[str]] = {}
+        self._region_dependencies: Dict[str, Set[Tuple[Any, str]]] = {}
         self._dirty_regions: Set[str] = set()
+        # region -> HTML last sent for it; a full render resets the client's copy
+        self._sent_region_html: Dict[str, str] = {}
 
         # Error state for error pages
         self.error_code: Optional[int] = None
@@ -164,23 +350,75 @@ class BasePage:
         self._capturing_deps: bool = False
         self._captured_deps: Set[Tuple[Any, str]] = set()
 
+        # App debug mode doesn't change during a request; read it once
+        self._is_debug = self._compute_is_debug()
+
         self._instance_id = id(self)
         logger.debug(f"[{self._instance_id}] BasePage initialized")
 
-        # Await block state: await_id -> {"status": "pending"|"success"|"error", "result": Any, "error": Any}
-
-        # Await block state: await_id -> {"status": "pending"|"success"|"error", "result": Any, "error": Any}
-        self._await_states: Dict[str, Dict[str, Any]] = {}
-        self._background_tasks: Set["asyncio.Task[Any]"] = set()
-
         # Component ref support (groundwork)
         self._ref: Optional[Any] = None  # wire passed via ref={my_ref}
         self._exposed_methods: Set[str] = getattr(self, "__exposed_methods__", set())
 
-    @property
-    def _is_debug(self) -> bool:
+    def _get_hooks(self, hooks_attr: str) -> Tuple[Tuple[str, bool], ...]:
+        """Return the hooks from INIT_HOOKS/RENDER_HOOKS this page defines."""
+        names = getattr(self, hooks_attr)
+        instance_attrs = self.__dict__
+        if hooks_attr in instance_attrs or any(n in instance_attrs for n in names):
+            # Hooks (or the hook list) assigned on the instance: not cacheable
+            return tuple(
+                (name, _is_coro(getattr(self, name)))
+                for name in names
+                if hasattr(self, name)
+            )
+
+        cls = type(self)
+        plans = _own_class_cache(cls, "__hook_plans__")
+        hooks = plans.get(hooks_attr)
+        if hooks is None:
+            hooks = tuple(
+                (name, _is_coro(getattr(cls, name)))
+                for name in names
+                if hasattr(cls, name)
+            )
+            plans[hooks_attr] = hooks
+        return hooks
+
+    def _get_handler_signature(
+        self, event_name: str, handler: Callable[..., Any]
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool, bool]:
+        """Return the argument binding plan for a handler.
+
+        Value parameters are filled from the event's args, event parameters
+        ("event"/"event_data") receive the EventData.
+        """
+        # Only methods resolved from the class are cached; an instance attribute
+        # (even a bound method of this page) may differ between instances
+        cacheable = (
+            event_name not in self.__dict__
+            and getattr(handler, "__self__", None) is self
+        )
+        if cacheable:
+            signatures = _own_class_cache(type(self), "__handler_signatures__")
+            cached = signatures.get(event_name)
+            if cached is not None:
+                return cached
+
+        parameters = inspect.signature(handler).parameters
+        event_params = tuple(n for n in parameters if n in ("event_data", "event"))
+        info = (
+            tuple(n for n in parameters if n not in event_params),
+            event_params,
+            any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()),
+            _is_coro(handler),
+        )
+        if cacheable:
+            signatures[event_name] = info
+        return info
+
+    def _compute_is_debug(self) -> bool:
         try:
-            return getattr(self.request.app.state, "debug", False)
+            return bool(getattr(self.request.app.state, "debug", False))
         except Exception:
             return False
 
@@ -192,9 +430,19 @@ class BasePage:
 
     def register_head_slot(self, layout_id: str, renderer: Callable[..., Any]) -> None:
         """Register head content to be appended (top-down order)."""
-        # Prevent duplicate registration (can happen with super()._init_slots() chaining)
-        if renderer not in self.head_slots[layout_id]:
-            self.head_slots[layout_id].append(renderer)
+        # Prevent duplicate registration (can happen with super()._init_slots() chaining).
+        # Keyed by the renderer itself, not id(): each self._fill_head access makes a
+        # new bound method that compares and hashes equal to the previous one.
+        seen = self._head_slot_seen.setdefault(layout_id, set())
+        try:
+            if renderer in seen:
+                return
+            seen.add(renderer)
+        except TypeError:
+            # Unhashable callable: fall back to the list scan
+            if renderer in self.head_slots[layout_id]:
+                return
+        self.head_slots[layout_id].append(renderer)
 
     async def render_slot(
         self,
@@ -208,35 +456,49 @@ class BasePage:
 
         # Handle $head slots with append semantics
         if append:
-            parts = []
-            # Render default content first (from the layout itself)
+            # Default content first (from the layout itself), then head content
+            # from ALL layout IDs in the inheritance chain
+            renderers: List[Callable[..., Any]] = []
             if default_renderer:
-                if inspect.iscoroutinefunction(default_renderer):
-                    parts.append(await default_renderer())
+                renderers.append(default_renderer)
+            for layout_renderers in self.head_slots.values():
+                renderers.extend(layout_renderers)
+
+            # Head renderers are independent: run the async ones concurrently
+            # and splice results back in registration order
+            parts: List[Any] = []
+            pending: List[Tuple[int, Callable[..., Any]]] = []
+            for head_renderer in renderers:
+                if _is_coro(head_renderer):
+                    pending.append((len(parts), head_renderer))
+                    parts.append(None)
                 else:
-                    parts.append(default_renderer())
-
-            # Collect head content from ALL layout IDs in the inheritance chain
-            for layout_id_key in self.head_slots:
-                for head_renderer in self.head_slots[layout_id_key]:
-                    if inspect.iscoroutinefunction(head_renderer):
-                        parts.append(await head_renderer())
-                    else:
-                        parts.append(head_renderer())
+                    parts.append(head_renderer())
+            if len(pending) == 1:
+                index, head_renderer = pending[0]
+                parts[index] = await head_renderer()
+            elif pending:
+                results = await asyncio.gather(*(r() for _, r in pending))
+                for (index, _), result in zip(pending, results):
+                    parts[index] = result
             return "".join(parts)
 
-        # Normal replacement semantics
-        if target_id and slot_name in self.slots[target_id]:
-            renderer: Union[Callable[..., Any], str] = self.slots[target_id][slot_name]
+        # Normal replacement semantics. get() rather than indexing: a miss on the
+        # defaultdict would otherwise insert an empty registry for target_id
+        layout_slots = self.slots.get(target_id) if target_id else None
+        renderer: Union[Callable[..., Any], str, None] = (
+            layout_slots.get(slot_name) if layout_slots else None
+        )
+        if renderer is not None:
             if callable(renderer):
-                if inspect.iscoroutinefunction(renderer):
+                if _is_coro(renderer):
                     return str(await renderer())
                 return str(renderer())
             return str(renderer)
 
         # Fallback to default content if provided
         if default_renderer:
-            if inspect.iscoroutinefunction(default_renderer):
+            if _is_coro(default_renderer):
                 return str(await default_renderer())
             return str(default_renderer())
 
@@ -244,24 +506,27 @@ class BasePage:
 
     async def render(self, init: bool = True) -> Response:
         """Main render method - calls lifecycle hooks."""
+        return Response(await self._render_html(init), media_type="text/html")
+
+    async def _render_html(self, init: bool = True) -> str:
+        """Run the render lifecycle and return the page HTML."""
 
         # Cleanup background tasks on new full load
         if init:
-            for task in self._background_tasks:
-                if not task.done():
-                    task.cancel()
-            self._background_tasks.clear()
-            self._await_states.clear()
+            # Dropped rather than cleared so untouched pages never allocate them
+            tasks = self.__dict__.pop("_background_tasks", None)
+            if tasks:
+                await self._cancel_background_tasks(tasks)
+            self.__dict__.pop("_await_states", None)
 
         # Run init hooks only if requested (new page load)
         if init:
-            for hook_name in self.INIT_HOOKS:
-                if hasattr(self, hook_name):
-                    hook = getattr(self, hook_name)
-                    if inspect.iscoroutinefunction(hook):
-                        await hook()
-                    else:
-                        hook()
+            for hook_name, is_coro in self._get_hooks("INIT_HOOKS"):
+                hook = getattr(self, hook_name)
+                if is_coro:
+                    await hook()
+                else:
+                    hook()
 
         # Render template (may be async for layouts with render_slot calls)
         # Render HTML
@@ -274,8 +539,6 @@ class BasePage:
         # Future renders: we use the cache
         # The cache is persistent across renders
 
-        from pywire.core.wire import set_render_context, reset_render_context
-
         token = set_render_context(self, None)
         try:
             html = await self._render_template()
@@ -285,12 +548,8 @@ class BasePage:
         # If this is an update (init=False), strip the surrounding <html>/<body> tags
         # and return only the inner content. This prevents nested HTML on the client.
         if not init:
-            import re
-
             # Try to match body content
-            body_match = re.search(
-                r"<body[^>]*>(.*?)</body>", html, re.IGNORECASE | re.DOTALL
-            )
+            body_match = _BODY_RE.search(html)
             if body_match:
                 html = body_match.group(1)
             else:
@@ -301,11 +560,7 @@ class BasePage:
 
         # Inject styles if this is the root render (not a component or partial update)
         styles = self._style_collector.render()
-        if styles:
-            if "</head>" in html:
-                html = html.replace("</head>", f"{styles}</head>", 1)
-            else:
-                html = f"{styles}{html}"
+        injection = ""
 
         # Inject PyWire client and SPA metadata only on initial page load (init=True)
         # Components and WebSocket updates (init=False) should NOT include these scripts,
@@ -316,26 +571,15 @@ class BasePage:
 
             # Check if SPA features are enabled via attribute or app state
             pjax_enabled = False
-            debug_mode = False
+            debug_mode = self._is_debug
             try:
                 pjax_enabled = bool(
                     getattr(self.request.app.state, "enable_pjax", False)
                 )
-                debug_mode = bool(getattr(self.request.app.state, "debug", False))
             except (AttributeError, KeyError):
                 pass
 
             if not no_spa and not is_component:
-                meta = {
-                    "sibling_paths": getattr(self, "__sibling_paths__", []),
-                    "enable_pjax": pjax_enabled,
-                    "debug": debug_mode,
-                }
-                import json
-
-                meta_json = json.dumps(meta)
-                meta_script = f'<script id="_pywire_spa_meta" type="application/json">{meta_json}</script>'
-
                 # Determine client script URL
                 script_url = "/_pywire/static/pywire.core.min.js"
                 try:
@@ -345,32 +589,51 @@ class BasePage:
                     # Fallback to dev if we can't detect, or keep core default
                     pass
 
-                client_script = f'<script src="{script_url}"></script>'
-                injection = f"{meta_script}{client_script}"
+                injection = _build_spa_injection(
+                    tuple(getattr(self, "__sibling_paths__", ())),
+                    pjax_enabled,
+                    debug_mode,
+                    str(script_url),
+                )
 
-                if "</body>" in html:
-                    html = html.replace("</body>", f"{injection}</body>", 1)
-                else:
-                    html += injection
+        if styles or injection:
+            html = _splice_document(html, styles, injection)
 
         # Run post-render hooks (always run on render)
-        for hook_name in self.RENDER_HOOKS:
-            if hasattr(self, hook_name):
-                hook = getattr(self, hook_name)
-                if inspect.iscoroutinefunction(hook):
-                    await hook()
-                else:
-                    hook()
-
-        return Response(html, media_type="text/html")
+        for hook_name, is_coro in self._get_hooks("RENDER_HOOKS"):
+            hook = getattr(self, hook_name)
+            if is_coro:
+                await hook()
+            else:
+                hook()
+
+        return html
+
+    async def _cancel_background_tasks(self, tasks: Set["asyncio.Task[Any]"]) -> None:
+        """Cancel await-block tasks and wait for them to unwind.
+
+        Finished tasks remove themselves via add_done_callback(discard), so only
+        live tasks are left here.
+        """
+        loop = asyncio.get_running_loop()
+        current = asyncio.current_task()
+        pending = [t for t in tasks if not t.done() and t is not current]
+        for task in pending:
+            task.cancel()
+        # Tasks from another (closed) loop can't be awaited here
+        pending = [t for t in pending if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
     def _clear_wire_tracking(self) -> None:
         self._wire_subscribers.clear()
         self._region_dependencies.clear()
         self._dirty_regions.clear()
+        self._sent_region_html.clear()
 
     def _begin_region_render(self, region_id: str) -> None:
-        deps = self._region_dependencies.get(region_id)
+        # Dependencies are re-recorded by _register_wire_read during the render
+        deps = self._region_dependencies.pop(region_id, None)
         if deps:
             for dep in deps:
                 regions = self._wire_subscribers.get(dep)
@@ -378,17 +641,13 @@ class BasePage:
                     regions.discard(region_id)
                     if not regions:
                         self._wire_subscribers.pop(dep, None)
-                    if regions and region_id in regions:
-                        regions.discard(region_id)
-                        if not regions:
-                            self._wire_subscribers.pop(dep, None)
-        self._region_dependencies[region_id] = set()
 
     def _render_expr(self, static_id: str, compute_func: Callable[[], Any]) -> Any:
         # Generate instance ID based on execution count
-        count = self._expr_counts[static_id]
-        self._expr_counts[static_id] += 1
-        instance_id = f"{static_id}:{count}"
+        counts = self._expr_counts
+        count = counts.get(static_id, 0)
+        counts[static_id] = count + 1
+        instance_id = _instance_id(static_id, count)
 
         # If cached, return it
         if instance_id in self._static_cache:
@@ -417,8 +676,17 @@ class BasePage:
 
     def _register_wire_read(self, wire_obj: Any, field: str, region_id: str) -> None:
         key = (wire_obj, field)
-        self._wire_subscribers[key].add(region_id)
-        self._region_dependencies[region_id].add(key)
+        # Plain dicts: get() avoids defaultdict.__missing__ on this per-expression path
+        regions = self._wire_subscribers.get(key)
+        if regions is None:
+            self._wire_subscribers[key] = {region_id}
+        else:
+            regions.add(region_id)
+        deps = self._region_dependencies.get(region_id)
+        if deps is None:
+            self._region_dependencies[region_id] = {key}
+        else:
+            deps.add(key)
 
         logger.debug(
             f"register_read: page={id(self)} wire={id(wire_obj)} field={field} region={region_id}"
@@ -428,14 +696,13 @@ class BasePage:
             self._captured_deps.add(key)
 
     def _invalidate_wire(self, wire_obj: Any, field: str) -> None:
-        regions = set()
         key = (wire_obj, field)
-        if key in self._wire_subscribers:
-            regions |= self._wire_subscribers[key]
+        regions = self._wire_subscribers.get(key)
 
-        logger.debug(
-            f"invalidate_wire: page={id(self)} wire={id(wire_obj)} key={key} affected_regions={regions}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"invalidate_wire: page={id(self)} wire={id(wire_obj)} key={key} affected_regions={regions or set()}"
+            )
 
         if regions:
             self._dirty_regions.update(regions)
@@ -472,7 +739,7 @@ class BasePage:
         # Call handler
         if event_name.startswith("_handle_bind_"):
             # Binding handlers expect raw event_data
-            if inspect.iscoroutinefunction(handler):
+            if _is_coro(handler):
                 await handler(event_data)
             else:
                 handler(event_data)
@@ -481,40 +748,38 @@ class BasePage:
             args = event_data.get("args", {})
 
             # Normalize args keys (arg-0 -> arg0) because dataset keys preserve hyphens
-            # before digits
-            normalized_args = {}
-            for k, v in args.items():
-                if k.startswith("arg"):
-                    normalized_args[k.replace("-", "")] = v
-                else:
-                    normalized_args[k] = v
+            # before digits; events without positional args skip the rebuild
+            if any("-" in k for k in args):
+                args = {
+                    (k.replace("-", "") if k.startswith("arg") else k): v
+                    for k, v in args.items()
+                }
 
             call_kwargs = {k: v for k, v in event_data.items() if k != "args"}
-            call_kwargs.update(normalized_args)
+            call_kwargs.update(args)
 
             # Check signature to see what arguments the handler accepts
-            sig = inspect.signature(handler)
-            bound_kwargs = {}
-
-            has_var_kw = False
-            for param in sig.parameters.values():
-                if param.kind == inspect.Parameter.VAR_KEYWORD:
-                    has_var_kw = True
-                    break
+            value_params, event_params, has_var_kw, is_coro = (
+                self._get_handler_signature(event_name, handler)
+            )
 
             if has_var_kw:
                 # If accepts **kwargs, pass everything
                 bound_kwargs = call_kwargs
             else:
                 # Only pass arguments that match parameters
-                for name in sig.parameters:
-                    if name == "event_data" or name == "event":
-                        bound_kwargs[name] = EventData(call_kwargs)
-                    elif name in call_kwargs:
-                        bound_kwargs[name] = call_kwargs[name]
+                bound_kwargs = {
+                    name: call_kwargs[name]
+                    for name in value_params
+                    if name in call_kwargs
+                }
+                if event_params:
+                    event = EventData(call_kwargs)
+                    for name in event_params:
+                        bound_kwargs[name] = event
 
             try:
-                if inspect.iscoroutinefunction(handler):
+                if is_coro:
                     await handler(**bound_kwargs)
                 else:
                     handler(**bound_kwargs)
@@ -526,17 +791,16 @@ class BasePage:
         return await self.render_update(init=False)
 
     async def render_update(self, init: bool = False) -> Dict[str, Any]:
+        region_map = getattr(self, "__region_renderers__", None)
         # DEBUG: Trace region state
-        has_regions = hasattr(self, "__region_renderers__")
-        region_map = getattr(self, "__region_renderers__", {})
-        dirty = getattr(self, "_dirty_regions", set())
-        logger.debug(
-            f"render_update: init={init}, has_regions={has_regions}, region_map={region_map}, dirty_regions={dirty}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"render_update: init={init}, has_regions={region_map is not None}, region_map={region_map}, dirty_regions={self._dirty_regions}"
+            )
 
         # Optimization: If we have region renderers (compiled page) and this is a partial update (init=False),
         # check if we really need to update anything.
-        if hasattr(self, "__region_renderers__") and (self._dirty_regions or not init):
+        if region_map is not None and (self._dirty_regions or not init):
             # If no dirty regions (and init=False), return empty update
             if not self._dirty_regions:
                 # print("DEBUG render_update: No dirty regions, returning empty regions list")
@@ -551,58 +815,88 @@ class BasePage:
             if not has_root_dirty:
                 self._expr_counts.clear()
 
-                from pywire.core.wire import set_render_context, reset_render_context
-
                 updates = []
-                region_map = getattr(self, "__region_renderers__", {}) or {}
+                rendered = False
+                dispatch = self._get_region_dispatch(region_map)
 
                 # Safe to sort now as we know no None is present
                 for region_id in sorted(self._dirty_regions):
-                    method_name = region_map.get(region_id)
-                    if not method_name:
-                        continue
-                    renderer = getattr(self, method_name, None)
-                    if not renderer:
+                    entry = dispatch.get(region_id)
+                    if entry is None:
                         continue
+                    renderer, is_coro = entry
 
                     token = set_render_context(self, region_id)
                     try:
-                        if inspect.iscoroutinefunction(renderer):
-                            region_html = await renderer()
-                        else:
-                            region_html = renderer()
+                        region_html = renderer(self)
+                        if is_coro:
+                            region_html = await region_html
                     finally:
                         reset_render_context(token)
+                    rendered = True
 
+                    # Dirty but unchanged (e.g. an in-place mutation the region
+                    # doesn't display): the client already has this HTML
+                    if self._sent_region_html.get(region_id) == region_html:
+                        continue
+                    self._sent_region_html[region_id] = region_html
                     updates.append({"region": region_id, "html": region_html})
 
                 self._dirty_regions.clear()
 
                 # If we successfully generated partial updates, return them
-                if updates:
+                if updates or rendered:
                     # print(f"DEBUG render_update: returning regions update with {len(updates)} regions")
                     return {"type": "regions", "regions": updates}
 
-        response = await self.render(init=init)
-        html = bytes(response.body).decode("utf-8")
+        if getattr(self.render, "__func__", None) is BasePage.render:
+            # Skip building a Response only to decode its body again
+            html = await self._render_html(init)
+        else:
+            # Subclass customizes render(): honour it
+            response = await self.render(init=init)
+            html = bytes(response.body).decode("utf-8")
         logger.debug(f"render_update: returning FULL update (len={len(html)})")
         return {"type": "full", "html": html}
 
+    def _get_region_dispatch(
+        self, region_map: Optional[Dict[str, str]]
+    ) -> Dict[str, Tuple[Callable[..., Any], bool]]:
+        """Map region ids to (renderer called with the page, is coroutine)."""
+        cls = type(self)
+        if region_map is getattr(cls, "__region_renderers__", None):
+            # Compiled pages declare regions on the class: resolve once per class
+            dispatch = cls.__dict__.get("__region_dispatch__")
+            if dispatch is None:
+                dispatch = {}
+                for region_id, method_name in (region_map or {}).items():
+                    func = getattr(cls, method_name, None)
+                    if func:
+                        dispatch[region_id] = (func, _is_coro(func))
+                cls.__region_dispatch__ = dispatch
+            return dispatch
+
+        # Regions attached to the instance: resolve bound renderers every time
+        dispatch = {}
+        for region_id, method_name in (region_map or {}).items():
+            bound = getattr(self, method_name, None)
+            if bound:
+                dispatch[region_id] = (lambda _page, r=bound: r(), _is_coro(bound))
+        return dispatch
+
     async def push_state(self) -> None:
         """Force a UI update with current state (useful for streaming progress)."""
         logger.debug(
             f"[{self._instance_id}] push_state called. Has _on_update: {bool(self._on_update)}"
         )
         if self._on_update:
-            if inspect.iscoroutinefunction(self._on_update):
+            if _is_coro(self._on_update):
                 await self._on_update()
             else:
                 self._on_update()
 
     async def _resolve_await(self, await_id: str, awaitable: Awaitable) -> None:
         """Background task to resolve an await block and trigger update."""
-        import inspect
-
         logger.debug(f"[{self._instance_id}] Starting resolution for {await_id}")
         self._await_states[await_id] = {
             "status": "pending",
@@ -1,10 +1,53 @@
-"""Routing system."""
+"""Routing system.
 
+Router.match runs on every request. It is bound by interpreter overhead, not
+memory: the route table is a few hundred small objects. Parameterless routes
+resolve with one dict lookup; the rest walk a segment trie, so the cost tracks
+path depth rather than route count. Both keep the result of a linear scan: the
+earliest registered matching route wins. Measure changes with tests/bench_router.py.
+"""
+
+import functools
 import re
-from typing import Any, Dict, Optional, Tuple, Type
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 
 from pywire.runtime.page import BasePage
 
+# Params in a route pattern: {name}, {name:type}, :name or :name:type.
+# The braced form comes first so the :type inside {name:type} is not
+# mistaken for a :name param.
+_PARAM_RE = re.compile(r"\{(\w+)(?::\w+)?\}|:(\w+)(?::\w+)?")
+
+
+def _replace_match(match: re.Match) -> str:
+    # Group 1 is from {}, Group 2 is from :
+    name = match.group(1) or match.group(2)
+    return f"{{{name}}}"
+
+
+def _normalize_pattern(pattern: str) -> str:
+    """Rewrite ':id:int' / '{id:int}' params as '{id}'."""
+    return _PARAM_RE.sub(_replace_match, pattern)
+
+
+# Parsed segment tokens by pattern string, so re-registering the same
+# patterns on hot reload skips the parse
+_parsed_patterns: Dict[str, Tuple[Tuple[Optional[str], str], ...]] = {}
+
+
+def _coerce_int(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        # Beyond int()'s digit limit; keep the raw string
+        return value
+
+
+def _is_ascii_int(segment: str) -> bool:
+    # Same set as the [0-9]+ int param regex
+    return segment.isdigit() and segment.isascii()
+
 
 class Route:
     """Represents a single route pattern."""
@@ -15,29 +58,42 @@ class Route:
         self.pattern = pattern
         self.page_class = page_class
         self.name = name
-        self.param_types: Dict[str, str] = {}
-
-        # Compile pattern to regex
-        self.regex = self._compile_pattern(pattern)
-
-    def _compile_pattern(self, pattern: str) -> re.Pattern:
-        """Convert '/projects/:id:int' to regex."""
-        if pattern == "/":
-            return re.compile(r"^/$")
-
-        # Helper to generate regex for a type
-        def get_type_regex(type_name: str) -> str:
-            if type_name == "int":
-                return r"\d+"
-            elif type_name == "str":
-                return r"[^/]+"
-            # Default to string
-            return r"[^/]+"
-
-        parts = pattern.split("/")
-        regex_parts = []
-
-        for part in parts:
+        # Segment tokens: (None, literal) or (type_name, param_name)
+        tokens = _parsed_patterns.get(pattern)
+        if tokens is None:
+            tokens = tuple(self._parse_pattern(pattern))
+            if len(_parsed_patterns) < 1024:
+                _parsed_patterns[pattern] = tokens
+        self.tokens = tokens
+        self.param_types: Dict[str, str] = {
+            name: type_name for type_name, name in tokens if type_name is not None
+        }
+        self.is_static = not self.param_types
+        # Leading literal part of the path, checked before running the regex
+        self.literal_prefix = self._literal_prefix()
+        # Param names and converters in pattern order, as parallel tuples
+        self._param_names: Tuple[str, ...] = tuple(
+            name for type_name, name in self.tokens if type_name is not None
+        )
+        self._param_fns: Tuple[Callable[[str], Any], ...] = tuple(
+            _coerce_int if type_name == "int" else str
+            for type_name, _ in self.tokens
+            if type_name is not None
+        )
+        # Router.match walks the trie, so the regex is only built on demand
+        self._regex: Optional[re.Pattern] = None
+
+    @property
+    def regex(self) -> re.Pattern:
+        if self._regex is None:
+            self._regex = self._compile_pattern()
+        return self._regex
+
+    def _parse_pattern(self, pattern: str) -> List[Tuple[Optional[str], str]]:
+        """Split '/projects/:id:int' into literal and param tokens."""
+        tokens: List[Tuple[Optional[str], str]] = []
+
+        for part in pattern.split("/"):
             if not part:
                 # Empty part (e.g. start of string)
                 continue
@@ -62,41 +118,153 @@ class Route:
                     name, type_name = content, "str"
 
             if name:
-                self.param_types[name] = type_name
-                regex = get_type_regex(type_name)
-                regex_parts.append(f"(?P<{name}>{regex})")
+                tokens.append((type_name, name))
             else:
+                tokens.append((None, part))
+
+        return tokens
+
+    def _literal_prefix(self) -> str:
+        prefix = "/"
+        for type_name, value in self.tokens:
+            if type_name is not None:
+                return prefix
+            prefix += value + "/"
+        # Fully literal: the whole path, without a trailing slash
+        return prefix[:-1] if self.tokens else prefix
+
+    def _compile_pattern(self) -> re.Pattern:
+        """Convert the parsed tokens of '/projects/:id:int' to regex."""
+
+        # Helper to generate regex for a type
+        def get_type_regex(type_name: str) -> str:
+            if type_name == "int":
+                return r"[0-9]+"
+            elif type_name == "str":
+                return r"[^/]+"
+            # Default to string
+            return r"[^/]+"
+
+        regex_parts = []
+        for type_name, value in self.tokens:
+            if type_name is None:
                 # Literal
-                regex_parts.append(re.escape(part))
+                regex_parts.append(re.escape(value))
+            else:
+                regex = get_type_regex(type_name)
+                regex_parts.append(f"(?P<{value}>{regex})")
 
         regex_str = "^/" + "/".join(regex_parts) + "$"
-        return re.compile(regex_str)
+        # Paths arrive percent-decoded from ASGI; params are matched as ASCII
+        return re.compile(regex_str, re.ASCII)
 
     def match(self, path: str) -> Optional[dict[str, Any]]:
         """Try to match path, return params if successful."""
-        match = self.regex.match(path)
-        if match:
-            # We need to convert types!
-            params = match.groupdict()
-
-            # Coerce values
-            coerced = {}
-            for name, val in params.items():
-                type_name = self.param_types.get(name, "str")
-                coerced[name] = self._coerce_value(val, type_name)
-
-            return coerced
-        return None
-
-    def _coerce_value(self, value: str, type_name: str) -> Any:
-        """Coerce string value to specific type."""
-        if type_name == "int":
-            try:
-                return int(value)
-            except ValueError:
-                return value
-        # Add more types as needed (bool, float, etc.)
-        return value
+        if self.is_static:
+            # No params: the prefix is the whole path
+            return {} if path == self.literal_prefix else None
+        if not path.startswith(self.literal_prefix):
+            return None
+        # Every segment is a literal or a whole param, so a segment-by-segment
+        # walk is equivalent to the regex without entering the re engine
+        segments = path[1:].split("/")
+        if len(segments) != len(self.tokens):
+            return None
+        values: List[str] = []
+        for (type_name, value), segment in zip(self.tokens, segments):
+            if type_name is None:
+                if segment != value:
+                    return None
+            elif not segment or (type_name == "int" and not _is_ascii_int(segment)):
+                return None
+            else:
+                values.append(segment)
+        return self._build_params(values)
+
+    def _build_params(self, values: Sequence[str]) -> Dict[str, Any]:
+        """Coerce captured values (in pattern order) into the params dict."""
+        names = self._param_names
+        if not names:
+            return {}
+        fns = self._param_fns
+        if len(names) == 1:
+            return {names[0]: fns[0](values[0])}
+        return {name: fn(value) for name, fn, value in zip(names, fns, values)}
+
+
+class _TrieNode:
+    """One path segment position in the router trie."""
+
+    __slots__ = ("static", "int_child", "str_child", "route", "order", "min_order")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, "_TrieNode"] = {}
+        self.int_child: Optional["_TrieNode"] = None
+        self.str_child: Optional["_TrieNode"] = None
+        self.route: Optional[Route] = None
+        # Registration index of route, and the lowest one in this subtree
+        self.order = sys.maxsize
+        self.min_order = sys.maxsize
+
+    def insert(self, route: Route, order: int) -> None:
+        node = self
+        node.min_order = min(node.min_order, order)
+        for type_name, value in route.tokens:
+            if type_name is None:
+                child = node.static.get(value)
+                if child is None:
+                    child = node.static[value] = _TrieNode()
+            elif type_name == "int":
+                child = node.int_child
+                if child is None:
+                    child = node.int_child = _TrieNode()
+            else:
+                child = node.str_child
+                if child is None:
+                    child = node.str_child = _TrieNode()
+            node = child
+            node.min_order = min(node.min_order, order)
+        # First registration wins for identical patterns
+        if node.route is None:
+            node.route = route
+            node.order = order
+
+    def lookup(
+        self,
+        segments: List[str],
+        index: int,
+        values: List[str],
+        best: Optional[Tuple[int, Route, List[str]]] = None,
+    ) -> Optional[Tuple[int, Route, List[str]]]:
+        """Return (order, route, param values) of the earliest registered match.
+
+        Subtrees whose routes were all registered after best are skipped.
+        """
+        if index == len(segments):
+            if self.route is not None and (best is None or self.order < best[0]):
+                return (self.order, self.route, values[:])
+            return best
+        segment = segments[index]
+        child = self.static.get(segment)
+        if child is not None and (best is None or child.min_order < best[0]):
+            best = child.lookup(segments, index + 1, values, best)
+        if not segment:
+            return best
+        child = self.int_child
+        if (
+            child is not None
+            and (best is None or child.min_order < best[0])
+            and _is_ascii_int(segment)
+        ):
+            values.append(segment)
+            best = child.lookup(segments, index + 1, values, best)
+            values.pop()
+        child = self.str_child
+        if child is not None and (best is None or child.min_order < best[0]):
+            values.append(segment)
+            best = child.lookup(segments, index + 1, values, best)
+            values.pop()
+        return best
 
 
 class URLHelper:
@@ -104,26 +272,22 @@ class URLHelper:
 
     def __init__(self, routes: Dict[str, str]) -> None:
         self.routes = routes
+        self._templates: Dict[str, URLTemplate] = {}
 
     def __getitem__(self, key: str) -> "URLTemplate":
-        if key not in self.routes:
+        try:
+            return self._templates[key]
+        except KeyError:
+            pass
+        pattern = self.routes.get(key)
+        if pattern is None:
             raise KeyError(f"Route variant '{key}' not found")
-        return URLTemplate(self.routes[key])
+        template = self._templates[key] = URLTemplate(pattern)
+        return template
 
     def __str__(self) -> str:
         # Return dict with normalized patterns
-        import re
-
-        def normalize_pattern(pattern: str) -> str:
-            def replace_param(match: re.Match) -> str:
-                return f"{{{match.group(1)}}}"
-
-            cleaned = re.sub(r":(\w+)(:\w+)?", replace_param, pattern)
-            cleaned = re.sub(r"\{(\w+)(:\w+)?\}", replace_param, cleaned)
-            return cleaned
-
-        normalized = {k: normalize_pattern(v) for k, v in self.routes.items()}
-        return str(normalized)
+        return str({k: _normalize_pattern(v) for k, v in self.routes.items()})
 
 
 class URLTemplate:
@@ -131,38 +295,38 @@ class URLTemplate:
 
     def __init__(self, pattern: str) -> None:
         self.pattern = pattern
+        # Literal parts around each param slot, parsed once:
+        # parts[0] + slots[0] + parts[1] + ... + parts[-1]
+        self._parts: List[str] = []
+        self._slots: List[str] = []
+        last = 0
+        for match in _PARAM_RE.finditer(pattern):
+            self._parts.append(pattern[last : match.start()])
+            self._slots.append(match.group(1) or match.group(2))
+            last = match.end()
+        self._parts.append(pattern[last:])
+        # Normalized pattern with {param} instead of :param
+        self._normalized = "".join(
+            part + "{" + slot + "}" for part, slot in zip(self._parts, self._slots)
+        ) + self._parts[-1]
 
     def format(self, **kwargs: Any) -> str:
-        url = self.pattern
-        # Simple replacement for now.
-        # Needs to handle :param syntax conversion to {param} for format,
-        # or custom formatter.
-
-        # Regex to find params in pattern:
-        # 1. {name:type} or {name}
-        # 2. :name:type or :name
-        # Note: We must be careful not to match the :type part of {name:type} as a :name.
-        # We can do this by matching the more specific {name:type} first in an OR,
-        # or by using a single regex for both.
-
-        pattern = r"\{(\w+)(?::\w+)?\}|:(\w+)(?::\w+)?"
-
-        def replace_match(match: re.Match) -> str:
-            # Group 1 is from {}, Group 2 is from :
-            name = match.group(1) or match.group(2)
-            return f"{{{name}}}"
-
-        return re.sub(pattern, replace_match, url).format(**kwargs)
+        slots = self._slots
+        parts = self._parts
+        if not slots:
+            return parts[0]
+        if len(slots) == 1:
+            # Most links have one param
+            return parts[0] + str(kwargs[slots[0]]) + parts[1]
+        out = [parts[0]]
+        append = out.append
+        for i, name in enumerate(slots):
+            append(str(kwargs[name]))
+            append(parts[i + 1])
+        return "".join(out)
 
     def __str__(self) -> str:
-        # Return normalized pattern with {param} instead of :param
-        pattern = r"\{(\w+)(?::\w+)?\}|:(\w+)(?::\w+)?"
-
-        def replace_match(match: re.Match) -> str:
-            name = match.group(1) or match.group(2)
-            return f"{{{name}}}"
-
-        return re.sub(pattern, replace_match, self.pattern)
+        return self._normalized
 
 
 class Router:
@@ -170,41 +334,113 @@ class Router:
 
     def __init__(self) -> None:
         self.routes: list[Route] = []
+        # Parameterless routes by normalized path; the rest live in the
+        # segment trie. Both are rebuilt lazily after removals.
+        self._static: Dict[str, Route] = {}
+        self._trie: Optional[_TrieNode] = None
+        # Routes by the __file_path__ of their page class, for hot reload
+        self._by_file: Dict[str, List[Route]] = {}
+        # Recent dynamic lookups; cleared whenever the route set changes
+        self._lookup_cached = functools.lru_cache(maxsize=1024)(self._lookup)
 
     def add_route(
         self, pattern: str, page_class: Type[BasePage], name: Optional[str] = None
     ) -> None:
         """Add route from compiled page."""
-        self.routes.append(Route(pattern, page_class, name))
+        self._add_routes([Route(pattern, page_class, name)])
+
+    def _add_routes(self, routes: List[Route]) -> None:
+        self.routes.extend(routes)
+        by_file = self._by_file
+        for route in routes:
+            file_path = getattr(route.page_class, "__file_path__", "")
+            by_file.setdefault(file_path, []).append(route)
+        self._lookup_cached.cache_clear()
+        trie = self._trie
+        if trie is not None:
+            start = len(self.routes) - len(routes)
+            for order, route in enumerate(routes, start):
+                self._index_route(route, order, trie)
+
+    def _index_route(self, route: Route, order: int, trie: _TrieNode) -> None:
+        if route.is_static:
+            key = "/" + "/".join(value for _, value in route.tokens)
+            # The trie only holds earlier routes here, so a hit means an earlier
+            # param route matches this whole path and always wins over it
+            rest = key[1:]
+            if trie.lookup(rest.split("/") if rest else [], 0, []) is not None:
+                return
+            # First registration wins for identical patterns
+            self._static.setdefault(key, route)
+        else:
+            trie.insert(route, order)
+
+    def _build_trie(self) -> _TrieNode:
+        self._static = {}
+        trie = _TrieNode()
+        for order, route in enumerate(self.routes):
+            self._index_route(route, order, trie)
+        self._trie = trie
+        return trie
 
     def add_page(self, page_class: Type[BasePage]) -> None:
         # Register all routes for a page class
-        routes = getattr(page_class, "__routes__", {})
-        if routes:
-            for name, pattern in routes.items():
-                self.add_route(pattern, page_class, name)
-        elif hasattr(page_class, "__route__"):
-            route = getattr(page_class, "__route__")
-            if isinstance(route, str):
-                self.add_route(route, page_class)
+        self.add_pages([page_class])
+
+    def add_pages(self, page_classes: Iterable[Type[BasePage]]) -> None:
+        """Register the routes of several page classes in one batch."""
+        staged: List[Route] = []
+        for page_class in page_classes:
+            routes = getattr(page_class, "__routes__", None)
+            if routes:
+                for name, pattern in routes.items():
+                    staged.append(Route(pattern, page_class, name))
+            else:
+                route = getattr(page_class, "__route__", None)
+                if isinstance(route, str):
+                    staged.append(Route(route, page_class, None))
+        self._add_routes(staged)
 
     def match(
         self, path: str
     ) -> Optional[Tuple[Type[BasePage], dict[str, str], Optional[str]]]:
-        """Match URL path to page class. Returns: (PageClass, params, variant_name)."""
-        for route in self.routes:
-            params = route.match(path)
-            if params is not None:
-                return (route.page_class, params, route.name)
-        return None
+        """Match URL path to page class. Returns: (PageClass, params, variant_name).
+
+        When several routes match, the one registered first wins.
+        """
+        if self._trie is None:
+            self._build_trie()
+        hit = self._static.get(path)
+        if hit is not None:
+            return (hit.page_class, {}, hit.name)
+        found = self._lookup_cached(path)
+        if found is None:
+            return None
+        route, params = found
+        # Callers keep the params dict, so never hand out the cached one
+        return (route.page_class, dict(params), route.name)
+
+    def _lookup(self, path: str) -> Optional[Tuple[Route, Dict[str, Any]]]:
+        """Walk the trie for a path that is not a static route."""
+        if not path.startswith("/"):
+            return None
+        trie = self._trie
+        if trie is None:
+            trie = self._build_trie()
+        rest = path[1:]
+        found = trie.lookup(rest.split("/") if rest else [], 0, [])
+        if found is None:
+            return None
+        _, route, values = found
+        return (route, route._build_params(values))
 
     def remove_routes_for_file(self, file_path: str) -> None:
         """Remove all routes associated with a file path."""
-        # Normalize file path for comparison
-        file_path = str(file_path)
-
-        self.routes = [
-            r
-            for r in self.routes
-            if getattr(r.page_class, "__file_path__", "") != file_path
-        ]
+        removed = self._by_file.pop(str(file_path), None)
+        if not removed:
+            # Layouts and components have no routes; nothing to rebuild
+            return
+        removed_ids = {id(r) for r in removed}
+        self.routes = [r for r in self.routes if id(r) not in removed_ids]
+        self._trie = None
+        self._lookup_cached.cache_clear()
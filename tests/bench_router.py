@@ -0,0 +1,62 @@
+"""Router.match micro-benchmark.
+
+127 routes (static, one-param and two-param), matched at the head, middle and
+tail of the registration order plus a miss. Repeated dynamic paths are served
+from the router's lookup cache, so this measures the steady state. Run directly:
+
+    PYTHONPATH=src python tests/bench_router.py
+"""
+
+import statistics
+import time
+from typing import List
+
+from pywire.runtime.page import BasePage
+from pywire.runtime.router import Router
+
+ROUNDS = 1000
+CALLS_PER_ROUND = 100
+
+
+class BenchPage(BasePage):
+    pass
+
+
+def build_router() -> Router:
+    router = Router()
+    router.add_route("/", BenchPage, "home")
+    for i in range(42):
+        router.add_route(f"/section{i}", BenchPage, f"static{i}")
+        router.add_route(f"/section{i}/:id:int", BenchPage, f"detail{i}")
+        router.add_route(f"/section{i}/{{slug}}/edit/:rev", BenchPage, f"edit{i}")
+    return router
+
+
+def bench(router: Router, path: str) -> List[float]:
+    samples = []
+    match = router.match
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        for _ in range(CALLS_PER_ROUND):
+            match(path)
+        samples.append((time.perf_counter_ns() - start) / CALLS_PER_ROUND)
+    return samples
+
+
+def main() -> None:
+    router = build_router()
+    cases = {
+        "head": "/",
+        "middle": "/section21/42",
+        "tail": "/section41/hello/edit/7",
+        "miss": "/nowhere/at/all",
+    }
+    for label, path in cases.items():
+        samples = sorted(bench(router, path))
+        p50 = statistics.median(samples)
+        p99 = samples[int(len(samples) * 0.99) - 1]
+        print(f"{label:>6}: p50 {p50:8.1f} ns  p99 {p99:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
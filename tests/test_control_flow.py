@@ -1,77 +1,86 @@
-import unittest
-from pywire.compiler.parser import PyWireParser, PyWireSyntaxError
+import ast
+
+import pytest
+
+from pywire.compiler.ast_nodes import ForAttribute, IfAttribute, InterpolationNode
 from pywire.compiler.codegen.template import TemplateCodegen
-from pywire.compiler.ast_nodes import IfAttribute, ShowAttribute, ForAttribute
+from pywire.compiler.parser import PyWireParser, PyWireSyntaxError
 
-class TestControlFlow(unittest.TestCase):
-    def test_if_block(self):
-        source = """{$if True}
-    <div>Found</div>
-{/if}
-"""
-        parser = PyWireParser()
-        ast = parser.parse(source)
-        node = ast.template[0]
-        
-        # Check node type (tag=None -> template wrapper)
-        self.assertIsNone(node.tag)
-        # Check IfAttribute
-        if_attrs = [a for a in node.special_attributes if isinstance(a, IfAttribute)]
-        self.assertEqual(len(if_attrs), 1)
-        self.assertEqual(if_attrs[0].condition, "True")
-        
-        # Check child exists (ignoring whitespace)
-        real_children = [c for c in node.children if c.tag]
-        self.assertEqual(len(real_children), 1) # div
-
-    def test_html_block(self):
-        source = """{$html "<b>Raw</b>"}
+
+@pytest.mark.parametrize(
+    "source,if_tag,child_tags",
+    [
+        # Block form wraps its children in a tag-less template node
+        ("{$if True}\n    <div>Found</div>\n{/if}\n", None, ["div"]),
+        # Attribute form puts the condition on the element itself
+        ("<div $if={True}>Found</div>\n", "div", []),
+    ],
+)
+def test_if_block(
+    parser: PyWireParser, source: str, if_tag: object, child_tags: list
+) -> None:
+    node = parser.parse(source).template[0]
+
+    assert node.tag == if_tag
+    # Check IfAttribute
+    # Unpacking the generator asserts exactly one match without a list
+    (if_attr,) = (a for a in node.special_attributes if isinstance(a, IfAttribute))
+    assert if_attr.condition == "True"
+
+    # Check element children (ignoring whitespace and text)
+    assert [c.tag for c in node.children if c.tag] == child_tags
+
+
+def test_html_block(parser: PyWireParser) -> None:
+    source = """{$html "<b>Raw</b>"}
 """
-        parser = PyWireParser()
-        ast = parser.parse(source)
-        node = ast.template[0]
-        self.assertIsNone(node.tag)
-        from pywire.compiler.ast_nodes import InterpolationNode
-        interp_attrs = [a for a in node.special_attributes if isinstance(a, InterpolationNode)]
-        self.assertEqual(len(interp_attrs), 1)
-        self.assertTrue(interp_attrs[0].is_raw)
-        self.assertEqual(interp_attrs[0].expression, '"<b>Raw</b>"')
-
-    def test_for_block_valid(self):
-        source = """{$for item in items}
+    node = parser.parse(source).template[0]
+    assert node.tag is None
+    (interp,) = (
+        a for a in node.special_attributes if isinstance(a, InterpolationNode)
+    )
+    assert interp.is_raw
+    assert interp.expression == '"<b>Raw</b>"'
+
+
+def test_for_block_valid(parser: PyWireParser) -> None:
+    source = """{$for item in items}
     <div>{item}</div>
 {/for}
 """
-        parser = PyWireParser()
-        ast = parser.parse(source)
-        node = ast.template[0]
-        self.assertIsNone(node.tag)
-        for_attrs = [a for a in node.special_attributes if isinstance(a, ForAttribute)]
-        self.assertEqual(len(for_attrs), 1)
-        self.assertEqual(for_attrs[0].iterable, "items")
-
-    def test_for_block_single_root_valid(self):
-        source = """{$for i in x}
-   <!-- comment -->
-   <div>Single Root</div>
-{/for}
-"""
-        parser = PyWireParser()
-        parser.parse(source) # Should pass
+    node = parser.parse(source).template[0]
+    assert node.tag is None
+    (for_attr,) = (a for a in node.special_attributes if isinstance(a, ForAttribute))
+    assert for_attr.iterable == "items"
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        # A comment next to the single root is fine
+        "{$for i in x}\n   <!-- comment -->\n   <div>Single Root</div>\n{/for}\n",
+        # Keyed loops may have several roots
+        "<ul>\n    {$for key, val in items.items(), key=key}\n"
+        "        <dt>{key}</dt>\n        <dd>{val}</dd>\n    {/for}\n</ul>\n",
+    ],
+    ids=["single_root", "keyed_multi_root"],
+)
+def test_for_block_roots_valid(parser: PyWireParser, source: str) -> None:
+    parser.parse(source)  # Should pass
+
 
-    def test_for_block_invalid_multi_root(self):
-        source = """{$for i in x}
+def test_for_block_invalid_multi_root(parser: PyWireParser) -> None:
+    source = """{$for i in x}
    <div>Root 1</div>
    <div>Root 2</div>
 {/for}
 """
-        parser = PyWireParser()
-        with self.assertRaises(PyWireSyntaxError) as cm:
-             parser.parse(source)
-        self.assertIn("must have exactly one root element", str(cm.exception))
+    with pytest.raises(PyWireSyntaxError, match="must have exactly one root element"):
+        parser.parse(source)
 
-    def test_for_else(self):
-        source = """<ul>
+
+def test_for_else(parser: PyWireParser) -> None:
+    source = """<ul>
     {$for item in items}
         <li>{item}</li>
     {$else}
@@ -79,33 +88,20 @@ class TestControlFlow(unittest.TestCase):
     {/for}
 </ul>
 """
-        parser = PyWireParser()
-        parsed = parser.parse(source)
-        
-        from pywire.compiler.codegen.template import TemplateCodegen
-        import ast
-        
-        codegen = TemplateCodegen()
-        body = []
-        # Simulate items is empty
-        codegen._add_node(parsed.template[0], body, local_vars={"items"})
-        
-        # Verify AST contains the loop_any flag and If block
-        dump = "\n".join(ast.dump(s) for s in body)
-        self.assertIn("_loop_any", dump)
-        self.assertIn("AsyncFor", dump)
-        self.assertIn("If(test=UnaryOp(op=Not()", dump)
-
-    def test_keyed_for_multi_root(self):
-        source = """<ul>
-    {$for key, val in items.items(), key=key}
-        <dt>{key}</dt>
-        <dd>{val}</dd>
-    {/for}
-</ul>
-"""
-        parser = PyWireParser()
-        parser.parse(source) # Should pass
+    parsed = parser.parse(source)
+
+    codegen = TemplateCodegen()
+    body: list = []
+    # Simulate items is empty
+    codegen._add_node(parsed.template[0], body, local_vars={"items"})
 
-if __name__ == "__main__":
-    unittest.main()
+    # Verify AST contains the loop_any flag and If block
+    nodes = list(ast.walk(ast.Module(body=body, type_ignores=[])))
+    assert any(isinstance(n, ast.Name) and n.id.startswith("_loop_any") for n in nodes)
+    assert any(isinstance(n, ast.AsyncFor) for n in nodes)
+    assert any(
+        isinstance(n, ast.If)
+        and isinstance(n.test, ast.UnaryOp)
+        and isinstance(n.test.op, ast.Not)
+        for n in nodes
+    )
@@ -39,3 +39,31 @@ def test_custom_error_page(tmp_path: Path) -> None:
     response = client_prod.get("/")
     assert response.status_code == 500
     assert "Error 500" in response.text
+
+
+def test_error_page_matches_template_render() -> None:
+    """Verify the spliced ErrorPage output matches a full Jinja render."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from pywire.runtime.error_page import ErrorPage
+    from pywire.runtime.error_renderer import render_template
+
+    script_url = "/client.js?v=1&t='x'"
+    pywire_app = SimpleNamespace(_get_client_script_url=lambda: script_url)
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(pywire=pywire_app))
+    )
+    page = ErrorPage(request, "404 <Not> Found", "The path '/a&b' is missing.")
+
+    response = asyncio.run(page.render())
+
+    expected = render_template(
+        "error/404.html",
+        {
+            "title": "404 <Not> Found",
+            "message": "The path '/a&b' is missing.",
+            "script_url": script_url,
+        },
+    )
+    assert bytes(response.body).decode("utf-8") == expected
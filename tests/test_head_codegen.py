@@ -1,25 +1,22 @@
 import unittest
 import ast
 import textwrap
-from typing import Union, List, Any, cast
+from typing import List
 from pywire.compiler.parser import PyWireParser
 from pywire.compiler.codegen.template import TemplateCodegen
 
 class TestHeadCodegen(unittest.TestCase):
-    def normalize_ast(self, node: Union[ast.AST, List[ast.AST]]) -> Union[ast.AST, List[ast.AST]]:
-        if isinstance(node, list):
-            for n in node:
-                self.normalize_ast(n)
-            return node
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The parser keeps no per-parse state, so one instance serves every test
+        cls.parser = PyWireParser()
 
-        for child in ast.walk(node):
-            if not hasattr(child, "lineno"):
-                c = cast(Any, child)
-                c.lineno = 1
-                c.end_lineno = 1
-                c.col_offset = 0
-                c.end_col_offset = 0
-        return node
+    def strings(self, node: ast.AST) -> List[str]:
+        return [
+            n.value
+            for n in ast.walk(node)
+            if isinstance(n, ast.Constant) and isinstance(n.value, str)
+        ]
 
     def test_head_tag_compilation(self):
         # Now that void tags support />, this source should parse correctly
@@ -31,8 +28,7 @@ class TestHeadCodegen(unittest.TestCase):
             <div>Body Content</div>
         """).strip()
         
-        parser = PyWireParser()
-        parsed = parser.parse(source)
+        parsed = self.parser.parse(source)
         codegen = TemplateCodegen()
         
         # generate_slot_methods should detect <head> and put it in $head slot
@@ -47,33 +43,28 @@ class TestHeadCodegen(unittest.TestCase):
         
         # Get the AST for the $head slot method
         head_method_ast = slot_methods["$head"]
-        
-        # Normalize AST to fix missing line numbers for unparse
-        self.normalize_ast(head_method_ast)
-        
-        # Convert to string to inspect content
-        code = ast.unparse(head_method_ast)
-        
+
+        # Inspect the string constants the method emits
+        head_strings = self.strings(head_method_ast)
+
         # Check for components of the title tag
-        self.assertIn("'My Title'", code)
-        self.assertIn("'<title'", code)
-        self.assertIn("'</title>'", code)
-        
+        self.assertIn("My Title", head_strings)
+        self.assertIn("<title", head_strings)
+        self.assertIn("</title>", head_strings)
+
         # Check for meta tag components (now that they are correctly parsed)
-        self.assertIn("'<meta'", code)
-        self.assertIn("'description'", code)
-        self.assertIn("'Test'", code)
-        
+        self.assertIn("<meta", head_strings)
+        self.assertIn("description", head_strings)
+        self.assertIn("Test", head_strings)
+
         # Should NOT contain body content
-        self.assertNotIn('Body Content', code)
-        
+        self.assertFalse(any("Body Content" in v for v in head_strings))
+
         # Check default slot (body content)
         self.assertIn("default", slot_methods)
-        default_method_ast = slot_methods["default"]
-        self.normalize_ast(default_method_ast)
-        default_code = ast.unparse(default_method_ast)
-        self.assertIn('Body Content', default_code)
-        self.assertNotIn("'<title'", default_code)
+        default_strings = self.strings(slot_methods["default"])
+        self.assertTrue(any("Body Content" in v for v in default_strings))
+        self.assertNotIn("<title", default_strings)
 
 if __name__ == "__main__":
     unittest.main()
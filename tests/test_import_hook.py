@@ -0,0 +1,59 @@
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from pywire.runtime.importer import PyWireFinder, clear_wire_cache
+
+
+@pytest.fixture
+def wire_dir(tmp_path: Path):
+    sys.path.insert(0, str(tmp_path))
+    clear_wire_cache()
+    yield tmp_path
+    sys.path.remove(str(tmp_path))
+    clear_wire_cache()
+
+
+def test_find_spec_resolves_wire_file(wire_dir: Path) -> None:
+    (wire_dir / "my-button.wire").write_text("<button>Hi</button>")
+
+    spec = PyWireFinder().find_spec("my-button", None)
+
+    assert spec is not None
+    assert spec.origin == str(wire_dir / "my-button.wire")
+    assert spec.loader.class_name == "MyButton"
+
+
+def test_find_spec_ignores_non_wire_modules(wire_dir: Path) -> None:
+    (wire_dir / "plain.py").write_text("")
+
+    assert PyWireFinder().find_spec("plain", None) is None
+
+
+def test_directory_listing_refreshed_when_directory_changes(wire_dir: Path) -> None:
+    finder = PyWireFinder()
+    assert finder.find_spec("late", None) is None
+
+    (wire_dir / "late.wire").write_text("<p>late</p>")
+    # Coarse filesystem timestamps may not tick between the two writes
+    mtime = wire_dir.stat().st_mtime_ns + 1_000_000_000
+    os.utime(wire_dir, ns=(mtime, mtime))
+
+    assert finder.find_spec("late", None) is not None
+
+
+def test_directory_listing_refreshed_on_invalidate(wire_dir: Path) -> None:
+    finder = PyWireFinder()
+    assert finder.find_spec("late", None) is None
+
+    # Same mtime as the cached listing, so only invalidation picks the file up
+    mtime = wire_dir.stat().st_mtime_ns
+    (wire_dir / "late.wire").write_text("<p>late</p>")
+    os.utime(wire_dir, ns=(mtime, mtime))
+    assert finder.find_spec("late", None) is None
+
+    importlib.invalidate_caches()
+    assert finder.find_spec("late", None) is not None
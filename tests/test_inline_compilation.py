@@ -23,7 +23,6 @@ def test_inline_handler_extraction() -> None:
     parsed = ParsedPyWire(template=[button_node], file_path="test_inline.wire")
 
     module_ast = generator.generate(parsed)
-    ast.fix_missing_locations(module_ast)
 
     # Check if a handler method was created
     found_handler = False
@@ -0,0 +1,485 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pywire.runtime.loader import PageLoader
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # Keep .pywire/ caches inside the temporary project, and re-enable the
+    # code cache that conftest turns off for the rest of the suite
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PYWIRE_NO_CODE_CACHE", raising=False)
+    return tmp_path
+
+
+def _fail_compile(*args: Any, **kwargs: Any) -> Any:
+    raise AssertionError("expected a code cache hit")
+
+
+def test_code_cache_reused_across_loaders(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    page = project / "page.wire"
+    page.write_text("<h1>Cached</h1>")
+
+    first = PageLoader().load(page)
+    assert list((project / ".pywire" / "cache").glob("*.pyc"))
+
+    loader = PageLoader()
+    monkeypatch.setattr(loader, "_compile", _fail_compile)
+    second = loader.load(page)
+
+    assert second is not first
+    assert second.__name__ == first.__name__
+
+
+def test_code_cache_keeps_one_entry_per_page(project: Path) -> None:
+    page = project / "page.wire"
+    page.write_text("<h1>One</h1>")
+    PageLoader().load(page)
+    page.write_text("<h1>Two</h1>")
+    second = PageLoader().load(page)
+
+    assert len(list((project / ".pywire" / "cache").glob("*.pyc"))) == 1
+    # The rewritten entry serves the new source
+    loader = PageLoader()
+    loader._compile = _fail_compile  # type: ignore[method-assign]
+    assert loader.load(page).__name__ == second.__name__
+
+
+def test_code_cache_lives_in_page_project_root(
+    project: Path, monkeypatch: pytest.MonkeyPatch, tmp_path_factory: Any
+) -> None:
+    other = tmp_path_factory.mktemp("elsewhere")
+    (project / "pyproject.toml").write_text("")
+    (project / "pages").mkdir()
+    page = project / "pages" / "page.wire"
+    page.write_text("<h1>Rooted</h1>")
+
+    monkeypatch.chdir(other)
+    PageLoader().load(page)
+
+    assert list((project / ".pywire" / "cache").glob("*.pyc"))
+    assert not (other / ".pywire").exists()
+
+
+def test_project_root_markers_picked_up_after_changes(project: Path) -> None:
+    from pywire.compiler.paths import find_project_root
+
+    pages = project / "pages"
+    pages.mkdir()
+    # A miss isn't cached, so a marker added later is found
+    assert find_project_root(pages) == pages
+    (project / "pyproject.toml").write_text("")
+    assert find_project_root(pages) == project
+
+    # Hits are dropped when the loader's cache is invalidated
+    (pages / "pyproject.toml").write_text("")
+    assert find_project_root(pages) == project
+    PageLoader().invalidate_cache()
+    assert find_project_root(pages) == pages
+
+
+def test_code_cache_disabled_by_env(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PYWIRE_NO_CODE_CACHE", "1")
+    page = project / "page.wire"
+    page.write_text("<h1>Uncached</h1>")
+    PageLoader().load(page)
+
+    assert not (project / ".pywire" / "cache").exists()
+
+
+def test_code_cache_misses_on_source_change(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    page = project / "page.wire"
+    page.write_text("<h1>One</h1>")
+    PageLoader().load(page)
+
+    page.write_text("<h1>Two</h1>")
+    loader = PageLoader()
+    calls = []
+    original = loader._compile
+
+    def tracking_compile(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(loader, "_compile", tracking_compile)
+    loader.load(page)
+
+    assert len(calls) == 1
+
+
+def test_unchanged_source_not_recompiled_after_invalidate(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    page = project / "page.wire"
+    page.write_text("<h1>Same</h1>")
+
+    loader = PageLoader()
+    loader.load(page)
+    loader.invalidate_cache(page)
+
+    monkeypatch.setattr(loader, "_compile", _fail_compile)
+    monkeypatch.setattr(loader, "_read_code_cache", _fail_compile)
+    assert loader.load(page) is not None
+
+
+def _build_project(project: Path) -> Path:
+    from pywire.compiler.build_artifacts import build_artifacts
+
+    pages = project / "pages"
+    pages.mkdir()
+    (pages / "__layout__.wire").write_text("<main><slot /></main>")
+    (pages / "index.wire").write_text("<h1>Home</h1>")
+    build_artifacts(pages, out_dir=project / ".pywire" / "build")
+    return pages
+
+
+def test_precompiled_artifact_used_when_fresh(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pages = _build_project(project)
+
+    loader = PageLoader()
+    monkeypatch.setattr(loader, "_compile", _fail_compile)
+    page_class = loader.load(pages / "index.wire")
+
+    # Served from the binary manifest written alongside manifest.json
+    binary_manifest = (project / ".pywire" / "build" / "manifest.msgpack").resolve()
+    assert str(binary_manifest) in loader._manifest_cache
+
+    assert page_class.__file_path__ == str((pages / "index.wire").resolve())
+    # Serving a precompiled page never instantiates the compiler
+    assert loader._parser is None
+    assert loader._codegen is None
+
+
+def test_precompiled_artifact_skipped_when_dep_changes(project: Path) -> None:
+    pages = _build_project(project)
+    (pages / "__layout__.wire").write_text("<section><slot /></section>")
+
+    loader = PageLoader()
+    assert loader._load_precompiled((pages / "index.wire").resolve()) is None
+
+
+def test_precompiled_bytecode_loaded_without_source_artifact(project: Path) -> None:
+    pages = _build_project(project)
+    build_dir = project / ".pywire" / "build"
+    assert list(build_dir.rglob("*.pyc"))
+
+    # The marshaled code is enough; the generated .py is only a fallback
+    for artifact in build_dir.rglob("*.py"):
+        artifact.unlink()
+
+    loader = PageLoader()
+    assert loader._load_precompiled((pages / "index.wire").resolve()) is not None
+
+
+def test_manifest_not_reparsed_when_rewritten_unchanged(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    import pywire.runtime.loader as loader_mod
+
+    _build_project(project)
+    manifest_path = (project / ".pywire" / "build" / "manifest.json").resolve()
+    loader = PageLoader()
+    first = loader._load_manifest(manifest_path)
+    assert first is not None
+
+    # Same bytes with a newer mtime: served from the cache without parsing
+    binary_manifest = manifest_path.with_suffix(".msgpack")
+    binary_manifest.write_bytes(binary_manifest.read_bytes())
+    st = binary_manifest.stat()
+    os.utime(binary_manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    monkeypatch.setattr(loader_mod.msgpack, "unpackb", _fail_compile)
+
+    assert loader._load_manifest(manifest_path) is first
+
+
+def test_precompiled_missing_artifacts_fall_back(project: Path) -> None:
+    pages = _build_project(project)
+    build_dir = project / ".pywire" / "build"
+    for artifact in [*build_dir.rglob("*.py"), *build_dir.rglob("*.pyc")]:
+        artifact.unlink()
+
+    loader = PageLoader()
+    assert loader._load_precompiled((pages / "index.wire").resolve()) is None
+    assert loader.load(pages / "index.wire") is not None
+
+
+def test_precompiled_artifact_errors_propagate(project: Path) -> None:
+    pages = _build_project(project)
+    build_dir = project / ".pywire" / "build"
+    for bytecode in build_dir.rglob("*.pyc"):
+        bytecode.unlink()
+    for artifact in build_dir.rglob("*.py"):
+        artifact.write_text("open('/nonexistent/pywire-data.json')\n")
+
+    loader = PageLoader()
+    with pytest.raises(FileNotFoundError, match="pywire-data.json"):
+        loader._load_precompiled((pages / "index.wire").resolve())
+
+
+def test_hash_file_reuses_digest_until_file_changes(project: Path) -> None:
+    import os
+
+    path = project / "dep.wire"
+    path.write_text("<p>one</p>")
+    loader = PageLoader()
+
+    first = loader._hash_file(path)
+    st = path.stat()
+    assert loader._hash_cache[(str(path), "sha256")] == (
+        st.st_mtime_ns,
+        st.st_size,
+        first,
+    )
+
+    path.write_text("<p>two!</p>")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert loader._hash_file(path) != first
+
+
+def test_legacy_sha256_manifest_still_validates(project: Path) -> None:
+    import json
+
+    from pywire.compiler.hashing import hash_file
+
+    pages = _build_project(project)
+    manifest_path = project / ".pywire" / "build" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["hash_algo"] == "blake2b"
+
+    # Rewrite as an older JSON-only manifest with sha256 digests
+    (project / ".pywire" / "build" / "manifest.msgpack").unlink()
+    del manifest["hash_algo"]
+    for source_path, entry in manifest["entries"].items():
+        entry["hash"] = hash_file(Path(source_path), "sha256")
+        for dep in entry["deps"]:
+            dep["hash"] = hash_file(Path(dep["path"]), "sha256")
+    manifest_path.write_text(json.dumps(manifest))
+
+    loader = PageLoader()
+    assert loader._load_precompiled((pages / "index.wire").resolve()) is not None
+
+
+def test_newer_json_manifest_wins_over_stale_msgpack(project: Path) -> None:
+    import json
+    import os
+
+    _build_project(project)
+    manifest_path = project / ".pywire" / "build" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["pages_dir"] = "rebuilt-json-only"
+    manifest_path.write_text(json.dumps(manifest))
+    binary = manifest_path.with_suffix(".msgpack")
+    st = binary.stat()
+    os.utime(binary, ns=(st.st_atime_ns, manifest_path.stat().st_mtime_ns - 10**9))
+
+    loaded = PageLoader()._load_manifest(manifest_path)
+    assert loaded is not None
+    assert loaded["pages_dir"] == "rebuilt-json-only"
+
+
+def test_reload_with_identical_code_keeps_class(project: Path) -> None:
+    page = project / "page.wire"
+    page.write_text("<h1>Same</h1>")
+
+    loader = PageLoader()
+    original = loader.load(page)
+
+    page.write_text("<h1>Same</h1>\n")
+    loader.invalidate_cache(page)
+    assert loader.load(page) is original
+
+    page.write_text("<h1>Different</h1>")
+    loader.invalidate_cache(page)
+    assert loader.load(page) is not original
+
+
+def test_dependents_reexecute_after_layout_change(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (project / "layout.wire").write_text("<main><slot /></main>")
+    page = project / "page.wire"
+    page.write_text('!layout "layout.wire"\n<h1>Page</h1>')
+
+    # Generated code loads layouts through the module-level loader
+    loader = PageLoader()
+    monkeypatch.setattr("pywire.runtime.loader._loader_instance", loader)
+    original = loader.load(page)
+
+    (project / "layout.wire").write_text("<section><slot /></section>")
+    invalidated = loader.invalidate_cache(project / "layout.wire")
+
+    assert str(page.resolve()) in invalidated
+    assert loader.load(page) is not original
+
+
+def test_invalidate_cache_walks_dependency_chain(project: Path) -> None:
+    loader = PageLoader()
+    paths = [str(project / f"p{i}.wire") for i in range(4)]
+    for path in paths:
+        loader._cache[path] = type("Page", (), {})  # type: ignore[assignment]
+    # p0 <- p1 <- p2 <- p3, plus a cycle back to p0
+    for dep, dependent in zip(paths, paths[1:] + paths[:1]):
+        loader._reverse_deps[dep] = {dependent}
+
+    invalidated = loader.invalidate_cache(Path(paths[0]))
+
+    assert invalidated == set(paths)
+    assert not loader._cache
+
+
+def test_reexecution_drops_removed_layout_edge(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    layout = project / "layout.wire"
+    layout.write_text("<main><slot /></main>")
+    page = project / "page.wire"
+    page.write_text('!layout "layout.wire"\n<h1>Page</h1>')
+
+    loader = PageLoader()
+    monkeypatch.setattr("pywire.runtime.loader._loader_instance", loader)
+    loader.load(page)
+    assert str(page.resolve()) in loader._reverse_deps[str(layout.resolve())]
+
+    page.write_text("<h1>No layout</h1>")
+    loader.invalidate_cache(page)
+    loader.load(page)
+
+    assert str(layout.resolve()) not in loader._reverse_deps
+    assert str(page.resolve()) not in loader._forward_deps
+
+
+def test_load_source_keeps_file_dependency_edges(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    layout = project / "layout.wire"
+    layout.write_text("<main><slot /></main>")
+    (project / "other.wire").write_text("<div><slot /></div>")
+    page = project / "page.wire"
+    page.write_text('!layout "layout.wire"\n<h1>Page</h1>')
+
+    loader = PageLoader()
+    monkeypatch.setattr("pywire.runtime.loader._loader_instance", loader)
+    loader.load(page)
+    page_key = str(page.resolve())
+    expected = {str(layout.resolve())}
+    assert loader._forward_deps[page_key] == expected
+
+    for source in ("<h1>No layout</h1>", '!layout "other.wire"\n<h1>Other</h1>'):
+        loader.load_source(source, page)
+        assert loader._forward_deps[page_key] == expected
+        assert set(loader._reverse_deps) == expected
+
+    # Editing the layout still invalidates the file-backed page
+    assert page_key in loader.invalidate_cache(layout)
+
+
+def test_manifest_lookup_cached_per_directory(project: Path) -> None:
+    pages = _build_project(project)
+    (pages / "blog").mkdir()
+    loader = PageLoader()
+
+    manifest = loader._find_manifest((pages / "blog" / "post.wire").resolve())
+    assert manifest == (project / ".pywire" / "build" / "manifest.json").resolve()
+
+    # Directories visited by the walk share its result
+    assert loader._manifest_dir_cache[str(pages.resolve())] == manifest
+    assert loader._find_manifest((pages / "index.wire").resolve()) == manifest
+
+
+def test_manifest_built_after_a_miss_is_found(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from pywire.compiler.build_artifacts import build_artifacts
+
+    pages = project / "pages"
+    pages.mkdir()
+    (pages / "index.wire").write_text("<h1>Home</h1>")
+    page_file = (pages / "index.wire").resolve()
+    loader = PageLoader()
+    assert loader._find_manifest(page_file) is None
+
+    build_artifacts(pages, out_dir=project / ".pywire" / "build")
+    manifest = (project / ".pywire" / "build" / "manifest.json").resolve()
+    assert loader._find_manifest(page_file) == manifest
+
+    # The PYWIRE_BUILD_DIR override is also re-checked on every lookup
+    override = project / "custom-build"
+    monkeypatch.setenv("PYWIRE_BUILD_DIR", str(override))
+    assert loader._find_manifest(page_file) == manifest
+    build_artifacts(pages, out_dir=override)
+    assert loader._find_manifest(page_file) == override / "manifest.json"
+
+
+def test_page_class_name_cached_for_legacy_modules(project: Path) -> None:
+    import types
+
+    from pywire.runtime.page import BasePage
+
+    class LegacyPage(BasePage):
+        pass
+
+    loader = PageLoader()
+    module = types.ModuleType("legacy")
+    module.LegacyPage = LegacyPage  # type: ignore[attr-defined]
+    page_file = project / "legacy.wire"
+
+    assert loader._find_page_class(module, page_file) is LegacyPage
+    assert loader._page_class_names[str(page_file)] == "LegacyPage"
+
+    # A fresh module with the same layout is resolved by name, not by scanning
+    module = types.ModuleType("legacy")
+    module.LegacyPage = LegacyPage  # type: ignore[attr-defined]
+    assert loader._find_page_class(module, page_file) is LegacyPage
+
+
+def test_concurrent_first_loads_compile_once(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    page = project / "page.wire"
+    page.write_text("<h1>Busy</h1>")
+
+    loader = PageLoader()
+    monkeypatch.setattr(loader, "_read_code_cache", lambda *args: None)
+    calls = []
+    lock = threading.Lock()
+    original = loader._compile
+
+    def slow_compile(*args: Any, **kwargs: Any) -> Any:
+        with lock:
+            calls.append(args)
+        time.sleep(0.05)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(loader, "_compile", slow_compile)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        classes = list(pool.map(lambda _: loader.load(page), range(4)))
+
+    assert len(calls) == 1
+    assert all(cls is classes[0] for cls in classes)
+
+
+def test_load_source_skips_disk_and_cache(project: Path) -> None:
+    loader = PageLoader()
+    page_class = loader.load_source("<h1>In memory</h1>", Path("page.wire"))
+
+    assert page_class.__file_path__ == str(project / "page.wire")
+    assert not (project / "page.wire").exists()
+    assert not (project / ".pywire").exists()
+    assert not loader._cache
@@ -1,42 +1,110 @@
-import unittest
-from unittest.mock import Mock, AsyncMock
+from types import SimpleNamespace
+
+import pytest
+
 from pywire.runtime.page import BasePage
 
-class TestNoUpdate(unittest.IsolatedAsyncioTestCase):
-    async def test_no_update_when_clean(self):
-        # Setup page with region support
-        request = Mock()
-        page = BasePage(request, {}, {})
-        
-        # Mock region renderers to simulate a compiled page
-        page.__region_renderers__ = {"r1": "_render_r1"}
-        page._render_r1 = AsyncMock(return_value="<div>Content</div>")
-        
-        # Initial state: clean
-        page._dirty_regions = set()
-        
-        # Call render_update(init=False)
-        result = await page.render_update(init=False)
-        
-        # Expect empty regions update, NOT full update
-        self.assertEqual(result["type"], "regions")
-        self.assertEqual(result["regions"], [])
-        
-    async def test_update_when_dirty(self):
-        request = Mock()
-        page = BasePage(request, {}, {})
-        page.__region_renderers__ = {"r1": "_render_r1"}
-        page._render_r1 = AsyncMock(return_value="<div>New Content</div>")
-        
-        # Mark dirty
-        page._dirty_regions.add("r1")
-        
-        result = await page.render_update(init=False)
-        
-        self.assertEqual(result["type"], "regions")
-        self.assertEqual(len(result["regions"]), 1)
-        self.assertEqual(result["regions"][0]["region"], "r1")
-        self.assertEqual(result["regions"][0]["html"], "<div>New Content</div>")
-
-if __name__ == "__main__":
-    unittest.main()
+# One event loop for the module instead of one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+async def test_no_update_when_clean():
+    # Setup page with region support
+    request = SimpleNamespace()
+    page = BasePage(request, {}, {})
+
+    # Stub region renderers to simulate a compiled page
+    page.__region_renderers__ = {"r1": "_render_r1"}
+
+    async def _render_r1() -> str:
+        return "<div>Content</div>"
+
+    page._render_r1 = _render_r1
+
+    # Initial state: clean
+    page._dirty_regions = set()
+
+    # Call render_update(init=False)
+    result = await page.render_update(init=False)
+
+    # Expect empty regions update, NOT full update
+    assert result["type"] == "regions"
+    assert result["regions"] == []
+
+
+async def test_update_when_dirty():
+    request = SimpleNamespace()
+    page = BasePage(request, {}, {})
+    page.__region_renderers__ = {"r1": "_render_r1"}
+
+    async def _render_r1() -> str:
+        return "<div>New Content</div>"
+
+    page._render_r1 = _render_r1
+
+    # Mark dirty
+    page._dirty_regions.add("r1")
+
+    result = await page.render_update(init=False)
+
+    assert result["type"] == "regions"
+    assert len(result["regions"]) == 1
+    assert result["regions"][0]["region"] == "r1"
+    assert result["regions"][0]["html"] == "<div>New Content</div>"
+
+
+async def test_class_regions_dispatch_cached():
+    class RegionPage(BasePage):
+        __region_renderers__ = {"r1": "_render_r1", "r2": "_render_r2"}
+
+        async def _render_r1(self):
+            return "<a>"
+
+        def _render_r2(self):
+            return "<b>"
+
+    page = RegionPage(SimpleNamespace(), {}, {})
+    page._dirty_regions.update({"r2", "r1"})
+    result = await page.render_update(init=False)
+
+    assert result["regions"] == [
+        {"region": "r1", "html": "<a>"},
+        {"region": "r2", "html": "<b>"},
+    ]
+    assert "__region_dispatch__" in RegionPage.__dict__
+
+
+async def test_full_update_returns_rendered_html():
+    class FullPage(BasePage):
+        async def _render_template(self):
+            return "<body><p>Hi \u2603</p></body>"
+
+    page = FullPage(SimpleNamespace(), {}, {})
+    result = await page.render_update(init=False)
+
+    assert result == {"type": "full", "html": "<p>Hi \u2603</p>"}
+
+
+async def test_unchanged_region_html_not_resent():
+    page = BasePage(SimpleNamespace(), {}, {})
+    page.__region_renderers__ = {"r1": "_render_r1"}
+
+    async def _render_r1() -> str:
+        return "<div>Same</div>"
+
+    page._render_r1 = _render_r1
+
+    page._dirty_regions.add("r1")
+    first = await page.render_update(init=False)
+    assert first["regions"] == [{"region": "r1", "html": "<div>Same</div>"}]
+
+    # Dirty again, but the region renders identically: nothing to send
+    page._dirty_regions.add("r1")
+    second = await page.render_update(init=False)
+    assert second == {"type": "regions", "regions": []}
+
+    # A full render replaces the client's DOM, so the region is sent again
+    page._clear_wire_tracking()
+    page._dirty_regions.add("r1")
+    third = await page.render_update(init=False)
+    assert third["regions"] == [{"region": "r1", "html": "<div>Same</div>"}]
@@ -1,35 +1,35 @@
-import asyncio
-import os
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import List
 
 import pytest
 from pywire.runtime.loader import PageLoader
 
+# One event loop for the module instead of an asyncio.run() loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
+def shared_tmpdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One directory for the module; each case writes its own page file
+    return tmp_path_factory.mktemp("reactive")
+
+
+@pytest.fixture(scope="module")
 def loader() -> PageLoader:
+    # Safe to share: every case loads a page file with its own name
     return PageLoader()
 
 
 @pytest.fixture
-def mock_app() -> MagicMock:
-    from unittest.mock import MagicMock
-
-    app = MagicMock()
-    app.state = MagicMock()
-    app.state.webtransport_cert_hash = None
-    app.state.enable_pjax = False
-    return app
-
-
-def test_variable_binding(loader: PageLoader, mock_app: MagicMock) -> None:
-    """---
-Test attr={var} binding."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        page_code = """
+def request_stub() -> SimpleNamespace:
+    # Plain attributes: rendering only reads request.app.state
+    state = SimpleNamespace(webtransport_cert_hash=None, enable_pjax=False)
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+# Test attr={var} binding.
+VARIABLE_BINDING = """
 ---
 my_id = "dynamic-id"
 my_class = "btn"
@@ -37,29 +37,9 @@ my_class = "btn"
 
 <div id={my_id} class={my_class}></div>
 """
-        (tmp_path / "page.wire").write_text(page_code)
-
-        orig_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        try:
-            page_class = loader.load(tmp_path / "page.wire")
-            request = MagicMock()
-            request.app = mock_app
-            page = page_class(request, {}, {}, {}, None)
-            html = asyncio.run(page._render_template())
-
-            assert 'id="dynamic-id"' in html
-            assert 'class="btn"' in html
-        finally:
-            os.chdir(orig_cwd)
-
-
-def test_method_binding_paramless(loader: PageLoader, mock_app: MagicMock) -> None:
-    """---
-Test attr="method" auto-call binding."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        page_code = """
+
+# Test attr="method" auto-call binding.
+METHOD_BINDING_PARAMLESS = """
 ---
 def get_title():
     return "My Title"
@@ -67,56 +47,18 @@ def get_title():
 
 <div title={get_title}></div>
 """
-        (tmp_path / "page.wire").write_text(page_code)
-
-        orig_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        try:
-            page_class = loader.load(tmp_path / "page.wire")
-            request = MagicMock()
-            request.app = mock_app
-            page = page_class(request, {}, {}, {}, None)
-            html = asyncio.run(page._render_template())
-
-            assert 'title="My Title"' in html
-        finally:
-            os.chdir(orig_cwd)
-
-
-def test_expression_binding(loader: PageLoader, mock_app: MagicMock) -> None:
-    """---
-Test attr={expr} binding."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        page_code = """
+
+# Test attr={expr} binding.
+EXPRESSION_BINDING = """
 ---
 is_error = True
 ---
 
 <div class={"error" if is_error else "success"}></div>
 """
-        (tmp_path / "page.wire").write_text(page_code)
-
-        orig_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        try:
-            page_class = loader.load(tmp_path / "page.wire")
-            request = MagicMock()
-            request.app = mock_app
-            page = page_class(request, {}, {}, {}, None)
-            html = asyncio.run(page._render_template())
-
-            assert 'class="error"' in html
-        finally:
-            os.chdir(orig_cwd)
-
-
-def test_boolean_attributes(loader: PageLoader, mock_app: MagicMock) -> None:
-    """---
-Test boolean attribute behavior."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        page_code = """
+
+# Test boolean attribute behavior.
+BOOLEAN_ATTRIBUTES = """
 ---
 is_checked = True
 is_disabled = False
@@ -125,33 +67,9 @@ is_readonly = None
 
 <input type="checkbox" checked={is_checked} disabled={is_disabled} readonly={is_readonly}>
 """
-        (tmp_path / "page.wire").write_text(page_code)
-
-        orig_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        try:
-            page_class = loader.load(tmp_path / "page.wire")
-            request = MagicMock()
-            request.app = mock_app
-            page = page_class(request, {}, {}, {}, None)
-            html = asyncio.run(page._render_template())
 
-            # checked="True" -> checked=""
-            assert 'checked=""' in html
-            # disabled="False" -> omitted
-            assert "disabled" not in html
-            # readonly="None" -> omitted
-            assert "readonly" not in html
-        finally:
-            os.chdir(orig_cwd)
-
-
-def test_async_binding(loader: PageLoader, mock_app: MagicMock) -> None:
-    """---
-Test attr={await async_call()} binding."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        page_code = """
+# Test attr={await async_call()} binding.
+ASYNC_BINDING = """
 ---
 async def get_data():
     return "async-data"
@@ -159,28 +77,9 @@ async def get_data():
 
 <div data-val={await get_data()}></div>
 """
-        (tmp_path / "page.wire").write_text(page_code)
-
-        orig_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        try:
-            page_class = loader.load(tmp_path / "page.wire")
-            request = MagicMock()
-            request.app = mock_app
-            page = page_class(request, {}, {}, {}, None)
-            html = asyncio.run(page._render_template())
-
-            assert 'data-val="async-data"' in html
-        finally:
-            os.chdir(orig_cwd)
-
-
-def test_aria_boolean_attributes(loader: PageLoader, mock_app: MagicMock) -> None:
-    """---
-Test ARIA boolean attributes (true/false strings)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        page_code = """
+
+# Test ARIA boolean attributes (true/false strings).
+ARIA_BOOLEAN_ATTRIBUTES = """
 ---
 is_loading = True
 is_expanded = False
@@ -188,20 +87,63 @@ is_expanded = False
 
 <div aria-busy={is_loading} aria-expanded={is_expanded}></div>
 """
-        (tmp_path / "page.wire").write_text(page_code)
-
-        orig_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        try:
-            page_class = loader.load(tmp_path / "page.wire")
-            request = MagicMock()
-            request.app = mock_app
-            page = page_class(request, {}, {}, {}, None)
-            html = asyncio.run(page._render_template())
-
-            # aria-busy="true"
-            assert 'aria-busy="true"' in html
-            # aria-expanded="false"
-            assert 'aria-expanded="false"' in html
-        finally:
-            os.chdir(orig_cwd)
+
+
+@pytest.mark.parametrize(
+    "page_code,expected,unexpected",
+    [
+        pytest.param(
+            VARIABLE_BINDING,
+            ['id="dynamic-id"', 'class="btn"'],
+            [],
+            id="variable_binding",
+        ),
+        pytest.param(
+            METHOD_BINDING_PARAMLESS,
+            ['title="My Title"'],
+            [],
+            id="method_binding_paramless",
+        ),
+        pytest.param(
+            EXPRESSION_BINDING, ['class="error"'], [], id="expression_binding"
+        ),
+        pytest.param(
+            BOOLEAN_ATTRIBUTES,
+            # checked="True" -> checked=""
+            ['checked=""'],
+            # disabled="False" and readonly="None" -> omitted
+            ["disabled", "readonly"],
+            id="boolean_attributes",
+        ),
+        pytest.param(
+            ASYNC_BINDING, ['data-val="async-data"'], [], id="async_binding"
+        ),
+        pytest.param(
+            ARIA_BOOLEAN_ATTRIBUTES,
+            ['aria-busy="true"', 'aria-expanded="false"'],
+            [],
+            id="aria_boolean_attributes",
+        ),
+    ],
+)
+async def test_attribute_binding(
+    loader: PageLoader,
+    request_stub: SimpleNamespace,
+    shared_tmpdir: Path,
+    request: pytest.FixtureRequest,
+    page_code: str,
+    expected: List[str],
+    unexpected: List[str],
+) -> None:
+    # Each case gets its own file, named after its parametrize id
+    page_file = shared_tmpdir / f"{request.node.callspec.id}.wire"
+    page_file.write_text(page_code)
+
+    page_class = loader.load(page_file)
+    page = page_class(request_stub, {}, {}, {}, None)
+    html = await page._render_template()
+
+    for fragment in expected:
+        assert fragment in html
+    for fragment in unexpected:
+        assert fragment not in html
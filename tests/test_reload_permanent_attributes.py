@@ -1,8 +1,7 @@
 import pytest
 from pywire.compiler.parser import PyWireParser
 
-def test_permanent_reload_shorthand():
-    parser = PyWireParser()
+def test_permanent_reload_shorthand(parser: PyWireParser) -> None:
     source = """<div $permanent>Permanent</div>
 <a href="/test" $reload>Reload</a>
 <div id="mixed" class="foo" $permanent data-other="bar">Mixed</div>
@@ -29,8 +28,7 @@ def test_permanent_reload_shorthand():
     assert mixed.attributes["data-pywire-permanent"] == "true"
     assert mixed.attributes["data-other"] == "bar"
 
-def test_permanent_no_space():
-    parser = PyWireParser()
+def test_permanent_no_space(parser: PyWireParser) -> None:
     # $permanent at end of tag
     source = "<div $permanent></div>"
     ast = parser.parse(source)
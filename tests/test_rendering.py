@@ -221,6 +221,170 @@ class TestPageRendering(unittest.TestCase):
         finally:
             loop.close()
 
+    def test_handle_event_signature_cached_per_class(self) -> None:
+        from starlette.responses import Response
+
+        class CachedHandlerPage(BasePage):
+            async def on_click(self, step: Any = None, event: Any = None) -> None:
+                self.total = getattr(self, "total", 0) + step
+
+            async def render(self, init: bool = True) -> Response:
+                return Response("ok")
+
+        request = MagicMock()
+        loop = asyncio.new_event_loop()
+        try:
+            for _ in range(2):
+                page = CachedHandlerPage(request, {}, {})
+                loop.run_until_complete(
+                    page.handle_event("on_click", {"args": {"step": 3}})
+                )
+                self.assertEqual(page.total, 3)
+        finally:
+            loop.close()
+
+        self.assertEqual(
+            CachedHandlerPage.__handler_signatures__["on_click"],
+            (("step",), ("event",), False, True),
+        )
+
+    def test_handler_alias_on_instance_not_cached(self) -> None:
+        class AliasPage(BasePage):
+            def on_click(self, step: Any = None) -> None:
+                self.seen = ("click", step)
+
+            def other(self) -> None:
+                self.seen = ("other",)
+
+        page = AliasPage(MagicMock(), {}, {})
+        page.on_click = page.other
+        page._get_handler_signature("on_click", page.on_click)
+        cached = AliasPage.__dict__.get("__handler_signatures__", {})
+        self.assertNotIn("on_click", cached)
+
+        fresh = AliasPage(MagicMock(), {}, {})
+        self.assertEqual(
+            fresh._get_handler_signature("on_click", fresh.on_click)[0], ("step",)
+        )
+
+    def test_instance_assigned_hook_runs(self) -> None:
+        class HookPage(BasePage):
+            pass
+
+        calls: list = []
+        page = HookPage(MagicMock(), {}, {})
+        page.on_load = lambda: calls.append("load")
+        self.assertEqual(page._get_hooks("INIT_HOOKS"), (("on_load", False),))
+        self.assertEqual(HookPage(MagicMock(), {}, {})._get_hooks("INIT_HOOKS"), ())
+
+    def test_reflection_caches_do_not_keep_classes_alive(self) -> None:
+        import gc
+        import weakref
+
+        class ReloadedPage(BasePage):
+            def on_load(self) -> None:
+                pass
+
+            def on_click(self) -> None:
+                pass
+
+        page = ReloadedPage(MagicMock(), {}, {})
+        page._get_hooks("INIT_HOOKS")
+        page._get_handler_signature("on_click", page.on_click)
+        ref = weakref.ref(ReloadedPage)
+        del page, ReloadedPage
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_event_data_snake_case_falls_back_to_camel_case(self) -> None:
+        from pywire.runtime.page import EventData
+
+        data = EventData({"keyCode": 13, "value": "x"})
+        self.assertEqual(data.key_code, 13)
+        self.assertEqual(data.key_code, 13)
+        self.assertEqual(data.value, "x")
+        self.assertIsNone(data.missing_field)
+
+    def test_is_coro_matches_inspect(self) -> None:
+        import functools
+        import inspect
+
+        from pywire.runtime.page import _is_coro
+
+        async def async_fn() -> None:
+            pass
+
+        def sync_fn() -> None:
+            pass
+
+        class Holder:
+            async def method(self) -> None:
+                pass
+
+        candidates = [
+            async_fn,
+            sync_fn,
+            Holder().method,
+            functools.partial(async_fn),
+            lambda: None,
+            print,
+            MagicMock(),
+        ]
+        for fn in candidates:
+            self.assertEqual(_is_coro(fn), inspect.iscoroutinefunction(fn), fn)
+
+    def test_splice_document_matches_sequential_replace(self) -> None:
+        from pywire.runtime.page import _splice_document
+
+        cases = [
+            "<html><head></head><body><p>x</p></body></html>",
+            "<p>fragment</p>",
+            "<head></head><p>no body</p>",
+            "<body>no head</body>",
+        ]
+        for html in cases:
+            expected = html
+            if "</head>" in expected:
+                expected = expected.replace("</head>", "<style/></head>", 1)
+            else:
+                expected = "<style/>" + expected
+            if "</body>" in expected:
+                expected = expected.replace("</body>", "<script/></body>", 1)
+            else:
+                expected += "<script/>"
+            self.assertEqual(_splice_document(html, "<style/>", "<script/>"), expected)
+
+        self.assertEqual(_splice_document("<p></p>", "", "<s/>"), "<p></p><s/>")
+
+    def test_full_render_cancels_and_awaits_background_tasks(self) -> None:
+        class TaskPage(BasePage):
+            __no_spa__ = True
+
+        async def scenario() -> Any:
+            page = TaskPage(MagicMock(), {}, {})
+            task = asyncio.create_task(asyncio.sleep(60))
+            page._background_tasks.add(task)
+            task.add_done_callback(page._background_tasks.discard)
+            await page.render(init=True)
+            return task
+
+        loop = asyncio.new_event_loop()
+        try:
+            task = loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+        self.assertTrue(task.cancelled())
+
+    def test_dot_dict_attribute_access(self) -> None:
+        from pywire.runtime.page import DotDict
+
+        params = DotDict({"id": "42"})
+        self.assertEqual(params.id, "42")
+        self.assertIsNone(params.slug)
+        params.slug = "post"
+        self.assertEqual(params["slug"], "post")
+        self.assertEqual(dict(params), {"id": "42", "slug": "post"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -51,6 +51,11 @@ class TestRouterRuntime(unittest.TestCase):
         tpl2 = URLTemplate("/page/{slug}")
         self.assertEqual(tpl2.format(slug="contact"), "/page/contact")
 
+        tpl3 = URLTemplate("/user/:id:int/posts")
+        self.assertEqual(tpl3.format(id=7), "/user/7/posts")
+        with self.assertRaises(KeyError):
+            tpl3.format(other=1)
+
     def test_url_helper(self) -> None:
         helper = URLHelper({"home": "/", "user": "/user/:id"})
         self.assertEqual(str(helper["home"]), "/")
@@ -59,6 +64,12 @@ class TestRouterRuntime(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = helper["missing"]
 
+        typed = URLHelper({"post": "/post/{id:int}", "tag": "/tag/:name:str"})
+        self.assertEqual(str(typed), "{'post': '/post/{id}', 'tag': '/tag/{name}'}")
+
+        # Templates are built once per variant
+        self.assertIs(helper["user"], helper["user"])
+
     def test_router_add_page_with_routes(self) -> None:
         class PageWithRoutes(MockPage):
             __routes__ = {"main": "/main", "alt": "/alt"}
@@ -90,6 +101,174 @@ class TestRouterRuntime(unittest.TestCase):
         self.assertEqual(len(router.routes), 1)
         self.assertEqual(router.routes[0].page_class, PageB)
 
+    def test_router_first_registered_route_wins(self) -> None:
+        class Detail(MockPage):
+            __route__ = "/users/{id}"
+
+        class New(MockPage):
+            __route__ = "/users/new"
+
+        class Numeric(MockPage):
+            __route__ = "/users/{id:int}/edit"
+
+        class Settings(MockPage):
+            __route__ = "/users/settings/{tab}"
+
+        class AnyEdit(MockPage):
+            __route__ = "/users/{name}/{action}"
+
+        router = Router()
+        for page in (Detail, New, Numeric, Settings, AnyEdit):
+            router.add_page(page)
+
+        # Same precedence as a linear scan over router.routes
+        self.assertEqual(router.match("/users/new"), (Detail, {"id": "new"}, None))
+        self.assertEqual(router.match("/users/bob"), (Detail, {"id": "bob"}, None))
+        self.assertEqual(
+            router.match("/users/7/edit"), (Numeric, {"id": 7}, None)
+        )
+        self.assertEqual(
+            router.match("/users/settings/edit"), (Settings, {"tab": "edit"}, None)
+        )
+        self.assertEqual(
+            router.match("/users/bob/edit"),
+            (AnyEdit, {"name": "bob", "action": "edit"}, None),
+        )
+        self.assertIsNone(router.match("/users/"))
+
+        # A literal route registered first still beats a later param route
+        router = Router()
+        router.add_page(New)
+        router.add_page(Detail)
+        self.assertEqual(router.match("/users/new"), (New, {}, None))
+        self.assertEqual(router.match("/users/bob"), (Detail, {"id": "bob"}, None))
+
+    def test_router_registration_order_survives_rebuild(self) -> None:
+        class Detail(MockPage):
+            __file_path__ = "detail.wire"
+            __route__ = "/users/{id}"
+
+        class New(MockPage):
+            __file_path__ = "new.wire"
+            __route__ = "/users/new"
+
+        class Other(MockPage):
+            __file_path__ = "other.wire"
+            __route__ = "/other"
+
+        router = Router()
+        router.add_page(Detail)
+        router.add_page(Other)
+        router.match("/other")  # Build the trie, then add incrementally
+        router.add_page(New)
+        self.assertEqual(router.match("/users/new"), (Detail, {"id": "new"}, None))
+
+        router.remove_routes_for_file("other.wire")
+        self.assertEqual(router.match("/users/new"), (Detail, {"id": "new"}, None))
+
+        router.remove_routes_for_file("detail.wire")
+        self.assertEqual(router.match("/users/new"), (New, {}, None))
+
+    def test_router_trie_rebuilt_after_removal(self) -> None:
+        class PageA(MockPage):
+            __file_path__ = "file_a.wire"
+            __route__ = "/items/{slug}"
+
+        class PageB(MockPage):
+            __file_path__ = "file_b.wire"
+            __route__ = "/items/{slug}"
+
+        router = Router()
+        router.add_page(PageA)
+        router.add_page(PageB)
+        match = router.match("/items/x")
+        assert match is not None
+        self.assertEqual(match[0], PageA)
+
+        router.remove_routes_for_file("file_a.wire")
+        match = router.match("/items/x")
+        assert match is not None
+        self.assertEqual(match[0], PageB)
+
+    def test_router_match_does_not_compile_regexes(self) -> None:
+        router = Router()
+        router.add_route("/user/:id:int", MockPage, "user")
+        self.assertEqual(router.match("/user/3"), (MockPage, {"id": 3}, "user"))
+        self.assertIsNone(router.routes[0]._regex)
+
+        # Still available for callers that use Route directly
+        self.assertEqual(router.routes[0].regex.pattern, r"^/user/(?P<id>[0-9]+)$")
+
+    def test_router_static_routes_use_exact_lookup(self) -> None:
+        router = Router()
+        router.add_route("/docs/", MockPage, "docs")
+        router.add_route("/docs", MockPage, "shadowed")
+
+        self.assertEqual(router.match("/docs"), (MockPage, {}, "docs"))
+        self.assertIsNone(router.match("/docs/"))
+        self.assertEqual(set(router._static), {"/docs"})
+
+    def test_router_add_pages_batch(self) -> None:
+        class PageA(MockPage):
+            __routes__ = {"list": "/a", "detail": "/a/:id:int"}
+
+        class PageB(MockPage):
+            __route__ = "/b"
+
+        class NoRoute(MockPage):
+            pass
+
+        router = Router()
+        router.add_page(PageB)
+        self.assertIsNotNone(router.match("/b"))
+
+        router.add_pages([PageA, NoRoute])
+        self.assertEqual(len(router.routes), 3)
+        self.assertEqual(router.match("/a/4"), (PageA, {"id": 4}, "detail"))
+        self.assertEqual(router.match("/a"), (PageA, {}, "list"))
+
+    def test_route_literal_prefix(self) -> None:
+        self.assertEqual(Route("/", MockPage, None).literal_prefix, "/")
+        self.assertEqual(Route("/a/b/", MockPage, None).literal_prefix, "/a/b")
+        route = Route("/a/:id/b", MockPage, None)
+        self.assertEqual(route.literal_prefix, "/a/")
+        self.assertIsNone(route.match("/c/1/b"))
+        self.assertIsNone(route._regex)
+        self.assertEqual(route.match("/a/1/b"), {"id": "1"})
+
+    def test_static_route_match_skips_regex(self) -> None:
+        route = Route("/about/", MockPage, "about")
+        self.assertEqual(route.match("/about"), {})
+        self.assertIsNone(route.match("/about/team"))
+        self.assertIsNone(route._regex)
+
+    def test_route_pattern_parse_shared(self) -> None:
+        first = Route("/shared/:id:int", MockPage, None)
+        second = Route("/shared/:id:int", MockPage, "other")
+        self.assertIs(first.tokens, second.tokens)
+        self.assertEqual(second.param_types, {"id": "int"})
+        self.assertIsNot(first.param_types, second.param_types)
+
+    def test_router_match_cache(self) -> None:
+        class Item(MockPage):
+            __route__ = "/items/:id:int"
+
+        class Named(MockPage):
+            __route__ = "/items/:slug"
+
+        router = Router()
+        router.add_page(Item)
+        first = router.match("/items/0")
+        assert first is not None
+        first[1]["id"] = "mutated"
+        self.assertEqual(router.match("/items/0"), (Item, {"id": 0}, None))
+        self.assertEqual(router._lookup_cached.cache_info().hits, 1)
+
+        # Registering routes invalidates cached lookups, misses included
+        self.assertIsNone(router.match("/items/new"))
+        router.add_page(Named)
+        self.assertEqual(router.match("/items/new"), (Named, {"slug": "new"}, None))
+
 
 if __name__ == "__main__":
     unittest.main()
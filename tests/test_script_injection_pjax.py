@@ -1,67 +1,79 @@
+import json
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Tuple
+
 import pytest
-from pywire.runtime.app import PyWire
-from starlette.testclient import TestClient
-
-def test_script_injection_pjax_off(tmp_path: Path) -> None:
-    # Set up a real (but small) app with PJAX explicitly OFF
-    pages_dir = tmp_path / "pages"
-    pages_dir.mkdir()
-    (pages_dir / "index.wire").write_text(
-        "# Python\n---html---\n<html><body><h1>Index</h1></body></html>"
+
+if TYPE_CHECKING:
+    from starlette.testclient import TestClient
+
+def _spa_meta(html: str) -> Dict[str, Any]:
+    match = re.search(r'<script id="_pywire_spa_meta" type="application/json">(.*?)</script>', html)
+    assert match, "SPA meta script missing"
+    return json.loads(match.group(1))
+
+
+def _make_pages_dir(tmp_path_factory: pytest.TempPathFactory, **pages: str) -> Path:
+    pages_dir = tmp_path_factory.mktemp("pages")
+    for name, source in pages.items():
+        (pages_dir / f"{name}.wire").write_text(source)
+    return pages_dir
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["pjax_on", "pjax_off"])
+def pjax_client(
+    tmp_path_factory: pytest.TempPathFactory, request: pytest.FixtureRequest
+) -> Iterator[Tuple["TestClient", bool]]:
+    # Set up a real (but small) app once per PJAX setting
+    pages_dir = _make_pages_dir(
+        tmp_path_factory,
+        index="# Python\n---html---\n<html><body><h1>Index</h1></body></html>",
     )
+    # Imported here so collecting (or deselecting) this module stays cheap
+    from pywire.runtime.app import PyWire
+    from starlette.testclient import TestClient
 
-    # App with PJAX disabled
-    app = PyWire(pages_dir=str(pages_dir), debug=True, enable_pjax=False)
-    client = TestClient(app.app)
+    app = PyWire(pages_dir=str(pages_dir), debug=True, enable_pjax=request.param)
+    # Enter the client once so app startup runs once for all its requests
+    with TestClient(app.app) as client:
+        yield client, request.param
 
-    response = client.get("/")
-    assert response.status_code == 200
-    
-    # Even with PJAX off, we should see the client script
-    assert "pywire.core.min.js" in response.text or "pywire.dev.min.js" in response.text
-    assert "_pywire_spa_meta" in response.text
-    
-    # Metadata should show enable_pjax: false
-    assert '"enable_pjax": false' in response.text
-
-def test_script_injection_pjax_on(tmp_path: Path) -> None:
-    # Set up a real (but small) app with PJAX ON (default)
-    pages_dir = tmp_path / "pages"
-    pages_dir.mkdir()
-    (pages_dir / "index.wire").write_text(
-        "# Python\n---html---\n<html><body><h1>Index</h1></body></html>"
+
+@pytest.fixture(scope="module")
+def component_client(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator["TestClient"]:
+    pages_dir = _make_pages_dir(
+        tmp_path_factory,
+        index="# Python\n---html---\n<html><body><my-comp /></body></html>",
+        **{"my-comp": "# Python\n---html---\n<div>Component</div>"},
     )
+    from pywire.runtime.app import PyWire
+    from starlette.testclient import TestClient
+
+    app = PyWire(pages_dir=str(pages_dir), debug=True)
+    with TestClient(app.app) as client:
+        yield client
+
 
-    # App with PJAX enabled
-    app = PyWire(pages_dir=str(pages_dir), debug=True, enable_pjax=True)
-    client = TestClient(app.app)
+def test_script_injection_pjax(pjax_client: Tuple["TestClient", bool]) -> None:
+    client, enable_pjax = pjax_client
 
     response = client.get("/")
     assert response.status_code == 200
-    
-    # With PJAX on, we should see the client script
+
+    # The client script is injected whether PJAX is on or off
     assert "pywire.core.min.js" in response.text or "pywire.dev.min.js" in response.text
     assert "_pywire_spa_meta" in response.text
-    
-    # Metadata should show enable_pjax: true
-    assert '"enable_pjax": true' in response.text
 
-def test_script_injection_is_component_no_injection(tmp_path: Path) -> None:
-    # Components should NOT have the script injected
-    pages_dir = tmp_path / "pages"
-    pages_dir.mkdir()
-    (pages_dir / "index.wire").write_text(
-        "# Python\n---html---\n<html><body><my-comp /></body></html>"
-    )
-    (pages_dir / "my-comp.wire").write_text(
-        "# Python\n---html---\n<div>Component</div>"
-    )
+    # Metadata should reflect the enable_pjax setting
+    assert _spa_meta(response.text)["enable_pjax"] is enable_pjax
 
-    app = PyWire(pages_dir=str(pages_dir), debug=True)
-    client = TestClient(app.app)
 
-    response = client.get("/")
+def test_script_injection_is_component_no_injection(component_client: "TestClient") -> None:
+    # Components should NOT have the script injected
+    response = component_client.get("/")
     assert response.status_code == 200
     
     # Main page has script
@@ -71,4 +83,4 @@ def test_script_injection_is_component_no_injection(tmp_path: Path) -> None:
     # The current logic in page.py:
     # is_component = getattr(self, "__is_component__", False)
     # if init and not is_component: ...
-    # This is handled during the render of the component instance.
\ No newline at end of file
+    # This is handled during the render of the component instance.
@@ -3,23 +3,60 @@ from textwrap import dedent
 from pywire.compiler.parser import PyWireParser
 from pywire.compiler.codegen.generator import CodeGenerator
 
-def test_derived_decorator_compilation():
-    source = dedent("""
-        ---
-        count = wire(0)
-        
-        @derived
-        def double_count():
-            return count.value * 2
-        ---
-        <div>{double_count}</div>
-    """)
-    
-    parser = PyWireParser()
-    parsed = parser.parse(source, "test.wire")
+_DERIVED_DECORATOR_COMPILATION_SRC = dedent(
+    """
+    ---
+    count = wire(0)
+
+    @derived
+    def double_count():
+        return count.value * 2
+    ---
+    <div>{double_count}</div>
+    """
+)
+
+_EFFECT_DECORATOR_COMPILATION_SRC = dedent(
+    """
+    ---
+    count = wire(0)
+
+    @effect
+    def log_count():
+        print(count.value)
+    ---
+    <div>Check console</div>
+    """
+)
+
+_EXPOSE_DECORATOR_COMPILATION_SRC = dedent(
+    """
+    ---
+    @expose
+    def reset():
+        pass
+
+    def internal():
+        pass
+    ---
+    <div>Component</div>
+    """
+)
+
+_COMPONENT_REF_COMPILATION_SRC = dedent(
+    """
+    ---
+    modal_ref = wire()
+    ---
+    <Modal ref={modal_ref} title="Hello" />
+    """
+)
+
+
+def test_derived_decorator_compilation(parser: PyWireParser, codegen: CodeGenerator) -> None:
+    parsed = parser.parse(_DERIVED_DECORATOR_COMPILATION_SRC, "test.wire")
     
-    generator = CodeGenerator()
-    module_ast = generator.generate(parsed)
+    module_ast = codegen.generate(parsed)
     code = ast.unparse(module_ast)
     
     # Check that it's treated as a wire-like variable for unwrap_wire
@@ -31,64 +68,28 @@ def test_derived_decorator_compilation():
     # Check that it's added to __page_class__'s wire_vars (via CodeGenerator call sequence)
     # Actually we can't easily check wire_vars set directly from code, but unwrap_wire presence confirms it.
 
-def test_effect_decorator_compilation():
-    source = dedent("""
-        ---
-        count = wire(0)
-        
-        @effect
-        def log_count():
-            print(count.value)
-        ---
-        <div>Check console</div>
-    """)
+def test_effect_decorator_compilation(parser: PyWireParser, codegen: CodeGenerator) -> None:
+    parsed = parser.parse(_EFFECT_DECORATOR_COMPILATION_SRC, "test.wire")
     
-    parser = PyWireParser()
-    parsed = parser.parse(source, "test.wire")
-    
-    generator = CodeGenerator()
-    module_ast = generator.generate(parsed)
+    module_ast = codegen.generate(parsed)
     code = ast.unparse(module_ast)
     
     # Check that effect assignment happens
     assert "self._effect_log_count = effect(self.log_count)" in code
 
-def test_expose_decorator_compilation():
-    source = dedent("""
-        ---
-        @expose
-        def reset():
-            pass
-            
-        def internal():
-            pass
-        ---
-        <div>Component</div>
-    """)
-    
-    parser = PyWireParser()
-    parsed = parser.parse(source, "test.wire")
+def test_expose_decorator_compilation(parser: PyWireParser, codegen: CodeGenerator) -> None:
+    parsed = parser.parse(_EXPOSE_DECORATOR_COMPILATION_SRC, "test.wire")
     
-    generator = CodeGenerator()
-    module_ast = generator.generate(parsed)
+    module_ast = codegen.generate(parsed)
     code = ast.unparse(module_ast)
     
     # Check __exposed_methods__ class attribute
     assert "__exposed_methods__ = {'reset'}" in code
 
-def test_component_ref_compilation():
-    source = dedent("""
-        ---
-        modal_ref = wire()
-        ---
-        <Modal ref={modal_ref} title="Hello" />
-    """)
-    
-    parser = PyWireParser()
-    parsed = parser.parse(source, "test.wire")
+def test_component_ref_compilation(parser: PyWireParser, codegen: CodeGenerator) -> None:
+    parsed = parser.parse(_COMPONENT_REF_COMPILATION_SRC, "test.wire")
     
-    generator = CodeGenerator()
-    module_ast = generator.generate(parsed)
+    module_ast = codegen.generate(parsed)
     code = ast.unparse(module_ast)
     
     # Check ref assignment groundwork
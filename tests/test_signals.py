@@ -157,6 +157,34 @@ def test_effect_batching():
     
     assert runs == 2  # Should run once after batch ends
 
+def test_batched_effect_runs_once_when_earlier_effect_writes_its_dep():
+    """An effect flushed by a nested batch must not run again from the outer one."""
+    from pywire.core.signals import start_batch, end_batch
+    a = wire(0)
+    b = wire(0)
+    log = []
+
+    @effect
+    def effect_a():
+        if a.value:
+            log.append("A")
+            b.value = a.value
+
+    @effect
+    def effect_b():
+        seen_b = b.value
+        if a.value:
+            log.append(("B", seen_b))
+
+    start_batch()
+    a.value = 1
+    end_batch()
+
+    # Subscriber order is unspecified, so B may also run first with the old b;
+    # either way it must see the new b exactly once
+    assert log[-1] == ("B", 1)
+    assert log.count(("B", 1)) == 1
+
 def test_cascading_writes_in_effect():
     """Ensure writes inside effects don't cause infinite loops or inconsistent states."""
     a = wire(1)
@@ -184,7 +212,7 @@ def test_circular_derived_raises():
     a_derived = derived(get_b)
     b_derived = derived(lambda: a_derived.value + 1)
     
-    with pytest.raises(CircularDependencyError):
+    with pytest.raises(CircularDependencyError, match="get_b -> <lambda> -> get_b"):
         _ = a_derived.value
 
 def test_write_in_derived_raises():
@@ -1,4 +1,7 @@
+import ast
 import unittest
+from typing import List, Union
+
 from pywire.compiler.parser import PyWireParser
 from pywire.compiler.codegen.template import TemplateCodegen
 from pywire.compiler.ast_nodes import TemplateNode
@@ -7,24 +10,21 @@ class MockCompiler:
     def __init__(self):
         self.scope_id = "test_scope"
 
-import ast
-from typing import Union, List, Any, cast
-
 class TestSlotCodegen(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # generate_render_method resets the codegen's per-run state
+        cls.parser = PyWireParser()
+        cls.codegen = TemplateCodegen()
+
     def normalize_ast(self, node: Union[ast.AST, List[ast.AST]]) -> Union[ast.AST, List[ast.AST]]:
         if isinstance(node, list):
             for n in node:
                 self.normalize_ast(n)
             return node
 
-        for child in ast.walk(node):
-            if not hasattr(child, "lineno"):
-                c = cast(Any, child)
-                c.lineno = 1
-                c.end_lineno = 1
-                c.col_offset = 0
-                c.end_col_offset = 0
-        return node
+        # Fills lineno/col_offset on every node missing them, in one pass
+        return ast.fix_missing_locations(node)
 
     def test_named_slot_registration(self):
         source = """<MyComponent>
@@ -32,9 +32,7 @@ class TestSlotCodegen(unittest.TestCase):
     <template slot="footer">Footer Content</template>
 </MyComponent>
 """
-        parser = PyWireParser()
-        ast = parser.parse(source)
-        codegen = TemplateCodegen()
+        parsed = self.parser.parse(source)
         
         # We need to simulate the environment where MyComponent is a known component
         # TemplateCodegen.generate_render_method generates the _render_template function
@@ -43,13 +41,12 @@ class TestSlotCodegen(unittest.TestCase):
         # lxml lowercases tags, so key must be lowercase
         comp_map = {"mycomponent": "MyComponent"}
         
-        func_def, _ = codegen.generate_render_method(ast.template, component_map=comp_map)
+        func_def, _ = self.codegen.generate_render_method(parsed.template, component_map=comp_map)
         
         # Convert AST to string
-        import ast as python_ast
         self.normalize_ast(func_def)
         
-        code = python_ast.unparse(func_def)
+        code = ast.unparse(func_def)
         
         # Check for slot registration dict passed to component
         # slots={'header': ..., 'footer': ...}
@@ -62,13 +59,10 @@ class TestSlotCodegen(unittest.TestCase):
     <slot name="my-slot">Default Content</slot>
 </div>
 """
-        parser = PyWireParser()
-        ast = parser.parse(source)
-        codegen = TemplateCodegen()
-        func_def, _ = codegen.generate_render_method(ast.template)
-        import ast as python_ast
+        parsed = self.parser.parse(source)
+        func_def, _ = self.codegen.generate_render_method(parsed.template)
         self.normalize_ast(func_def)
-        code = python_ast.unparse(func_def)
+        code = ast.unparse(func_def)
         
         # Logic: render_slot("my-slot", ...)
         self.assertIn('render_slot', code)
@@ -79,13 +73,10 @@ class TestSlotCodegen(unittest.TestCase):
     <slot>Default</slot>
 </div>
 """
-        parser = PyWireParser()
-        ast = parser.parse(source)
-        codegen = TemplateCodegen()
-        func_def, _ = codegen.generate_render_method(ast.template)
-        import ast as python_ast
+        parsed = self.parser.parse(source)
+        func_def, _ = self.codegen.generate_render_method(parsed.template)
         self.normalize_ast(func_def)
-        code = python_ast.unparse(func_def)
+        code = ast.unparse(func_def)
         
         self.assertIn('render_slot', code)
         self.assertIn("'default'", code)
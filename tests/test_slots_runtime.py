@@ -1,15 +1,23 @@
 import asyncio
 import unittest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 from pywire.runtime.page import BasePage
 
 class TestSlotRuntime(unittest.TestCase):
-    def setUp(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        
-    def tearDown(self):
-        self.loop.close()
+    @classmethod
+    def setUpClass(cls):
+        # One loop for the class, without touching the global event loop
+        cls.runner = asyncio.Runner()
+        # Pages only read request.app.state, so a plain namespace will do
+        cls.request = SimpleNamespace(
+            app=SimpleNamespace(
+                state=SimpleNamespace(sibling_paths=[], enable_pjax=False, debug=False)
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.runner.close()
 
     def test_named_slots_rendering(self):
         # 1. Component with named slots
@@ -50,11 +58,10 @@ class TestSlotRuntime(unittest.TestCase):
                 self.register_slot("CARD", "default", self._fill_default)
 
         
-        request = MagicMock()
-        page = Page(request, {}, {})
+        page = Page(self.request, {}, {})
         page._init_slots()
         
-        content = self.loop.run_until_complete(page._render_template())
+        content = self.runner.run(page._render_template())
         self.assertEqual(content, "<card><header>My Header</header><body>My Body</body></card>")
 
     def test_slot_fallback(self):
@@ -72,10 +79,9 @@ class TestSlotRuntime(unittest.TestCase):
                 super()._init_slots() if hasattr(super(), "_init_slots") else None
                 # Don't register default slot
 
-        request = MagicMock()
-        page = Page(request, {}, {})
+        page = Page(self.request, {}, {})
         page._init_slots()
-        content = self.loop.run_until_complete(page._render_template())
+        content = self.runner.run(page._render_template())
         self.assertEqual(content, "<div>Fallback</div>")
 
     def test_head_slot_runtime(self):
@@ -99,11 +105,51 @@ class TestSlotRuntime(unittest.TestCase):
                  super()._init_slots() if hasattr(super(), "_init_slots") else None
                  self.register_head_slot("MAIN", self._fill_head)
                  
-         request = MagicMock()
-         page = Page(request, {}, {})
+         page = Page(self.request, {}, {})
          page._init_slots()
-         content = self.loop.run_until_complete(page._render_template())
+         content = self.runner.run(page._render_template())
          self.assertEqual(content, "<head><meta foo></head>")
+    def test_head_slots_keep_order_with_mixed_renderers(self):
+        class Layout(BasePage):
+            LAYOUT_ID = "MAIN"
+
+        async def slow_head():
+            await asyncio.sleep(0.01)
+            return "<a>"
+
+        async def fast_head():
+            return "<c>"
+
+        page = Layout(self.request, {}, {})
+        page.register_head_slot("MAIN", slow_head)
+        page.register_head_slot("MAIN", lambda: "<b>")
+        page.register_head_slot("CHILD", fast_head)
+
+        content = self.runner.run(
+            page.render_slot("$head", lambda: "<meta>", layout_id="MAIN", append=True)
+        )
+        self.assertEqual(content, "<meta><a><b><c>")
+
+    def test_head_slot_registered_once_per_renderer(self):
+        class Page(BasePage):
+            async def _fill_head(self):
+                return "<meta>"
+
+        page = Page(self.request, {}, {})
+        # Each attribute access creates a new (but equal) bound method
+        page.register_head_slot("MAIN", page._fill_head)
+        page.register_head_slot("MAIN", page._fill_head)
+        self.assertEqual(len(page.head_slots["MAIN"]), 1)
+
+    def test_missing_slot_does_not_create_registry(self):
+        class Card(BasePage):
+            LAYOUT_ID = "CARD_MISS"
+
+        page = Card(self.request, {}, {})
+        content = self.runner.run(page.render_slot("header", lambda: "Fallback"))
+        self.assertEqual(content, "Fallback")
+        self.assertNotIn("CARD_MISS", page.slots)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,11 @@
 from pathlib import Path
+from typing import Iterator
 
+import pytest
 from pywire.runtime.app import PyWire
 from starlette.testclient import TestClient
 
-
-def test_interpolation_ignore_in_script_and_style(tmp_path: Path) -> None:
-    """Verify that {} in script and style tags are treated as literal text."""
-    page_content = """---
+SCRIPT_AND_STYLE_PAGE = """---
 ---
 <div>
     <script>
@@ -20,11 +19,49 @@ def test_interpolation_ignore_in_script_and_style(tmp_path: Path) -> None:
     <p>Real interpolation: {1 + 1}</p>
 </div>
 """
-    (tmp_path / "page.wire").write_text(page_content, encoding="utf-8")
 
-    app = PyWire(str(tmp_path))
-    client = TestClient(app)
+STANDALONE_PAGE = "!path '/standalone'\n--- \n--- \n{ 'hello' }"
+
+MULTI_HANDLER_PAGE = """!path '/multi'
+---
+def fn1(): pass
+def fn2(): pass
+---
+
+<button @click={fn1} @click.stop={fn2}>Click</button>
+"""
+
+REACTIVE_PAGE = """!path '/reactive'
+---
+is_disabled = True
+is_required = False
+label = "Test Label"
+---
+
+<input disabled={is_disabled} required={is_required} aria-label={label}>
+"""
+
 
+@pytest.fixture(scope="module")
+def wire_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Every page lives at its own route, so one app can serve them all
+    pages_dir = tmp_path_factory.mktemp("templating")
+    (pages_dir / "page.wire").write_text(SCRIPT_AND_STYLE_PAGE, encoding="utf-8")
+    (pages_dir / "standalone.wire").write_text(STANDALONE_PAGE, encoding="utf-8")
+    (pages_dir / "multi.wire").write_text(MULTI_HANDLER_PAGE.strip(), encoding="utf-8")
+    (pages_dir / "reactive.wire").write_text(REACTIVE_PAGE.strip(), encoding="utf-8")
+    return pages_dir
+
+
+@pytest.fixture(scope="module")
+def client(wire_dir: Path) -> Iterator[TestClient]:
+    app = PyWire(str(wire_dir))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_interpolation_ignore_in_script_and_style(client: TestClient) -> None:
+    """Verify that {} in script and style tags are treated as literal text."""
     response = client.get("/page")
     assert response.status_code == 200
     content = response.text
@@ -34,49 +71,22 @@ def test_interpolation_ignore_in_script_and_style(tmp_path: Path) -> None:
     assert "<p>Real interpolation: 2</p>" in content
 
 
-def test_interpolation_node_explicit_render(tmp_path: Path) -> None:
+def test_interpolation_node_explicit_render(client: TestClient) -> None:
     """Cover the InterpolationNode logic in TemplateCodegen (fallback logic)."""
-    page_content = "!path '/standalone'\n--- \n--- \n{ 'hello' }"
-    (tmp_path / "standalone.wire").write_text(page_content, encoding="utf-8")
-    app = PyWire(str(tmp_path))
-    client = TestClient(app)
     response = client.get("/standalone")
     assert "hello" in response.text
 
 
-def test_multiple_event_handlers(tmp_path: Path) -> None:
+def test_multiple_event_handlers(client: TestClient) -> None:
     """Cover multiple event handler logic in template codegen."""
-    page_content = """!path '/multi'
----
-def fn1(): pass
-def fn2(): pass
----
-
-<button @click={fn1} @click.stop={fn2}>Click</button>
-"""
-    (tmp_path / "multi.wire").write_text(page_content.strip(), encoding="utf-8")
-    app = PyWire(str(tmp_path))
-    client = TestClient(app)
     response = client.get("/multi")
     assert response.status_code == 200
     assert "fn1" in response.text
     assert "fn2" in response.text
 
 
-def test_reactive_attributes(tmp_path: Path) -> None:
+def test_reactive_attributes(client: TestClient) -> None:
     """Cover reactive attribute and boolean logic in template codegen."""
-    page_content = """!path '/reactive'
----
-is_disabled = True
-is_required = False
-label = "Test Label"
----
-
-<input disabled={is_disabled} required={is_required} aria-label={label}>
-"""
-    (tmp_path / "reactive.wire").write_text(page_content.strip(), encoding="utf-8")
-    app = PyWire(str(tmp_path))
-    client = TestClient(app)
     response = client.get("/reactive")
     assert response.status_code == 200
     assert "disabled" in response.text
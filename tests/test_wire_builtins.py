@@ -117,3 +117,29 @@ def test_wire_set_builtins():
 def test_wire_primitive_format():
     price = wire(19.99)
     assert f"Price: {price:.1f}" == "Price: 20.0"
+
+def test_noop_collection_mutations_do_not_notify():
+    items = wire([1])
+    mapping = wire({"a": 1})
+    tags = wire({1, 2})
+    runs = 0
+
+    @effect
+    def _():
+        nonlocal runs
+        runs += 1
+        _ = (len(items), len(mapping), len(tags))
+
+    assert runs == 1
+    items.extend([])
+    mapping.pop("missing")
+    tags.update({1})
+    tags.difference_update({3})
+    tags.intersection_update({1, 2})
+    assert runs == 1
+
+    items.clear()
+    items.clear()
+    mapping.pop("a")
+    tags.update({3})
+    assert runs == 4
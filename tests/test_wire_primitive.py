@@ -1,28 +1,73 @@
 import ast
 import asyncio
 import pytest
+from pathlib import Path
 from textwrap import dedent
 from pywire.compiler.parser import PyWireParser
 from pywire.compiler.codegen.generator import CodeGenerator
 from pywire.runtime.loader import PageLoader
 
-def test_wire_primitive_compilation():
-    source = dedent("""
-        ---
-        count = wire(0)
-        ---
-
-        <div>
-            Count: {count}
-            <button @click={count += 1}>Inc</button>
-        </div>
-    """)
+_WIRE_PRIMITIVE_COMPILATION_SRC = dedent(
+    """
+    ---
+    count = wire(0)
+    ---
+
+    <div>
+        Count: {count}
+        <button @click={count += 1}>Inc</button>
+    </div>
+    """
+)
+
+_WIRE_STRING_HANDLING_SRC = dedent(
+    """
+    ---
+    text = wire("$100")
+    dummy = "$not_a_var"
+    ---
+
+    <div>
+        Text: {text}
+    </div>
+    """
+)
+
+_WIRE_AUTO_UNWRAP_IN_TEMPLATE_SRC = dedent(
+    """
+    ---
+    count = wire(0)
+    user = wire(name="Alice")
+    ---
+
+    <div>
+        <p>Count: {count}</p>
+        <p>User: {user}</p>
+    </div>
+    """
+)
+
+_WIRE_REGION_UPDATES_SRC = dedent(
+    """
+    ---
+    count = wire(0)
+
+    def increment():
+        self.count += 1
+    ---
+
+    <div>
+        <p>Count: {count}</p>
+        <button @click={increment}>Inc</button>
+    </div>
+    """
+)
+
+
+def test_wire_primitive_compilation(parser: PyWireParser, codegen: CodeGenerator) -> None:
+    parsed = parser.parse(_WIRE_PRIMITIVE_COMPILATION_SRC, "test.pywire")
     
-    parser = PyWireParser()
-    parsed = parser.parse(source, "test.pywire")
-    
-    generator = CodeGenerator()
-    module_ast = generator.generate(parsed)
+    module_ast = codegen.generate(parsed)
     code = ast.unparse(module_ast)
     
     print("\nGenerated Code:\n", code)
@@ -45,24 +90,11 @@ def test_wire_primitive_compilation():
     # Should be called in __init__, not just INIT_HOOKS
     assert "self.__top_level_init__()" in code
 
-def test_wire_string_handling():
+def test_wire_string_handling(parser: PyWireParser, codegen: CodeGenerator) -> None:
     """Ensure $ inside strings is NOT replaced."""
-    source = dedent("""
-        ---
-        text = wire("$100")
-        dummy = "$not_a_var"
-        ---
-
-        <div>
-            Text: {text}
-        </div>
-    """)
-    
-    parser = PyWireParser()
-    parsed = parser.parse(source, "test.pywire")
+    parsed = parser.parse(_WIRE_STRING_HANDLING_SRC, "test.pywire")
     
-    generator = CodeGenerator()
-    module_ast = generator.generate(parsed)
+    module_ast = codegen.generate(parsed)
     code = ast.unparse(module_ast)
     
     print("\nGenerated Code String:\n", code)
@@ -77,25 +109,22 @@ def test_wire_string_handling():
     assert "unwrap_wire(self.text)" in code
 
 
-def test_wire_auto_unwrap_in_template(tmp_path) -> None:
-    source = dedent(
-        """
-        ---
-        count = wire(0)
-        user = wire(name="Alice")
-        ---
+def test_literal_interpolation_not_unwrapped(
+    parser: PyWireParser, codegen: CodeGenerator
+) -> None:
+    source = '<p>{"x"} {f"a{count}"}</p>'
+    code = ast.unparse(codegen.generate(parser.parse(source, "test.pywire")))
 
-        <div>
-            <p>Count: {count}</p>
-            <p>User: {user}</p>
-        </div>
-        """
-    )
-    file_path = tmp_path / "page.wire"
-    file_path.write_text(source)
+    assert "escape_html('x')" in code
+    assert "escape_html(f'a{" in code
+    assert "unwrap_wire('x')" not in code
 
+
+def test_wire_auto_unwrap_in_template() -> None:
     loader = PageLoader()
-    page_class = loader.load(file_path)
+    page_class = loader.load_source(
+        _WIRE_AUTO_UNWRAP_IN_TEMPLATE_SRC, Path("page.wire")
+    )
     from types import SimpleNamespace
 
     request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(
@@ -108,27 +137,9 @@ def test_wire_auto_unwrap_in_template(tmp_path) -> None:
     assert "User: {'name': 'Alice'}" in html
 
 
-def test_wire_region_updates(tmp_path) -> None:
-    source = dedent(
-        """
-        ---
-        count = wire(0)
-
-        def increment():
-            self.count += 1
-        ---
-
-        <div>
-            <p>Count: {count}</p>
-            <button @click={increment}>Inc</button>
-        </div>
-        """
-    )
-    file_path = tmp_path / "page.wire"
-    file_path.write_text(source)
-
+def test_wire_region_updates() -> None:
     loader = PageLoader()
-    page_class = loader.load(file_path)
+    page_class = loader.load_source(_WIRE_REGION_UPDATES_SRC, Path("page.wire"))
     from types import SimpleNamespace
 
     request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(